@@ -0,0 +1,75 @@
+"""create_user_bids_tables
+
+Revision ID: 4e8b2c1d9f3a
+Revises: 1b3c347810ce
+Create Date: 2026-10-18 09:12:41.518203
+
+"""
+
+import contextlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+from alembic import op
+from core.config import settings
+
+# revision identifiers, used by Alembic.
+revision: str = '4e8b2c1d9f3a'
+down_revision: str | Sequence[str] | None = '1b3c347810ce'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'user_bids',
+        sa.Column('id', sa.BigInteger, primary_key=True, autoincrement=True),
+        sa.Column('vehicle_id', sa.Integer, nullable=False),
+        sa.Column('auction_id', sa.Integer, nullable=False),
+        sa.Column('user_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('amount', sa.Integer, nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        schema=settings.postgres.POSTGRES_SCHEMA,
+    )
+
+    op.create_index(
+        'ix_user_bids_vehicle_id_created_at',
+        'user_bids',
+        ['vehicle_id', sa.text('created_at DESC')],
+        schema=settings.postgres.POSTGRES_SCHEMA,
+    )
+
+    op.create_index(
+        'ix_user_bids_user_id',
+        'user_bids',
+        ['user_id'],
+        schema=settings.postgres.POSTGRES_SCHEMA,
+    )
+
+    # One row per vehicle holding its highest bid, concurrent bids on a vehicle are serialized on this row
+    op.create_table(
+        'vehicle_current_bids',
+        sa.Column('vehicle_id', sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column('auction_id', sa.Integer, nullable=False),
+        sa.Column('user_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('amount', sa.Integer, nullable=False),
+        sa.Column('bid_count', sa.Integer, nullable=False, server_default='1'),
+        sa.Column('last_bid_at', sa.DateTime(timezone=True), nullable=False),
+        schema=settings.postgres.POSTGRES_SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with contextlib.suppress(Exception):
+        op.drop_table('vehicle_current_bids', schema=settings.postgres.POSTGRES_SCHEMA)
+
+    with contextlib.suppress(Exception):
+        op.drop_index('ix_user_bids_user_id', 'user_bids', schema=settings.postgres.POSTGRES_SCHEMA)
+        op.drop_index('ix_user_bids_vehicle_id_created_at', 'user_bids', schema=settings.postgres.POSTGRES_SCHEMA)
+
+    with contextlib.suppress(Exception):
+        op.drop_table('user_bids', schema=settings.postgres.POSTGRES_SCHEMA)
@@ -0,0 +1,59 @@
+"""add_auctions_closed_at
+
+Revision ID: c5e27a4f8d16
+Revises: 4e8b2c1d9f3a
+Create Date: 2026-10-18 11:21:05.847160
+
+"""
+
+import contextlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e27a4f8d16'
+down_revision: str | Sequence[str] | None = '4e8b2c1d9f3a'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'auctions',
+        sa.Column('closed_at', sa.DateTime(timezone=True), nullable=True),
+        schema=settings.postgres.POSTGRES_SCHEMA,
+    )
+
+    # Auctions the lifecycle scheduler still has to close
+    op.create_index(
+        'ix_auctions_open_end_datetime',
+        'auctions',
+        ['end_datetime'],
+        postgresql_where=sa.text('closed_at IS NULL'),
+        schema=settings.postgres.POSTGRES_SCHEMA,
+    )
+
+    # Batch deactivation of the vehicles of a closed auction
+    op.create_index(
+        'ix_vehicles_auction_id_active',
+        'auction_vehicles',
+        ['auction_id'],
+        postgresql_where=sa.text('active'),
+        schema=settings.postgres.POSTGRES_SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with contextlib.suppress(Exception):
+        op.drop_index('ix_vehicles_auction_id_active', 'auction_vehicles', schema=settings.postgres.POSTGRES_SCHEMA)
+        op.drop_index('ix_auctions_open_end_datetime', 'auctions', schema=settings.postgres.POSTGRES_SCHEMA)
+
+    with contextlib.suppress(Exception):
+        op.drop_column('auctions', 'closed_at', schema=settings.postgres.POSTGRES_SCHEMA)
@@ -0,0 +1,43 @@
+"""add_version_columns
+
+Revision ID: d83f1a6c2e40
+Revises: c5e27a4f8d16
+Create Date: 2026-10-18 12:04:37.512903
+
+"""
+
+import contextlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd83f1a6c2e40'
+down_revision: str | Sequence[str] | None = 'c5e27a4f8d16'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Tables updated through optimistic concurrency, the version is bumped by every update
+VERSIONED_TABLES = ['auction_vehicles', 'vehicle_manufacturers', 'vehicle_models', 'users']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in VERSIONED_TABLES:
+        # A constant default only touches the catalog, existing rows are not rewritten
+        op.add_column(
+            table,
+            sa.Column('version', sa.Integer(), server_default='1', nullable=False),
+            schema=settings.postgres.POSTGRES_SCHEMA,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in VERSIONED_TABLES:
+        with contextlib.suppress(Exception):
+            op.drop_column(table, 'version', schema=settings.postgres.POSTGRES_SCHEMA)
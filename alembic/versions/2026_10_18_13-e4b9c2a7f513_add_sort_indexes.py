@@ -0,0 +1,44 @@
+"""add_sort_indexes
+
+Revision ID: e4b9c2a7f513
+Revises: d83f1a6c2e40
+Create Date: 2026-10-18 13:12:48.204617
+
+"""
+
+import contextlib
+from collections.abc import Sequence
+
+from alembic import op
+from core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b9c2a7f513'
+down_revision: str | Sequence[str] | None = 'd83f1a6c2e40'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# One index per list order with its id tiebreak, scanned forward or backward for ascending and descending orders.
+# Vehicle lists are always scoped to an auction, so auction_id leads.
+SORT_INDEXES = {
+    'ix_vehicles_auction_id_start_price_id': ('auction_vehicles', ['auction_id', 'start_price', 'id']),
+    'ix_vehicles_auction_id_mileage_id': ('auction_vehicles', ['auction_id', 'mileage', 'id']),
+    'ix_vehicles_auction_id_manufacturing_date_id': ('auction_vehicles', ['auction_id', 'manufacturing_date', 'id']),
+    'ix_vehicles_auction_id_updated_at_id': ('auction_vehicles', ['auction_id', 'updated_at', 'id']),
+    'ix_auctions_end_datetime_id': ('auctions', ['end_datetime', 'id']),
+    'ix_auctions_created_at_id': ('auctions', ['created_at', 'id']),
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index_name, (table, columns) in SORT_INDEXES.items():
+        op.create_index(index_name, table, columns, schema=settings.postgres.POSTGRES_SCHEMA)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index_name, (table, _) in SORT_INDEXES.items():
+        with contextlib.suppress(Exception):
+            op.drop_index(index_name, table, schema=settings.postgres.POSTGRES_SCHEMA)
@@ -0,0 +1,81 @@
+"""add_vehicle_search_vector
+
+Revision ID: f2a8d61c9b37
+Revises: e4b9c2a7f513
+Create Date: 2026-10-18 14:21:05.718342
+
+"""
+
+import contextlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+from core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2a8d61c9b37'
+down_revision: str | Sequence[str] | None = 'e4b9c2a7f513'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SCHEMA = settings.postgres.POSTGRES_SCHEMA
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('auction_vehicles', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True), schema=SCHEMA)
+
+    # Catalog names and synonyms weigh most, then equipment, then the description. The 'simple' configuration does
+    # not stem, vehicles are described in the languages of every auction country. Catalog renames are refreshed on
+    # the vehicles by the API in the background, see CatalogSearchRefresher.
+    op.execute(
+        f"""
+        CREATE FUNCTION {SCHEMA}.auction_vehicles_search_vector() RETURNS trigger AS $$
+        BEGIN
+            NEW.search_vector :=
+                setweight(to_tsvector('simple', coalesce((
+                    SELECT concat_ws(' ', name, array_to_string(synonyms, ' '))
+                    FROM {SCHEMA}.vehicle_manufacturers WHERE id = NEW.manufacturer_id
+                ), '')), 'A')
+                || setweight(to_tsvector('simple', coalesce((
+                    SELECT concat_ws(' ', name, array_to_string(synonyms, ' '))
+                    FROM {SCHEMA}.vehicle_models WHERE id = NEW.model_id
+                ), '')), 'A')
+                || setweight(to_tsvector('simple', coalesce(array_to_string(NEW.equipment, ' '), '')), 'B')
+                || setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'C');
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER auction_vehicles_search_vector
+        BEFORE INSERT OR UPDATE OF manufacturer_id, model_id, equipment, description ON {SCHEMA}.auction_vehicles
+        FOR EACH ROW EXECUTE FUNCTION {SCHEMA}.auction_vehicles_search_vector()
+        """
+    )
+
+    # Fires the trigger on every existing vehicle
+    op.execute(f"UPDATE {SCHEMA}.auction_vehicles SET description = description")
+
+    op.create_index(
+        'ix_vehicles_search_vector',
+        'auction_vehicles',
+        ['search_vector'],
+        postgresql_using='gin',
+        schema=SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with contextlib.suppress(Exception):
+        op.drop_index('ix_vehicles_search_vector', 'auction_vehicles', schema=SCHEMA)
+        op.execute(f"DROP TRIGGER IF EXISTS auction_vehicles_search_vector ON {SCHEMA}.auction_vehicles")
+        op.execute(f"DROP FUNCTION IF EXISTS {SCHEMA}.auction_vehicles_search_vector()")
+        op.drop_column('auction_vehicles', 'search_vector', schema=SCHEMA)
@@ -0,0 +1,38 @@
+"""add_vehicle_equipment_index
+
+Revision ID: a7c3e19d4b62
+Revises: f2a8d61c9b37
+Create Date: 2026-10-18 15:04:37.512894
+
+"""
+
+import contextlib
+from collections.abc import Sequence
+
+from alembic import op
+from core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e19d4b62'
+down_revision: str | Sequence[str] | None = 'f2a8d61c9b37'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Serves the contains-all (@>) and contains-any (&&) equipment filters
+    op.create_index(
+        'ix_vehicles_equipment',
+        'auction_vehicles',
+        ['equipment'],
+        postgresql_using='gin',
+        schema=settings.postgres.POSTGRES_SCHEMA,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with contextlib.suppress(Exception):
+        op.drop_index('ix_vehicles_equipment', 'auction_vehicles', schema=settings.postgres.POSTGRES_SCHEMA)
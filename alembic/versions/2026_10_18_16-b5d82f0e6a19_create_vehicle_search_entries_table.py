@@ -0,0 +1,200 @@
+"""create_vehicle_search_entries_table
+
+Revision ID: b5d82f0e6a19
+Revises: a7c3e19d4b62
+Create Date: 2026-10-18 16:02:51.309476
+
+"""
+
+import contextlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+from core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5d82f0e6a19'
+down_revision: str | Sequence[str] | None = 'a7c3e19d4b62'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SCHEMA = settings.postgres.POSTGRES_SCHEMA
+
+# Columns copied from the vehicle under the same name
+VEHICLE_COLUMNS = (
+    'id',
+    'auction_id',
+    'manufacturer_id',
+    'model_id',
+    'manufacturing_date',
+    'mileage',
+    'transmission',
+    'body_type',
+    'color',
+    'engine_power',
+    'engine_cc',
+    'start_price',
+    'active',
+    'is_damaged',
+    'equipment',
+    'search_vector',
+    'updated_at',
+)
+ENTRY_COLUMNS = (*VEHICLE_COLUMNS, 'auction_country', 'manufacturer_name', 'model_name')
+
+# Entries of the vehicles of a relation aliased v, only the vehicles of open auctions have one
+SELECT_ENTRIES = f"""
+    SELECT {', '.join(f'v.{column}' for column in VEHICLE_COLUMNS)},
+        a.country, manufacturer.name, model.name
+    FROM {{vehicles}} v
+    JOIN {SCHEMA}.auctions a ON a.id = v.auction_id AND a.closed_at IS NULL
+    JOIN {SCHEMA}.vehicle_manufacturers manufacturer ON manufacturer.id = v.manufacturer_id
+    JOIN {SCHEMA}.vehicle_models model ON model.id = v.model_id
+"""
+INSERT_ENTRIES = f"INSERT INTO {SCHEMA}.vehicle_search_entries ({', '.join(ENTRY_COLUMNS)}) {SELECT_ENTRIES}"
+
+# Every list order with its id tiebreak, and the columns filtered on. The auction end order walks the auctions on
+# ix_auctions_end_datetime_id and the entries of each one by id, the same index serves the syncs by auction.
+INDEXES = {
+    'ix_vehicle_search_start_price_id': ['start_price', 'id'],
+    'ix_vehicle_search_mileage_id': ['mileage', 'id'],
+    'ix_vehicle_search_manufacturing_date_id': ['manufacturing_date', 'id'],
+    'ix_vehicle_search_updated_at_id': ['updated_at', 'id'],
+    'ix_vehicle_search_manufacturer_id': ['manufacturer_id'],
+    'ix_vehicle_search_model_id': ['model_id'],
+    'ix_vehicle_search_auction_id_id': ['auction_id', 'id'],
+}
+GIN_INDEXES = {
+    'ix_vehicle_search_search_vector': ['search_vector'],
+    'ix_vehicle_search_equipment': ['equipment'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'vehicle_search_entries',
+        sa.Column('id', sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column('auction_id', sa.Integer, nullable=False),
+        sa.Column('auction_country', sa.String(2), nullable=False),
+        sa.Column('manufacturer_id', sa.Integer, nullable=False),
+        sa.Column('manufacturer_name', sa.String(255), nullable=False),
+        sa.Column('model_id', sa.Integer, nullable=False),
+        sa.Column('model_name', sa.String(255), nullable=False),
+        sa.Column('manufacturing_date', sa.Date, nullable=False),
+        sa.Column('mileage', sa.Integer, nullable=False),
+        sa.Column('transmission', sa.String(255), nullable=False),
+        sa.Column('body_type', sa.String(255), nullable=True),
+        sa.Column('color', sa.String(255), nullable=True),
+        sa.Column('engine_power', sa.Integer, nullable=False),
+        sa.Column('engine_cc', sa.Integer, nullable=False),
+        sa.Column('start_price', sa.Integer, nullable=False),
+        sa.Column('active', sa.Boolean, nullable=False),
+        sa.Column('is_damaged', sa.Boolean, nullable=False),
+        sa.Column('equipment', postgresql.ARRAY(sa.String), nullable=True),
+        sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        schema=SCHEMA,
+    )
+
+    # Vehicle writes are synced once per statement from their transition table, so a bulk ingest or update runs
+    # one join instead of one per row. Catalog renames reach the entries through the update of their vehicles by
+    # the catalog search refresh.
+    op.execute(
+        f"""
+        CREATE FUNCTION {SCHEMA}.vehicle_search_entries_upsert() RETURNS trigger AS $$
+        BEGIN
+            -- Vehicles moved to a closed auction leave the search
+            DELETE FROM {SCHEMA}.vehicle_search_entries e
+            USING changed_vehicles v
+            WHERE e.id = v.id
+                AND NOT EXISTS (SELECT 1 FROM {SCHEMA}.auctions a WHERE a.id = v.auction_id AND a.closed_at IS NULL);
+
+            {INSERT_ENTRIES.format(vehicles='changed_vehicles')}
+            ON CONFLICT (id) DO UPDATE SET
+                {', '.join(f'{column} = EXCLUDED.{column}' for column in ENTRY_COLUMNS if column != 'id')};
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for event in ('INSERT', 'UPDATE'):
+        op.execute(
+            f"""
+            CREATE TRIGGER auction_vehicles_search_entries_{event.lower()}
+            AFTER {event} ON {SCHEMA}.auction_vehicles
+            REFERENCING NEW TABLE AS changed_vehicles
+            FOR EACH STATEMENT EXECUTE FUNCTION {SCHEMA}.vehicle_search_entries_upsert()
+            """
+        )
+
+    op.execute(
+        f"""
+        CREATE FUNCTION {SCHEMA}.vehicle_search_entries_delete() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM {SCHEMA}.vehicle_search_entries WHERE id IN (SELECT id FROM deleted_vehicles);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER auction_vehicles_search_entries_delete
+        AFTER DELETE ON {SCHEMA}.auction_vehicles
+        REFERENCING OLD TABLE AS deleted_vehicles
+        FOR EACH STATEMENT EXECUTE FUNCTION {SCHEMA}.vehicle_search_entries_delete()
+        """
+    )
+
+    # Closing or deleting an auction drops its vehicles from the search, reopening it adds them back. The auction end
+    # is not copied: soft-close extensions move it with every late bid, each move would rewrite all the entries of
+    # the auction through their indexes.
+    op.execute(
+        f"""
+        CREATE FUNCTION {SCHEMA}.auctions_search_entries_refresh() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP = 'DELETE' OR NEW.closed_at IS NOT NULL THEN
+                DELETE FROM {SCHEMA}.vehicle_search_entries WHERE auction_id = OLD.id;
+            ELSIF OLD.closed_at IS NOT NULL THEN
+                {INSERT_ENTRIES.format(vehicles=f'{SCHEMA}.auction_vehicles')}
+                WHERE v.auction_id = NEW.id
+                ON CONFLICT (id) DO NOTHING;
+            ELSE
+                UPDATE {SCHEMA}.vehicle_search_entries SET auction_country = NEW.country WHERE auction_id = NEW.id;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER auctions_search_entries_refresh
+        AFTER UPDATE OF country, closed_at OR DELETE ON {SCHEMA}.auctions
+        FOR EACH ROW EXECUTE FUNCTION {SCHEMA}.auctions_search_entries_refresh()
+        """
+    )
+
+    op.execute(INSERT_ENTRIES.format(vehicles=f'{SCHEMA}.auction_vehicles'))
+
+    for index_name, columns in INDEXES.items():
+        op.create_index(index_name, 'vehicle_search_entries', columns, schema=SCHEMA)
+    for index_name, columns in GIN_INDEXES.items():
+        op.create_index(index_name, 'vehicle_search_entries', columns, postgresql_using='gin', schema=SCHEMA)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with contextlib.suppress(Exception):
+        op.execute(f"DROP TRIGGER IF EXISTS auctions_search_entries_refresh ON {SCHEMA}.auctions")
+        op.execute(f"DROP FUNCTION IF EXISTS {SCHEMA}.auctions_search_entries_refresh()")
+        for trigger in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS auction_vehicles_search_entries_{trigger} ON {SCHEMA}.auction_vehicles")
+        op.execute(f"DROP FUNCTION IF EXISTS {SCHEMA}.vehicle_search_entries_delete()")
+        op.execute(f"DROP FUNCTION IF EXISTS {SCHEMA}.vehicle_search_entries_upsert()")
+        op.drop_table('vehicle_search_entries', schema=SCHEMA)
@@ -0,0 +1,178 @@
+"""create_vehicle_vin_history_table
+
+Revision ID: c9e41a7b3d58
+Revises: b5d82f0e6a19
+Create Date: 2026-10-18 17:11:26.845093
+
+"""
+
+import contextlib
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e41a7b3d58'
+down_revision: str | Sequence[str] | None = 'b5d82f0e6a19'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SCHEMA = settings.postgres.POSTGRES_SCHEMA
+
+# Appearance columns refreshed on every write of the vehicle, the result is only written when its auction closes
+APPEARANCE_COLUMNS = (
+    'vin',
+    'auction_id',
+    'auction_country',
+    'manufacturer_name',
+    'model_name',
+    'mileage',
+    'start_price',
+)
+RESULT_COLUMNS = ('closed_at', 'final_bid', 'bid_count')
+
+# Appearances of the vehicles of a relation aliased v, with the result of the closed auctions
+INSERT_APPEARANCES = f"""
+    INSERT INTO {SCHEMA}.vehicle_vin_history (vehicle_id, {', '.join(APPEARANCE_COLUMNS + RESULT_COLUMNS)})
+    SELECT v.id, v.vin, v.auction_id, a.country, manufacturer.name, model.name, v.mileage,
+        v.start_price, a.closed_at,
+        CASE WHEN a.closed_at IS NOT NULL THEN bid.amount END,
+        CASE WHEN a.closed_at IS NOT NULL THEN coalesce(bid.bid_count, 0) ELSE 0 END
+    FROM {{vehicles}} v
+    JOIN {SCHEMA}.auctions a ON a.id = v.auction_id
+    JOIN {SCHEMA}.vehicle_manufacturers manufacturer ON manufacturer.id = v.manufacturer_id
+    JOIN {SCHEMA}.vehicle_models model ON model.id = v.model_id
+    LEFT JOIN {SCHEMA}.vehicle_current_bids bid ON bid.vehicle_id = v.id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # A car sold in an auction may reappear in a later one
+    op.drop_constraint('auction_vehicles_vin_key', 'auction_vehicles', type_='unique', schema=SCHEMA)
+    op.create_unique_constraint(
+        'uq_auction_vehicles_auction_id_vin',
+        'auction_vehicles',
+        ['auction_id', 'vin'],
+        schema=SCHEMA,
+    )
+
+    op.create_table(
+        'vehicle_vin_history',
+        sa.Column('vehicle_id', sa.Integer, primary_key=True, autoincrement=False),
+        sa.Column('vin', sa.String(17), nullable=False),
+        sa.Column('auction_id', sa.Integer, nullable=False),
+        sa.Column('auction_country', sa.String(2), nullable=False),
+        sa.Column('manufacturer_name', sa.String(255), nullable=False),
+        sa.Column('model_name', sa.String(255), nullable=False),
+        sa.Column('mileage', sa.Integer, nullable=False),
+        sa.Column('start_price', sa.Integer, nullable=False),
+        sa.Column('closed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('final_bid', sa.Integer, nullable=True),
+        sa.Column('bid_count', sa.Integer, nullable=False, server_default='0'),
+        schema=SCHEMA,
+    )
+
+    # Vehicle writes are synced once per statement from their transition table, like the search entries
+    op.execute(
+        f"""
+        CREATE FUNCTION {SCHEMA}.vehicle_vin_history_upsert() RETURNS trigger AS $$
+        BEGIN
+            {INSERT_APPEARANCES.format(vehicles='changed_vehicles')}
+            ON CONFLICT (vehicle_id) DO UPDATE SET
+                {', '.join(f'{column} = EXCLUDED.{column}' for column in APPEARANCE_COLUMNS)};
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for event in ('INSERT', 'UPDATE'):
+        op.execute(
+            f"""
+            CREATE TRIGGER auction_vehicles_vin_history_{event.lower()}
+            AFTER {event} ON {SCHEMA}.auction_vehicles
+            REFERENCING NEW TABLE AS changed_vehicles
+            FOR EACH STATEMENT EXECUTE FUNCTION {SCHEMA}.vehicle_vin_history_upsert()
+            """
+        )
+
+    op.execute(
+        f"""
+        CREATE FUNCTION {SCHEMA}.vehicle_vin_history_delete() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM {SCHEMA}.vehicle_vin_history WHERE vehicle_id IN (SELECT id FROM deleted_vehicles);
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER auction_vehicles_vin_history_delete
+        AFTER DELETE ON {SCHEMA}.auction_vehicles
+        REFERENCING OLD TABLE AS deleted_vehicles
+        FOR EACH STATEMENT EXECUTE FUNCTION {SCHEMA}.vehicle_vin_history_delete()
+        """
+    )
+
+    # Closing an auction records the highest bid of each vehicle as its result, reopening it clears the results. The
+    # auction end is not copied: soft-close extensions move it with every late bid, lookups read it from the auction.
+    op.execute(
+        f"""
+        CREATE FUNCTION {SCHEMA}.auctions_vin_history_refresh() RETURNS trigger AS $$
+        BEGIN
+            UPDATE {SCHEMA}.vehicle_vin_history h
+            SET auction_country = NEW.country,
+                closed_at = NEW.closed_at,
+                (final_bid, bid_count) = (
+                    SELECT bid.amount, coalesce(bid.bid_count, 0)
+                    FROM (SELECT 1) vehicle
+                    LEFT JOIN {SCHEMA}.vehicle_current_bids bid
+                        ON bid.vehicle_id = h.vehicle_id AND NEW.closed_at IS NOT NULL
+                )
+            WHERE h.auction_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        f"""
+        CREATE TRIGGER auctions_vin_history_refresh
+        AFTER UPDATE OF country, closed_at ON {SCHEMA}.auctions
+        FOR EACH ROW
+        WHEN (OLD.closed_at IS DISTINCT FROM NEW.closed_at OR OLD.country IS DISTINCT FROM NEW.country)
+        EXECUTE FUNCTION {SCHEMA}.auctions_vin_history_refresh()
+        """
+    )
+
+    op.execute(INSERT_APPEARANCES.format(vehicles=f'{SCHEMA}.auction_vehicles'))
+
+    # Serves exact VINs and VIN prefixes whatever the database collation, a VIN only has a few appearances to order
+    op.create_index(
+        'ix_vehicle_vin_history_vin',
+        'vehicle_vin_history',
+        [sa.text('vin varchar_pattern_ops')],
+        schema=SCHEMA,
+    )
+    op.create_index('ix_vehicle_vin_history_auction_id', 'vehicle_vin_history', ['auction_id'], schema=SCHEMA)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with contextlib.suppress(Exception):
+        op.execute(f"DROP TRIGGER IF EXISTS auctions_vin_history_refresh ON {SCHEMA}.auctions")
+        op.execute(f"DROP FUNCTION IF EXISTS {SCHEMA}.auctions_vin_history_refresh()")
+        for trigger in ('insert', 'update', 'delete'):
+            op.execute(f"DROP TRIGGER IF EXISTS auction_vehicles_vin_history_{trigger} ON {SCHEMA}.auction_vehicles")
+        op.execute(f"DROP FUNCTION IF EXISTS {SCHEMA}.vehicle_vin_history_delete()")
+        op.execute(f"DROP FUNCTION IF EXISTS {SCHEMA}.vehicle_vin_history_upsert()")
+        op.drop_table('vehicle_vin_history', schema=SCHEMA)
+
+    # Fails when a VIN appears in several auctions, those vehicles have to be removed first
+    op.drop_constraint('uq_auction_vehicles_auction_id_vin', 'auction_vehicles', type_='unique', schema=SCHEMA)
+    op.create_unique_constraint('auction_vehicles_vin_key', 'auction_vehicles', ['vin'], schema=SCHEMA)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Bid burst benchmark
+
+Simulates the final minutes of an auction: many concurrent bidders outbidding each other on a handful of hot
+vehicles through `POST /api/v1/auction-vehicles/{vehicle_id}/bids`. It reports latency percentiles, throughput
+and database queries per request for accepted and rejected bids, then verifies that every vehicle's bid
+history is strictly increasing and matches its current bid.
+
+Usage:
+    python -m benchmarks.bid_load_test                              # 20 hot vehicles, 200 bidders, 30s
+    python -m benchmarks.bid_load_test --vehicles 5 --bidders 500 --duration 60
+
+Options:
+    --vehicles          Number of hot vehicles bid on (default: 20)
+    --bidders           Number of concurrent bidders (default: 200)
+    --duration          Benchmark duration in seconds (default: 30)
+
+Vehicles are picked from active vehicles of auctions that have not ended yet, seed the database with
+`python -m benchmarks.load_test --seed` first. The run exits with a non-zero status when the bid history is
+inconsistent.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import uuid
+from collections import defaultdict
+
+import httpx
+from sqlalchemy import func, select
+
+from core.config import settings
+from core.logging import configure_logging, logger
+from repositories.models import Auction, AuctionVehicle, UserBid, VehicleCurrentBid
+
+from .load_test import ScenarioResult, _query_counter
+
+
+class BidBenchmark:
+    def __init__(self, num_vehicles: int, bidders: int, duration: float):
+        self.num_vehicles = num_vehicles
+        self.bidders = bidders
+        self.duration = duration
+        self.results: dict[str, ScenarioResult] = defaultdict(ScenarioResult)
+        # Highest price every bidder has seen so far, shared like a live price feed
+        self.known_prices: dict[int, int] = {}
+
+    async def load_vehicles(self, app) -> None:
+        query = (
+            select(AuctionVehicle.id, func.coalesce(VehicleCurrentBid.amount, AuctionVehicle.start_price))
+            .join(Auction, Auction.id == AuctionVehicle.auction_id)
+            .outerjoin(VehicleCurrentBid, VehicleCurrentBid.vehicle_id == AuctionVehicle.id)
+            .where(AuctionVehicle.active.is_(True), Auction.end_datetime > func.now())
+            .order_by(func.random())
+            .limit(self.num_vehicles)
+        )
+
+        async with app.container.db().session_factory() as session:
+            self.known_prices = dict((await session.execute(query)).all())
+
+        if not self.known_prices:
+            raise RuntimeError("No open auctions found, seed the database with `benchmarks.load_test --seed` first.")
+
+    async def run(self, app) -> float:
+        await self.load_vehicles(app)
+        transport = httpx.ASGITransport(app=app)
+
+        logger.info(f"Bidding on {len(self.known_prices)} vehicles with {self.bidders} bidders for {self.duration}s...")
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=60) as client:
+            deadline = time.perf_counter() + self.duration
+            start_time = time.perf_counter()
+            await asyncio.gather(*[self._bidder_loop(client, deadline) for _ in range(self.bidders)])
+
+        return time.perf_counter() - start_time
+
+    async def _bidder_loop(self, client: httpx.AsyncClient, deadline: float) -> None:
+        client_id = str(uuid.uuid4())
+        vehicle_ids = list(self.known_prices)
+
+        while time.perf_counter() < deadline:
+            vehicle_id = random.choice(vehicle_ids)
+            amount = self.known_prices[vehicle_id] + settings.BID_MIN_INCREMENT * random.randint(1, 3)
+            counter = [0]
+            _query_counter.set(counter)
+
+            start_time = time.perf_counter()
+            response = await client.post(
+                f"/api/v1/auction-vehicles/{vehicle_id}/bids",
+                json={"client_id": client_id, "amount": amount},
+            )
+            latency_ms = (time.perf_counter() - start_time) * 1000
+
+            if response.status_code == 201:
+                result = self.results["accepted"]
+                self.known_prices[vehicle_id] = max(self.known_prices[vehicle_id], amount)
+            elif response.status_code == 409:
+                result = self.results["rejected"]
+                # Somebody bid higher in the meantime, catch up with the price
+                self.known_prices[vehicle_id] = max(self.known_prices[vehicle_id], amount)
+            else:
+                self.results["errors"].errors += 1
+                continue
+
+            result.latencies_ms.append(latency_ms)
+            result.queries.append(counter[0])
+
+    async def verify(self, app) -> list[str]:
+        """Return vehicles whose bid history breaks the per-vehicle ordering guarantees."""
+        vehicle_ids = list(self.known_prices)
+        previous_amount = func.lag(UserBid.amount).over(partition_by=UserBid.vehicle_id, order_by=UserBid.id)
+        steps = (
+            select(UserBid.vehicle_id, (UserBid.amount - previous_amount).label("step"))
+            .where(UserBid.vehicle_id.in_(vehicle_ids))
+            .subquery()
+        )
+        too_small_steps = (
+            select(steps.c.vehicle_id, func.count())
+            .where(steps.c.step < settings.BID_MIN_INCREMENT)
+            .group_by(steps.c.vehicle_id)
+        )
+
+        history = (
+            select(UserBid.vehicle_id, func.max(UserBid.amount), func.count())
+            .where(UserBid.vehicle_id.in_(vehicle_ids))
+            .group_by(UserBid.vehicle_id)
+        )
+        current_bids = select(
+            VehicleCurrentBid.vehicle_id, VehicleCurrentBid.amount, VehicleCurrentBid.bid_count
+        ).where(VehicleCurrentBid.vehicle_id.in_(vehicle_ids))
+
+        async with app.container.db().session_factory() as session:
+            too_small = (await session.execute(too_small_steps)).all()
+            history_by_vehicle_id = {row[0]: row[1:] for row in (await session.execute(history)).all()}
+            current_by_vehicle_id = {row[0]: row[1:] for row in (await session.execute(current_bids)).all()}
+
+        problems = [
+            f"vehicle {vehicle_id}: {count} bids below the minimum increment" for vehicle_id, count in too_small
+        ]
+        for vehicle_id, current in current_by_vehicle_id.items():
+            if history_by_vehicle_id.get(vehicle_id) != current:
+                problems.append(
+                    f"vehicle {vehicle_id}: current bid {current} != history {history_by_vehicle_id.get(vehicle_id)}"
+                )
+
+        return problems
+
+
+def log_report(report: dict[str, dict]) -> None:
+    header = f"{'outcome':<12}{'requests':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'rps':>10}{'queries':>10}"
+    logger.info(header)
+    for name, summary in sorted(report.items()):
+        logger.info(
+            f"{name:<12}{summary['requests']:>10}{summary.get('p50_ms', '-'):>10}{summary.get('p95_ms', '-'):>10}"
+            f"{summary.get('p99_ms', '-'):>10}{summary.get('throughput_rps', '-'):>10}"
+            f"{summary.get('queries_per_request', '-'):>10}"
+        )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Bid burst benchmark")
+    parser.add_argument("--vehicles", type=int, default=20, help="Number of hot vehicles bid on (default: 20)")
+    parser.add_argument("--bidders", type=int, default=200, help="Number of concurrent bidders (default: 200)")
+    parser.add_argument("--duration", type=float, default=30, help="Benchmark duration in seconds (default: 30)")
+
+    args = parser.parse_args()
+
+    from main_api import app
+
+    benchmark = BidBenchmark(num_vehicles=args.vehicles, bidders=args.bidders, duration=args.duration)
+    async with app.router.lifespan_context(app):
+        elapsed = await benchmark.run(app)
+        problems = await benchmark.verify(app)
+
+    report = {name: result.summary(elapsed) for name, result in benchmark.results.items() if name != "errors"}
+    log_report(report)
+
+    total = sum(len(result.latencies_ms) for result in benchmark.results.values())
+    errors = benchmark.results["errors"].errors
+    logger.info(f"Total: {round(total / elapsed, 2)} bids/s, {errors} failed requests")
+
+    for problem in problems:
+        logger.error(f"Inconsistent bid history: {problem}")
+
+    return 1 if problems or errors else 0
+
+
+if __name__ == "__main__":
+    configure_logging()
+    sys.exit(asyncio.run(main()))
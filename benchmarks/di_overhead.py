@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Dependency injection overhead benchmark
+
+Measures what resolving a service costs per request, without a database. Every variant serves the same empty
+endpoint through the ASGI stack, injecting `AuctionVehiclesService` a different way:
+
+    plain       no dependency, the baseline
+    factory     `Depends(Provide[...])` building the service and its repositories on every request
+    singleton   `Depends(Provide[...])` returning the shared singleton
+    provided    `Depends(provided(...))`, the fast path skipping the `@inject` wrapper
+
+It also times the bare provider calls of the factory and singleton variants.
+
+Usage:
+    python -m benchmarks.di_overhead                        # 5000 requests per variant
+    python -m benchmarks.di_overhead --requests 20000
+"""
+
+import argparse
+import asyncio
+import time
+import timeit
+from typing import Annotated
+
+import httpx
+from dependency_injector import providers
+from dependency_injector.wiring import Provide, inject
+from fastapi import Depends, FastAPI
+
+from core.dependency_injection import Container, create_container, provided
+from core.logging import configure_logging, logger
+from services import AuctionVehiclesService
+
+app = FastAPI()
+
+
+@app.get("/plain")
+async def plain() -> dict:
+    return {}
+
+
+@app.get("/singleton")
+@inject
+async def singleton(
+    service: Annotated[AuctionVehiclesService, Depends(Provide[Container.auction_vehicles_service])],
+) -> dict:
+    return {}
+
+
+@app.get("/provided")
+async def fast_path(
+    service: Annotated[AuctionVehiclesService, Depends(provided(Container.auction_vehicles_service))],
+) -> dict:
+    return {}
+
+
+def as_factory(provider: providers.Provider) -> providers.Provider:
+    """Rebuild a service or repository singleton as a factory, the way the container declared them before."""
+    if isinstance(provider, providers.Singleton) and provider.cls.__name__.endswith(("Service", "Repository")):
+        return providers.Factory(provider.cls, **{name: as_factory(dep) for name, dep in provider.kwargs.items()})
+
+    return provider
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    """Return the mean time per request in microseconds."""
+    for _ in range(100):
+        await client.get(path)
+
+    start_time = time.perf_counter()
+    for _ in range(requests):
+        await client.get(path)
+
+    return (time.perf_counter() - start_time) / requests * 1_000_000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Dependency injection overhead benchmark")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per variant (default: 5000)")
+
+    args = parser.parse_args()
+
+    container = create_container()
+    container.wire(modules=[__name__])
+    app.container = container
+    factory = as_factory(container.auction_vehicles_service)
+
+    results = {}
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+        results["plain"] = await measure(client, "/plain", args.requests)
+        with container.auction_vehicles_service.override(factory):
+            results["factory"] = await measure(client, "/singleton", args.requests)
+        results["singleton"] = await measure(client, "/singleton", args.requests)
+        results["provided"] = await measure(client, "/provided", args.requests)
+
+    logger.info(f"{'variant':<12}{'us/request':>12}{'overhead us':>14}")
+    for name, mean_us in results.items():
+        logger.info(f"{name:<12}{mean_us:>12.1f}{mean_us - results['plain']:>14.1f}")
+
+    calls = 100_000
+    for name, provider in (("factory", factory), ("singleton", container.auction_vehicles_service)):
+        call_us = timeit.timeit(provider, number=calls) / calls * 1_000_000
+        logger.info(f"Provider call, {name}: {call_us:.2f} us")
+
+
+if __name__ == "__main__":
+    configure_logging()
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Startup import time benchmark
+
+Imports the API module in fresh interpreters with `python -X importtime` and reports the median total import
+time and the modules that cost the most, by cumulative and by self time. Worker restarts and autoscaling pay
+this on every start, so it is worth keeping an eye on.
+
+Usage:
+    python -m benchmarks.import_time                    # 5 runs of `import main_api`
+    python -m benchmarks.import_time --runs 10 --top 30
+    python -m benchmarks.import_time --budget-ms 800    # Fail when the median total exceeds 800ms
+
+Options:
+    --module            Module to import (default: main_api)
+    --runs              Number of fresh interpreter runs (default: 5)
+    --top               Number of most expensive modules listed (default: 20)
+    --budget-ms         Exit with a non-zero status when the median total import time exceeds this budget
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+
+from core.logging import configure_logging, logger
+
+
+def measure(module: str) -> dict[str, tuple[int, int]]:
+    """Import a module in a fresh interpreter and return the self and cumulative time of every imported module."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    timings = {}
+    for line in completed.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Startup import time benchmark")
+    parser.add_argument("--module", default="main_api", help="Module to import (default: main_api)")
+    parser.add_argument("--runs", type=int, default=5, help="Number of fresh interpreter runs (default: 5)")
+    parser.add_argument("--top", type=int, default=20, help="Number of most expensive modules listed (default: 20)")
+    parser.add_argument("--budget-ms", type=float, help="Maximum median total import time in milliseconds")
+
+    args = parser.parse_args()
+
+    totals_ms = []
+    self_ms: dict[str, list[float]] = defaultdict(list)
+    cumulative_ms: dict[str, list[float]] = defaultdict(list)
+    for _ in range(args.runs):
+        timings = measure(args.module)
+        totals_ms.append(timings[args.module][1] / 1000)
+        for name, (self_us, cumulative_us) in timings.items():
+            self_ms[name].append(self_us / 1000)
+            cumulative_ms[name].append(cumulative_us / 1000)
+
+    for title, timings_ms in (("cumulative", cumulative_ms), ("self", self_ms)):
+        medians = {name: statistics.median(values) for name, values in timings_ms.items()}
+        logger.info(f"Top {args.top} modules by {title} import time:")
+        for name, median in sorted(medians.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+            logger.info(f"{median:>10.1f} ms  {name}")
+
+    total_ms = statistics.median(totals_ms)
+    logger.info(f"Importing {args.module}: median {total_ms:.1f} ms over {args.runs} runs")
+
+    if args.budget_ms is not None and total_ms > args.budget_ms:
+        logger.error(f"Import time {total_ms:.1f} ms exceeds the budget of {args.budget_ms} ms")
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    configure_logging()
+    sys.exit(main())
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+End-to-end load benchmark for the v1 API
+
+This script boots `main_api:app` in-process, replays a weighted mix of realistic requests against it
+and reports latency percentiles, throughput and database queries per request for every scenario.
+
+Usage:
+    python -m benchmarks.load_test                                  # Run against the already seeded database
+    python -m benchmarks.load_test --seed --auctions 300 --vehicles 1000000
+    python -m benchmarks.load_test --duration 60 --concurrency 32
+    python -m benchmarks.load_test --update-baseline                # Store the results as the new baseline
+
+Options:
+    --seed              Seed the database through DatabaseSeeder (bulk COPY mode) before running
+    --auctions          Number of auctions to seed (default: 300)
+    --vehicles          Number of vehicles to seed (default: 1000000)
+    --workers           Number of processes generating the seed data (default: 4)
+    --duration          Benchmark duration in seconds (default: 30)
+    --warmup            Warm-up duration in seconds, excluded from results (default: 5)
+    --concurrency       Number of concurrent clients (default: 16)
+    --baseline          Path to the baseline file (default: benchmarks/baselines.json)
+    --update-baseline   Overwrite the baseline with the results of this run
+    --tolerance         Allowed relative regression against the baseline (default: 0.2)
+
+The run exits with a non-zero status when a scenario regresses against the stored baseline.
+"""
+
+import argparse
+import asyncio
+import contextvars
+import json
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import httpx
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+
+from core.logging import configure_logging, logger
+from repositories.models import Auction, VehicleManufacturer, VehicleModel
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baselines.json"
+# Fixed seed so baselines are always compared against the same dataset
+BENCHMARK_RANDOM_SEED = 20251127
+
+_query_counter: contextvars.ContextVar[list[int] | None] = contextvars.ContextVar("query_counter", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_query(conn, cursor, statement, parameters, context, executemany):
+    counter = _query_counter.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+@dataclass
+class Dataset:
+    auction_ids: list[int]
+    manufacturer_ids: list[int]
+    model_ids: list[int]
+
+
+@dataclass
+class Scenario:
+    name: str
+    weight: int
+    build_url: Callable[[Dataset], str]
+
+
+@dataclass
+class ScenarioResult:
+    latencies_ms: list[float] = field(default_factory=list)
+    queries: list[int] = field(default_factory=list)
+    errors: int = 0
+
+    def summary(self, elapsed: float) -> dict:
+        if len(self.latencies_ms) < 2:
+            return {"requests": len(self.latencies_ms), "errors": self.errors}
+
+        percentiles = statistics.quantiles(self.latencies_ms, n=100, method="inclusive")
+        return {
+            "requests": len(self.latencies_ms),
+            "errors": self.errors,
+            "p50_ms": round(percentiles[49], 2),
+            "p95_ms": round(percentiles[94], 2),
+            "p99_ms": round(percentiles[98], 2),
+            "throughput_rps": round(len(self.latencies_ms) / elapsed, 2),
+            "queries_per_request": round(statistics.fmean(self.queries), 2),
+        }
+
+
+def _vehicle_filters(dataset: Dataset) -> str:
+    """Random facet filter combination as produced by the filter panel."""
+    params = [("size", random.choice([10, 20, 50]))]
+
+    if random.random() < 0.5:
+        params.append(("is_active", "true"))
+    if random.random() < 0.4:
+        params.extend(("manufacturer_ids", m) for m in random.sample(dataset.manufacturer_ids, k=2))
+    if random.random() < 0.2:
+        params.append(("model_ids", random.choice(dataset.model_ids)))
+    if random.random() < 0.3:
+        year_from = random.randint(2014, 2022)
+        params.extend([("registration_year_from", year_from), ("registration_year_to", year_from + 3)])
+    if random.random() < 0.3:
+        params.extend([("mileage_from", 0), ("mileage_to", random.choice([50000, 100000, 150000]))])
+    if random.random() < 0.3:
+        params.append(("from", random.randint(1, 10) * 10))
+
+    return "&".join(f"{key}={value}" for key, value in params)
+
+
+SCENARIOS = [
+    Scenario(
+        name="auctions_list",
+        weight=20,
+        build_url=lambda dataset: f"/api/v1/auctions?from={random.choice([0, 0, 0, 10, 20])}&size=10",
+    ),
+    Scenario(
+        name="auction_detail",
+        weight=10,
+        build_url=lambda dataset: f"/api/v1/auctions/{random.choice(dataset.auction_ids)}",
+    ),
+    Scenario(
+        name="auction_vehicles_list",
+        weight=25,
+        build_url=lambda dataset: f"/api/v1/auction-vehicles/{random.choice(dataset.auction_ids)}?size=20",
+    ),
+    Scenario(
+        name="auction_vehicles_filtered",
+        weight=25,
+        build_url=lambda dataset: (
+            f"/api/v1/auction-vehicles/{random.choice(dataset.auction_ids)}?{_vehicle_filters(dataset)}"
+        ),
+    ),
+    Scenario(
+        name="manufacturers",
+        weight=10,
+        build_url=lambda dataset: "/api/v1/manufacturers",
+    ),
+    Scenario(
+        name="manufacturer_models",
+        weight=5,
+        build_url=lambda dataset: f"/api/v1/manufacturers/{random.choice(dataset.manufacturer_ids)}/models",
+    ),
+    Scenario(
+        name="model_detail",
+        weight=5,
+        build_url=lambda dataset: f"/api/v1/models/{random.choice(dataset.model_ids)}",
+    ),
+]
+
+
+class LoadBenchmark:
+    def __init__(self, duration: float, warmup: float, concurrency: int):
+        self.duration = duration
+        self.warmup = warmup
+        self.concurrency = concurrency
+        self.results: dict[str, ScenarioResult] = defaultdict(ScenarioResult)
+
+    async def load_dataset(self, app) -> Dataset:
+        async with app.container.db().session_factory() as session:
+            auction_ids = (await session.execute(select(Auction.id))).scalars().all()
+            manufacturer_ids = (await session.execute(select(VehicleManufacturer.id))).scalars().all()
+            model_ids = (await session.execute(select(VehicleModel.id))).scalars().all()
+
+        if not auction_ids or not manufacturer_ids or not model_ids:
+            raise RuntimeError("Database is empty, run the benchmark with --seed first.")
+
+        return Dataset(
+            auction_ids=list(auction_ids),
+            manufacturer_ids=list(manufacturer_ids),
+            model_ids=list(model_ids),
+        )
+
+    async def run(self, app) -> tuple[dict[str, ScenarioResult], float]:
+        dataset = await self.load_dataset(app)
+        transport = httpx.ASGITransport(app=app)
+
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=60) as client:
+            logger.info(f"Warming up for {self.warmup}s...")
+            await self._run_clients(client, dataset, self.warmup, record=False)
+
+            logger.info(f"Running {len(SCENARIOS)} scenarios for {self.duration}s with {self.concurrency} clients...")
+            start_time = time.perf_counter()
+            await self._run_clients(client, dataset, self.duration, record=True)
+            elapsed = time.perf_counter() - start_time
+
+        return self.results, elapsed
+
+    async def _run_clients(self, client: httpx.AsyncClient, dataset: Dataset, duration: float, record: bool):
+        deadline = time.perf_counter() + duration
+        await asyncio.gather(*[self._client_loop(client, dataset, deadline, record) for _ in range(self.concurrency)])
+
+    async def _client_loop(self, client: httpx.AsyncClient, dataset: Dataset, deadline: float, record: bool):
+        weights = [scenario.weight for scenario in SCENARIOS]
+
+        while time.perf_counter() < deadline:
+            scenario = random.choices(SCENARIOS, weights=weights)[0]
+            counter = [0]
+            _query_counter.set(counter)
+
+            start_time = time.perf_counter()
+            response = await client.get(scenario.build_url(dataset))
+            latency_ms = (time.perf_counter() - start_time) * 1000
+
+            if not record:
+                continue
+
+            result = self.results[scenario.name]
+            if response.status_code >= 400:
+                result.errors += 1
+                continue
+
+            result.latencies_ms.append(latency_ms)
+            result.queries.append(counter[0])
+
+
+def compare_with_baseline(report: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> list[str]:
+    """Return human readable regressions of the report against the baseline."""
+    regressions = []
+
+    for name, current in report.items():
+        expected = baseline.get(name)
+        if not expected or "p95_ms" not in current:
+            continue
+
+        for metric in ("p50_ms", "p95_ms", "p99_ms"):
+            if current[metric] > expected[metric] * (1 + tolerance):
+                regressions.append(f"{name}: {metric} {current[metric]} > baseline {expected[metric]}")
+
+        if current["throughput_rps"] < expected["throughput_rps"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput_rps {current['throughput_rps']} < baseline {expected['throughput_rps']}"
+            )
+
+        # Query counts are deterministic per code path, any increase is a regression (N+1 queries etc.)
+        if current["queries_per_request"] > expected["queries_per_request"] + 0.5:
+            regressions.append(
+                f"{name}: queries_per_request {current['queries_per_request']} > "
+                f"baseline {expected['queries_per_request']}"
+            )
+
+        if current["errors"] > 0:
+            regressions.append(f"{name}: {current['errors']} failed requests")
+
+    return regressions
+
+
+def log_report(report: dict[str, dict]) -> None:
+    header = f"{'scenario':<28}{'requests':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'rps':>10}{'queries':>10}"
+    logger.info(header)
+    for name, summary in sorted(report.items()):
+        logger.info(
+            f"{name:<28}{summary['requests']:>10}{summary.get('p50_ms', '-'):>10}{summary.get('p95_ms', '-'):>10}"
+            f"{summary.get('p99_ms', '-'):>10}{summary.get('throughput_rps', '-'):>10}"
+            f"{summary.get('queries_per_request', '-'):>10}"
+        )
+
+
+async def seed(num_auctions: int, num_vehicles: int, workers: int) -> None:
+    from seed_database import DatabaseSeeder
+
+    seeder = DatabaseSeeder(
+        num_auctions=num_auctions,
+        num_vehicles=num_vehicles,
+        bulk=True,
+        random_seed=BENCHMARK_RANDOM_SEED,
+        workers=workers,
+    )
+    try:
+        await seeder.seed_all()
+    finally:
+        await seeder.cleanup()
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="End-to-end load benchmark for the v1 API")
+    parser.add_argument("--seed", action="store_true", help="Seed the database before running the benchmark")
+    parser.add_argument("--auctions", type=int, default=300, help="Number of auctions to seed (default: 300)")
+    parser.add_argument("--vehicles", type=int, default=1_000_000, help="Number of vehicles to seed (default: 1000000)")
+    parser.add_argument("--workers", type=int, default=4, help="Processes generating seed data (default: 4)")
+    parser.add_argument("--duration", type=float, default=30, help="Benchmark duration in seconds (default: 30)")
+    parser.add_argument("--warmup", type=float, default=5, help="Warm-up duration in seconds (default: 5)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Number of concurrent clients (default: 16)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH, help="Path to the baseline file")
+    parser.add_argument("--update-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative regression (default: 0.2)")
+
+    args = parser.parse_args()
+
+    if args.seed:
+        await seed(args.auctions, args.vehicles, args.workers)
+
+    from main_api import app
+
+    benchmark = LoadBenchmark(duration=args.duration, warmup=args.warmup, concurrency=args.concurrency)
+    async with app.router.lifespan_context(app):
+        results, elapsed = await benchmark.run(app)
+
+    report = {name: result.summary(elapsed) for name, result in results.items()}
+    log_report(report)
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+        logger.info(f"Baseline written to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        logger.warning(f"No baseline found at {args.baseline}, run with --update-baseline to create one.")
+        return 0
+
+    regressions = compare_with_baseline(report, json.loads(args.baseline.read_text()), args.tolerance)
+    for regression in regressions:
+        logger.error(f"Regression: {regression}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    configure_logging()
+    sys.exit(asyncio.run(main()))
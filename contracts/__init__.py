@@ -1,8 +1,20 @@
 from .auction_vehicles import (
     AuctionVehicle,
+    AuctionVehicleDetail,
+    AuctionVehicleDetailResponse,
     AuctionVehicleFacet,
     AuctionVehicleFacets,
+    AuctionVehicleFacetsResponse,
+    AuctionVehicleIngestError,
+    AuctionVehicleIngestRow,
+    AuctionVehicleRangeFacet,
     AuctionVehicleResponse,
+    AuctionVehiclesBulkPatch,
+    AuctionVehiclesBulkUpdateRequest,
+    AuctionVehiclesBulkUpdateResponse,
+    AuctionVehiclesExportQuery,
+    AuctionVehiclesFilter,
+    AuctionVehiclesIngestResponse,
     AuctionVehiclesQuery,
     AuctionVehiclesResponse,
     AuctionVehicleUpdateRequest,
@@ -10,6 +22,7 @@ from .auction_vehicles import (
 )
 from .auctions import Auction, AuctionCarPreview, AuctionResponse, AuctionsListQuery, AuctionsListResponse
 from .base import PaginationParams
+from .user_bids import PlaceBidRequest, PlaceBidResponse
 from .users import User, UserRegistrationResponse, UserRegistrationUpdateRequest
 from .vehicle_manufacturers import (
     VehicleManufacturer,
@@ -21,6 +34,14 @@ from .vehicle_manufacturers import (
     VehicleModelResponse,
     VehicleModelsResponse,
 )
+from .vehicles import (
+    VehicleSearchFilter,
+    VehicleSearchQuery,
+    VehicleSearchResponse,
+    VehicleSearchResult,
+    VehicleVinAppearance,
+    VehicleVinHistoryResponse,
+)
 
 __all__ = [
     "Auction",
@@ -32,10 +53,22 @@ __all__ = [
     "AuctionVehicle",
     "AuctionVehicleFacet",
     "AuctionVehicleFacets",
+    "AuctionVehicleFacetsResponse",
+    "AuctionVehicleRangeFacet",
+    "AuctionVehiclesFilter",
     "AuctionVehiclesQuery",
+    "AuctionVehiclesExportQuery",
     "AuctionVehiclesResponse",
     "AuctionVehicleUpdateRequest",
+    "AuctionVehiclesBulkPatch",
+    "AuctionVehiclesBulkUpdateRequest",
+    "AuctionVehiclesBulkUpdateResponse",
     "AuctionVehicleResponse",
+    "AuctionVehicleDetail",
+    "AuctionVehicleDetailResponse",
+    "AuctionVehicleIngestRow",
+    "AuctionVehicleIngestError",
+    "AuctionVehiclesIngestResponse",
     "VehicleManufacturer",
     "VehicleManufacturersResponse",
     "VehicleModel",
@@ -44,8 +77,16 @@ __all__ = [
     "VehicleModelRequest",
     "VehicleManufacturerResponse",
     "VehicleModelResponse",
+    "VehicleSearchFilter",
+    "VehicleSearchQuery",
+    "VehicleSearchResponse",
+    "VehicleSearchResult",
+    "VehicleVinAppearance",
+    "VehicleVinHistoryResponse",
     "User",
     "UserRegistrationUpdateRequest",
     "UserRegistrationResponse",
     "ClientBid",
+    "PlaceBidRequest",
+    "PlaceBidResponse",
 ]
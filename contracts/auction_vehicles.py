@@ -1,14 +1,15 @@
-from datetime import datetime
+import uuid
+from datetime import date, datetime
+from typing import Literal
 
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, Field, HttpUrl, field_validator, model_validator
 
 from contracts.base import PaginatedResponse, PaginationParams
 
 
 class ClientBid(BaseModel):
-    client_id: int = Field(
-        description="Unique identifier for the client",
-        ge=1,
+    client_id: uuid.UUID = Field(
+        description="Unique identifier of the user who placed the bid",
     )
     bid_amount: int = Field(
         description="Bid amount in the auction",
@@ -58,13 +59,43 @@ class AuctionVehicle(BaseModel):
         max_length=17,
         pattern=r"^[A-HJ-NPR-Z0-9]{17}$",  # VIN format
     )
+    client_bid: ClientBid | None = Field(
+        description="Highest bid placed on the vehicle",
+        default=None,
+    )
+    version: int = Field(
+        description="Version of the record, send it back with updates to detect conflicts",
+    )
     images: list[HttpUrl] = Field(
         description="List of URLs to images of the vehicle",
         default_factory=list,
     )
 
 
-class AuctionVehiclesQuery(PaginationParams):
+class AuctionVehicleDetail(AuctionVehicle):
+    body_type: str | None = Field(None, description="Body type of the vehicle")
+    color: str | None = Field(None, description="Color of the vehicle")
+    engine_power: int = Field(description="Engine power in horsepower", ge=0)
+    engine_cc: int = Field(description="Engine displacement in cubic centimeters", ge=0)
+    start_price: int = Field(description="Starting price of the vehicle", ge=0)
+    is_damaged: bool = Field(False, description="Indicates if the vehicle is damaged")
+    number_plates: str | None = Field(None, description="Registration plates of the vehicle")
+    equipment: list[str] = Field(default_factory=list, description="List of vehicle equipment")
+    description: str | None = Field(None, description="Free text description of the vehicle")
+    damaged_images: list[HttpUrl] = Field(
+        default_factory=list,
+        description="List of URLs to images of the vehicle damages",
+    )
+
+
+class AuctionVehiclesFilter(BaseModel):
+    q: str | None = Field(
+        None,
+        description='Full-text search in manufacturer and model names, equipment and description, supports "quoted '
+        'phrases", or and -excluded words',
+        min_length=1,
+        max_length=200,
+    )
     is_active: bool | None = Field(
         description="Filter vehicles by their active status",
         default=None,
@@ -96,6 +127,90 @@ class AuctionVehiclesQuery(PaginationParams):
         description="Filter vehicles with mileage up to this value (inclusive)",
         ge=0,
     )
+    start_price_from: int | None = Field(
+        None,
+        description="Filter vehicles with a starting price from this value (inclusive)",
+        ge=0,
+    )
+    start_price_to: int | None = Field(
+        None,
+        description="Filter vehicles with a starting price up to this value (inclusive)",
+        ge=0,
+    )
+    engine_power_from: int | None = Field(
+        None,
+        description="Filter vehicles with engine power from this value in horsepower (inclusive)",
+        ge=0,
+    )
+    engine_power_to: int | None = Field(
+        None,
+        description="Filter vehicles with engine power up to this value in horsepower (inclusive)",
+        ge=0,
+    )
+    engine_cc_from: int | None = Field(
+        None,
+        description="Filter vehicles with engine displacement from this value in cubic centimeters (inclusive)",
+        ge=0,
+    )
+    engine_cc_to: int | None = Field(
+        None,
+        description="Filter vehicles with engine displacement up to this value in cubic centimeters (inclusive)",
+        ge=0,
+    )
+    body_types: list[str] = Field(default_factory=list, description="Filter vehicles by a list of body types")
+    colors: list[str] = Field(default_factory=list, description="Filter vehicles by a list of colors")
+    transmissions: list[str] = Field(default_factory=list, description="Filter vehicles by a list of transmissions")
+    equipment_all: list[str] = Field(
+        default_factory=list,
+        description="Filter vehicles having all of the listed equipment features",
+    )
+    equipment_any: list[str] = Field(
+        default_factory=list,
+        description="Filter vehicles having any of the listed equipment features",
+    )
+    is_damaged: bool | None = Field(
+        None,
+        description="Filter vehicles by whether they are damaged",
+    )
+
+
+AuctionVehiclesSection = Literal["items", "total", "facets"]
+
+
+class AuctionVehiclesQuery(PaginationParams, AuctionVehiclesFilter):
+    sort: Literal[
+        "recent_bids",
+        "relevance",
+        "price_asc",
+        "price_desc",
+        "mileage_asc",
+        "mileage_desc",
+        "year_asc",
+        "year_desc",
+        "updated_desc",
+    ] = Field(
+        "recent_bids",
+        description="Order of the vehicles. recent_bids (most recently bid on first) and relevance (best matches of q "
+        "first, recent_bids without q) do not support cursors and sort the whole auction on every page, the other "
+        "orders are served by indexes",
+    )
+    include: list[AuctionVehiclesSection] = Field(
+        default_factory=lambda: ["items", "total", "facets"],
+        description="Response sections to compute, comma separated (e.g. include=items), the others are null",
+    )
+
+    @field_validator("include", mode="before")
+    @classmethod
+    def split_include(cls, value: str | list[str]) -> list[str]:
+        values = [value] if isinstance(value, str) else value
+        return [section.strip() for item in values for section in item.split(",") if section.strip()]
+
+
+class AuctionVehiclesExportQuery(AuctionVehiclesFilter):
+    format: Literal["ndjson", "csv"] = Field(
+        "ndjson",
+        description="Export file format",
+    )
 
 
 class AuctionVehicleFacet(BaseModel):
@@ -113,6 +228,19 @@ class AuctionVehicleFacet(BaseModel):
     )
 
 
+class AuctionVehicleRangeFacet(BaseModel):
+    min: int | None = Field(
+        description="Lower bound of the range (inclusive), null when the range is open",
+    )
+    max: int | None = Field(
+        description="Upper bound of the range (exclusive), null when the range is open",
+    )
+    count: int = Field(
+        description="Count of vehicles in the range",
+        ge=0,
+    )
+
+
 class AuctionVehicleFacets(BaseModel):
     manufacturers: list[AuctionVehicleFacet] = Field(
         description="Mapping of manufacturer names to the count of vehicles available from each manufacturer",
@@ -123,6 +251,38 @@ class AuctionVehicleFacets(BaseModel):
     registration_years: list[AuctionVehicleFacet] = Field(
         description="Mapping of registration years to the count of vehicles registered in each year",
     )
+    start_prices: list[AuctionVehicleRangeFacet] = Field(
+        default_factory=list,
+        description="Histogram of starting prices",
+    )
+    mileages: list[AuctionVehicleRangeFacet] = Field(
+        default_factory=list,
+        description="Histogram of mileages in kilometers",
+    )
+    engine_powers: list[AuctionVehicleRangeFacet] = Field(
+        default_factory=list,
+        description="Histogram of engine powers in horsepower",
+    )
+    body_types: list[AuctionVehicleFacet] = Field(
+        default_factory=list,
+        description="Count of vehicles of each body type",
+    )
+    colors: list[AuctionVehicleFacet] = Field(
+        default_factory=list,
+        description="Count of vehicles of each color",
+    )
+    transmissions: list[AuctionVehicleFacet] = Field(
+        default_factory=list,
+        description="Count of vehicles of each transmission",
+    )
+    damaged: list[AuctionVehicleFacet] = Field(
+        default_factory=list,
+        description="Count of damaged (\"true\") and undamaged (\"false\") vehicles",
+    )
+    equipment: list[AuctionVehicleFacet] = Field(
+        default_factory=list,
+        description="Count of vehicles having each equipment feature",
+    )
 
 
 class AuctionVehicleUpdateRequest(BaseModel):
@@ -134,12 +294,73 @@ class AuctionVehicleUpdateRequest(BaseModel):
     engine: str | None = Field(None, description="Engine type or specification")
     transmission: str | None = Field(None, description="Transmission type (e.g., automatic, manual)")
     vin: str | None = Field(None, description="Vehicle Identification Number (VIN)", min_length=17, max_length=17)
+    version: int | None = Field(None, description="Version the update is based on, 409 when the record changed since")
+
+
+class AuctionVehiclesBulkPatch(BaseModel):
+    is_active: bool | None = Field(None, description="Indicates if the vehicles are active in the auction")
+    manufacturer_id: int | None = Field(None, description="Vehicle manufacturer id")
+    model_id: int | None = Field(
+        None,
+        description="Vehicle model id, the manufacturer of the model is set too when manufacturer_id is omitted",
+    )
+    start_price: int | None = Field(None, description="Starting price of the vehicles", ge=0)
+
+    @model_validator(mode="after")
+    def check_not_empty(self) -> "AuctionVehiclesBulkPatch":
+        # Null fields are left unchanged, a patch of nulls only would bump the version of every vehicle
+        if not self.model_dump(exclude_none=True):
+            raise ValueError("patch must set at least one field to a value")
+        return self
+
+
+class AuctionVehiclesBulkUpdateRequest(BaseModel):
+    vehicle_ids: list[int] | None = Field(
+        None,
+        description="Vehicles to update, mutually exclusive with filter",
+        min_length=1,
+        max_length=10_000,
+    )
+    filter: AuctionVehiclesFilter | None = Field(
+        None,
+        description="Update every vehicle of the auction matching the filter, mutually exclusive with vehicle_ids",
+    )
+    patch: AuctionVehiclesBulkPatch = Field(
+        description="Fields to set on every selected vehicle",
+    )
+
+    @model_validator(mode="after")
+    def check_selection(self) -> "AuctionVehiclesBulkUpdateRequest":
+        if (self.vehicle_ids is None) == (self.filter is None):
+            raise ValueError("exactly one of vehicle_ids and filter is required")
+        return self
+
+
+class AuctionVehiclesBulkUpdateResponse(BaseModel):
+    updated: int = Field(description="Number of updated vehicles", ge=0)
+    not_found: list[int] = Field(
+        default_factory=list,
+        description="Requested vehicle ids that do not belong to the auction",
+    )
+    duration_ms: int = Field(description="Time spent updating the vehicles in milliseconds", ge=0)
 
 
 class AuctionVehiclesResponse(PaginatedResponse):
-    items: list[AuctionVehicle] = Field(
-        description="List of auction vehicles",
+    total: int | None = Field(
+        None,
+        description="Number of vehicles matching the filters, null unless included",
     )
+    items: list[AuctionVehicle] | None = Field(
+        None,
+        description="List of auction vehicles, null unless included",
+    )
+    facets: AuctionVehicleFacets | None = Field(
+        None,
+        description="Facets for filtering auction vehicles, null unless included",
+    )
+
+
+class AuctionVehicleFacetsResponse(BaseModel):
     facets: AuctionVehicleFacets = Field(
         description="Facets for filtering auction vehicles",
     )
@@ -149,3 +370,62 @@ class AuctionVehicleResponse(BaseModel):
     vehicle: AuctionVehicle = Field(
         description="Details of the auction vehicle",
     )
+
+
+class AuctionVehicleDetailResponse(BaseModel):
+    vehicle: AuctionVehicleDetail = Field(
+        description="Full record of the auction vehicle",
+    )
+
+
+class AuctionVehicleIngestRow(BaseModel):
+    vehicle_id: int = Field(
+        description="Unique identifier for the auction vehicle 7 digits long",
+        ge=1000000,
+        le=9999999,
+    )
+    is_active: bool = Field(True, description="Indicates if the vehicle is currently active in the auction")
+    manufacturer: str = Field(description="Vehicle manufacturer name or synonym", max_length=255)
+    model: str = Field(description="Vehicle model name or synonym", max_length=255)
+    manufacturing_date: date = Field(description="Date when the vehicle was manufactured")
+    mileage: int = Field(description="Mileage of the vehicle in kilometers", ge=0)
+    engine: str = Field(description="Engine type or specification", max_length=255)
+    transmission: str = Field(description="Transmission type (e.g., automatic, manual)", max_length=255)
+    vin: str = Field(
+        description="Vehicle Identification Number (VIN)",
+        min_length=17,
+        max_length=17,
+        pattern=r"^[A-HJ-NPR-Z0-9]{17}$",
+    )
+    body_type: str | None = Field(None, description="Body type of the vehicle", max_length=255)
+    color: str | None = Field(None, description="Color of the vehicle", max_length=255)
+    engine_power: int = Field(description="Engine power in horsepower", ge=0)
+    engine_cc: int = Field(description="Engine displacement in cubic centimeters", ge=0)
+    start_price: int = Field(description="Starting price of the vehicle", ge=0)
+    is_damaged: bool = Field(False, description="Indicates if the vehicle is damaged")
+    number_plates: str | None = Field(None, description="Registration plates of the vehicle", max_length=20)
+    equipment: list[str] = Field(default_factory=list, description="List of vehicle equipment")
+    description: str | None = Field(None, description="Free text description of the vehicle")
+    images: list[HttpUrl] = Field(default_factory=list, description="List of URLs to images of the vehicle")
+    damaged_images: list[HttpUrl] = Field(
+        default_factory=list,
+        description="List of URLs to images of the vehicle damages",
+    )
+
+
+class AuctionVehicleIngestError(BaseModel):
+    line: int = Field(description="Line number of the rejected row in the NDJSON body", ge=1)
+    vin: str | None = Field(None, description="VIN of the rejected row, if it could be parsed")
+    error: str = Field(description="Reason why the row was rejected")
+
+
+class AuctionVehiclesIngestResponse(BaseModel):
+    received: int = Field(description="Number of rows read from the request body", ge=0)
+    upserted: int = Field(description="Number of rows inserted or updated", ge=0)
+    failed: int = Field(description="Number of rejected rows", ge=0)
+    errors: list[AuctionVehicleIngestError] = Field(
+        default_factory=list,
+        description="Rejected rows, truncated to the first 1000 errors",
+    )
+    duration_ms: int = Field(description="Time spent ingesting the feed in milliseconds", ge=0)
+    rows_per_second: float = Field(description="Ingest throughput", ge=0)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -93,3 +94,7 @@ class AuctionsListQuery(PaginationParams):
         default=None,
         pattern=r"^(active|closed|)$",
     )
+    sort: Literal["end_asc", "end_desc", "newest"] = Field(
+        "end_asc",
+        description="Order of the auctions, by closing date or newest created first",
+    )
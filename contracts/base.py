@@ -6,7 +6,19 @@ class PaginationParams(BaseModel):
 
     from_: int | None = Field(0, alias="from")
     size: int | None = Field(10, ge=1, le=100)
+    cursor: str | None = Field(
+        None,
+        description="next_cursor of the previous page, to seek past it instead of skipping `from` rows",
+    )
 
 
 class PaginatedResponse(BaseModel):
     total: int
+    total_exact: bool = Field(
+        True,
+        description="False when total is a lower bound (more than total results) or a planner estimate",
+    )
+    next_cursor: str | None = Field(
+        None,
+        description="Cursor of the next page, null on the last page or when the sort does not support cursors",
+    )
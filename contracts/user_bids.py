@@ -0,0 +1,24 @@
+import uuid
+
+from pydantic import BaseModel, Field
+
+from contracts.auction_vehicles import ClientBid
+
+
+class PlaceBidRequest(BaseModel):
+    client_id: uuid.UUID = Field(
+        description="Unique identifier of the user placing the bid",
+    )
+    amount: int = Field(
+        description="Bid amount, at least the start price or the current highest bid plus the minimum increment",
+        gt=0,
+    )
+
+
+class PlaceBidResponse(BaseModel):
+    vehicle_id: int = Field(
+        description="Unique identifier of the vehicle the bid was placed on",
+    )
+    bid: ClientBid = Field(
+        description="The accepted bid, now the highest bid of the vehicle",
+    )
@@ -44,6 +44,9 @@ class User(BaseModel):
         max_length=50,
         default="active",
     )
+    version: int = Field(
+        description="Version of the record, send it back with updates to detect conflicts",
+    )
 
 
 class UserRegistrationResponse(BaseModel):
@@ -84,3 +87,7 @@ class UserRegistrationUpdateRequest(BaseModel):
         default=None,
         max_length=50,
     )
+    version: int | None = Field(
+        description="Version the update is based on, 409 when the record changed since",
+        default=None,
+    )
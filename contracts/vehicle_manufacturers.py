@@ -7,6 +7,7 @@ class VehicleManufacturer(BaseModel):
     id: int = Field(..., description="Unique identifier for the vehicle manufacturer")
     name: str = Field(..., description="Name of the vehicle manufacturer")
     synonyms: list[str] = Field(default_factory=list, description="List of synonyms for the manufacturer")
+    version: int = Field(..., description="Version of the record, send it back with updates to detect conflicts")
     created_at: datetime = Field(..., description="Timestamp when the manufacturer was created")
 
 
@@ -15,6 +16,7 @@ class VehicleModel(BaseModel):
     name: str = Field(..., description="Name of the vehicle model")
     default_vehicle_type: str = Field(..., description="Default vehicle type for the model (e.g., suv, sedan...)")
     synonyms: list[str] = Field(default_factory=list, description="List of synonyms for the vehicle model")
+    version: int = Field(..., description="Version of the record, send it back with updates to detect conflicts")
     created_at: datetime = Field(..., description="Timestamp when the model was created")
 
 
@@ -32,6 +34,7 @@ class VehicleManufacturerResponse(BaseModel):
 class VehicleManufacturerRequest(BaseModel):
     name: str | None = Field(None, description="Name of the vehicle manufacturer")
     synonyms: list[str] | None = Field(None, description="List of synonyms for the manufacturer")
+    version: int | None = Field(None, description="Version the update is based on, 409 when the record changed since")
 
 
 class VehicleModelRequest(BaseModel):
@@ -40,6 +43,7 @@ class VehicleModelRequest(BaseModel):
         None, description="Default vehicle type for the model (e.g., suv, sedan...)"
     )
     synonyms: list[str] | None = Field(None, description="List of synonyms for the vehicle model")
+    version: int | None = Field(None, description="Version the update is based on, 409 when the record changed since")
 
 
 class VehicleModelsResponse(BaseModel):
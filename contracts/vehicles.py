@@ -0,0 +1,119 @@
+from datetime import datetime
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+from .auction_vehicles import AuctionVehicle, AuctionVehicleFacets, AuctionVehiclesFilter, AuctionVehiclesQuery
+from .base import PaginatedResponse
+
+
+class VehicleSearchFilter(AuctionVehiclesFilter):
+    countries: list[str] = Field(
+        default_factory=list,
+        description="Filter vehicles by the country codes of their auctions (ISO 3166-1 alpha-2)",
+    )
+    auction_end_from: datetime | None = Field(
+        None,
+        description="Filter vehicles of auctions ending from this time (inclusive)",
+    )
+    auction_end_to: datetime | None = Field(
+        None,
+        description="Filter vehicles of auctions ending up to this time (inclusive)",
+    )
+
+
+class VehicleSearchQuery(AuctionVehiclesQuery, VehicleSearchFilter):
+    sort: Literal[
+        "ending_soon",
+        "relevance",
+        "price_asc",
+        "price_desc",
+        "mileage_asc",
+        "mileage_desc",
+        "year_asc",
+        "year_desc",
+        "updated_desc",
+    ] = Field(
+        "ending_soon",
+        description="Order of the vehicles. ending_soon lists vehicles of the auctions closing first, relevance (best "
+        "matches of q first, ending_soon without q) does not support cursors",
+    )
+
+
+class VehicleSearchResult(AuctionVehicle):
+    auction_id: int = Field(
+        description="Unique identifier of the auction of the vehicle",
+    )
+    auction_country: str = Field(
+        description="Country code where the auction is held",
+        min_length=2,
+        max_length=2,
+    )
+    auction_end_datetime: datetime = Field(
+        description="Closing date of the auction",
+    )
+
+
+class VehicleSearchResponse(PaginatedResponse):
+    total: int | None = Field(
+        None,
+        description="Number of vehicles matching the filters, null unless included",
+    )
+    items: list[VehicleSearchResult] | None = Field(
+        None,
+        description="List of vehicles of every open auction, null unless included",
+    )
+    facets: AuctionVehicleFacets | None = Field(
+        None,
+        description="Facets for filtering the vehicles, null unless included",
+    )
+
+
+class VehicleVinAppearance(BaseModel):
+    vehicle_id: int = Field(
+        description="Identifier of the vehicle in the auction",
+    )
+    vin: str = Field(
+        description="Vehicle Identification Number (VIN)",
+    )
+    auction_id: int = Field(
+        description="Unique identifier of the auction",
+    )
+    auction_country: str = Field(
+        description="Country code where the auction is held",
+    )
+    auction_end_datetime: datetime = Field(
+        description="Closing date of the auction",
+    )
+    manufacturer: str = Field(
+        description="Vehicle manufacturer name",
+    )
+    model: str = Field(
+        description="Vehicle model name",
+    )
+    mileage: int = Field(
+        description="Mileage of the vehicle in kilometers when it was auctioned",
+        ge=0,
+    )
+    start_price: int = Field(
+        description="Starting price of the vehicle in the auction",
+        ge=0,
+    )
+    result: Literal["open", "sold", "unsold"] = Field(
+        description="open until the auction closes, then sold when the vehicle received bids and unsold otherwise",
+    )
+    final_bid: int | None = Field(
+        None,
+        description="Highest bid when the auction closed, null while open or without bids",
+    )
+    bid_count: int = Field(
+        0,
+        description="Number of bids when the auction closed",
+        ge=0,
+    )
+
+
+class VehicleVinHistoryResponse(BaseModel):
+    items: list[VehicleVinAppearance] = Field(
+        description="Auction appearances of the VIN, or of the VINs starting with a partial VIN, latest first",
+    )
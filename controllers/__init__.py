@@ -1,10 +1,21 @@
+from .admin_controller import router as admin_router
 from .health_controller import router as health_router
-from .v1 import auction_vehicles_router, auctions_router, manufacturers_router, users_router
+from .v1 import (
+    auction_vehicles_router,
+    auctions_router,
+    manufacturers_router,
+    user_bids_router,
+    users_router,
+    vehicles_router,
+)
 
 __all__ = [
+    "admin_router",
     "health_router",
     "auctions_router",
     "auction_vehicles_router",
     "manufacturers_router",
+    "user_bids_router",
     "users_router",
+    "vehicles_router",
 ]
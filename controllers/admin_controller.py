@@ -0,0 +1,57 @@
+from typing import Annotated, Literal
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends, Query, Request, status
+from fastapi.responses import Response
+
+from core.dependency_injection import Container
+from core.profiling import RequestProfiler
+from exceptions.types import NotFoundError, UnauthorizedError
+
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+def _authorize(request: Request, profiler: RequestProfiler) -> None:
+    if not profiler.is_signed(request):
+        raise UnauthorizedError()
+
+
+@router.get("/profiles", status_code=status.HTTP_200_OK, operation_id="get_profiles")
+@inject
+async def get_profiles(
+    request: Request,
+    profiler: Annotated[RequestProfiler, Depends(Provide[Container.request_profiler])],
+) -> dict:
+    _authorize(request, profiler)
+
+    return {
+        "retention": profiler.store.retention,
+        "capacity": profiler.store.capacity,
+        "items": [record.summary() for record in profiler.store.list()],
+    }
+
+
+@router.get("/profiles/{profile_id}", status_code=status.HTTP_200_OK, operation_id="download_profile")
+@inject
+async def download_profile(
+    profile_id: str,
+    request: Request,
+    profiler: Annotated[RequestProfiler, Depends(Provide[Container.request_profiler])],
+    format: Annotated[Literal["collapsed", "pstats"], Query(description="Profile file format")] = "collapsed",
+) -> Response:
+    _authorize(request, profiler)
+
+    record = profiler.store.get(profile_id)
+    if not record:
+        raise NotFoundError(profile_id, "Profile")
+
+    if format == "pstats":
+        content, media_type, extension = record.to_pstats(), "application/octet-stream", "prof"
+    else:
+        content, media_type, extension = record.to_collapsed(), "text/plain", "collapsed"
+
+    return Response(
+        content=content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="profile-{record.id}.{extension}"'},
+    )
@@ -1,11 +1,11 @@
+import dataclasses
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import text
 
 from core.dependency_injection import Container
-from database.database import Database
+from services import DatabaseHealthMonitor, StartupWarmup
 
 router = APIRouter(tags=["health"])
 
@@ -17,22 +17,27 @@ async def health():
 
 @router.get("/ready")
 @inject
-async def readiness(db: Annotated[Database, Depends(Provide[Container.db])]):
-    """Health check with database connectivity verification."""
-    health_status = {"status": "ready", "checks": {"database": "unknown"}}
-
-    try:
-        # Test database connection
-        async with db.session_factory() as session:
-            # Simple query to test connection
-            await session.execute(text("SELECT 1"))
-            health_status["checks"]["database"] = "healthy"
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        health_status["checks"]["database"] = "unhealthy"
-        health_status["error"] = str(e)
-
+async def readiness(
+    database_health_monitor: Annotated[DatabaseHealthMonitor, Depends(Provide[Container.database_health_monitor])],
+    startup_warmup: Annotated[StartupWarmup, Depends(Provide[Container.startup_warmup])],
+):
+    """Readiness check from the warm-up state and the last background database check, without a query."""
+    database = database_health_monitor.health
+    health_status = {
+        "status": database.status if database.is_ready else "unhealthy",
+        "checks": {
+            "warmup": "done" if startup_warmup.is_warm else "in_progress",
+            "database": dataclasses.asdict(database),
+        },
+    }
+
+    if not startup_warmup.is_warm:
+        # Keeps the load balancer away until the worker is warm
+        health_status["status"] = "warming_up"
+        raise HTTPException(status_code=503, detail=health_status)
+
+    if not database.is_ready:
         # Return 503 Service Unavailable for unhealthy status
-        raise HTTPException(status_code=503, detail=health_status) from None
+        raise HTTPException(status_code=503, detail=health_status)
 
     return health_status
@@ -1,11 +1,15 @@
 from .auction_vehicles_controller import router as auction_vehicles_router
 from .auctions_controller import router as auctions_router
+from .user_bids_controller import router as user_bids_router
 from .users_controller import router as users_router
 from .vehicle_manufacturers_controller import router as manufacturers_router
+from .vehicles_controller import router as vehicles_router
 
 __all__ = [
     "auctions_router",
     "auction_vehicles_router",
     "manufacturers_router",
+    "user_bids_router",
     "users_router",
+    "vehicles_router",
 ]
@@ -1,26 +1,89 @@
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import Response, StreamingResponse
 
-from contracts import AuctionVehicleResponse, AuctionVehiclesQuery, AuctionVehiclesResponse, AuctionVehicleUpdateRequest
-from core.dependency_injection import Container
-from services import AuctionVehiclesService
+from contracts import (
+    AuctionVehicleDetailResponse,
+    AuctionVehicleFacetsResponse,
+    AuctionVehicleResponse,
+    AuctionVehiclesBulkUpdateRequest,
+    AuctionVehiclesBulkUpdateResponse,
+    AuctionVehiclesExportQuery,
+    AuctionVehiclesFilter,
+    AuctionVehiclesIngestResponse,
+    AuctionVehiclesQuery,
+    AuctionVehiclesResponse,
+    AuctionVehicleUpdateRequest,
+)
+from core.dependency_injection import Container, provided
+from services import AuctionVehiclesIngestService, AuctionVehiclesService
 
 router = APIRouter(prefix="/api/v1")
 
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
 
 @router.get("/auction-vehicles/{auction_id}", status_code=200, operation_id="get_auction_vehicles_list")
-@inject
 async def get_auction_vehicles_list(
     auction_id: int,
     request: Annotated[AuctionVehiclesQuery, Query()],
-    service: Annotated[AuctionVehiclesService, Depends(Provide[Container.auction_vehicles_service])],
+    service: Annotated[AuctionVehiclesService, Depends(provided(Container.auction_vehicles_service))],
 ) -> AuctionVehiclesResponse:
 
     return await service.get_auction_vehicles_list(auction_id, request)
 
 
+@router.get(
+    "/auction-vehicles/{auction_id}/facets",
+    status_code=status.HTTP_200_OK,
+    operation_id="get_auction_vehicle_facets",
+)
+async def get_auction_vehicle_facets(
+    auction_id: int,
+    request: Annotated[AuctionVehiclesFilter, Query()],
+    service: Annotated[AuctionVehiclesService, Depends(provided(Container.auction_vehicles_service))],
+) -> AuctionVehicleFacetsResponse:
+    """Facets of the vehicles of an auction matching the filters, without the page and total."""
+    return await service.get_auction_vehicle_facets(auction_id, request)
+
+
+@router.get(
+    "/auction-vehicles/{auction_id}/export",
+    status_code=status.HTTP_200_OK,
+    operation_id="export_auction_vehicles",
+    response_class=StreamingResponse,
+    responses={200: {"content": {media_type: {} for media_type in EXPORT_MEDIA_TYPES.values()}}},
+)
+@inject
+async def export_auction_vehicles(
+    auction_id: int,
+    request: Annotated[AuctionVehiclesExportQuery, Query()],
+    service: Annotated[AuctionVehiclesService, Depends(Provide[Container.auction_vehicles_service])],
+) -> StreamingResponse:
+    """Stream every vehicle of an auction matching the filters as NDJSON or CSV."""
+    return StreamingResponse(
+        service.export_auction_vehicles(auction_id, request),
+        media_type=EXPORT_MEDIA_TYPES[request.format],
+        headers={"Content-Disposition": f'attachment; filename="auction-{auction_id}-vehicles.{request.format}"'},
+    )
+
+
+@router.get(
+    "/auction-vehicles/{vehicle_id}/detail",
+    status_code=status.HTTP_200_OK,
+    operation_id="get_auction_vehicle_detail",
+    response_model=AuctionVehicleDetailResponse,
+)
+async def get_auction_vehicle_detail(
+    vehicle_id: int,
+    service: Annotated[AuctionVehiclesService, Depends(provided(Container.auction_vehicles_service))],
+) -> Response:
+    """Full record of a vehicle, served from the detail cache as pre-serialized JSON."""
+    return Response(await service.get_auction_vehicle_detail(vehicle_id), media_type="application/json")
+
+
 @router.put("/auction-vehicles/{vehicle_id}", status_code=200, operation_id="update_auction_vehicle")
 @inject
 async def update_auction_vehicle(
@@ -29,3 +92,39 @@ async def update_auction_vehicle(
     service: Annotated[AuctionVehiclesService, Depends(Provide[Container.auction_vehicles_service])],
 ) -> AuctionVehicleResponse:
     return await service.update_auction_vehicle(vehicle_id, request)
+
+
+@router.post(
+    "/auction-vehicles/{auction_id}/bulk-update",
+    status_code=status.HTTP_200_OK,
+    operation_id="bulk_update_auction_vehicles",
+)
+@inject
+async def bulk_update_auction_vehicles(
+    auction_id: int,
+    request: AuctionVehiclesBulkUpdateRequest,
+    service: Annotated[AuctionVehiclesService, Depends(Provide[Container.auction_vehicles_service])],
+) -> AuctionVehiclesBulkUpdateResponse:
+    """Set the same fields on a list of vehicles of an auction, or on every vehicle matching a filter."""
+    return await service.bulk_update_auction_vehicles(auction_id, request)
+
+
+@router.post(
+    "/auction-vehicles/{auction_id}/bulk",
+    status_code=status.HTTP_200_OK,
+    operation_id="ingest_auction_vehicles",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"$ref": "#/components/schemas/AuctionVehicleIngestRow"}}},
+        }
+    },
+)
+@inject
+async def ingest_auction_vehicles(
+    auction_id: int,
+    request: Request,
+    service: Annotated[AuctionVehiclesIngestService, Depends(Provide[Container.auction_vehicles_ingest_service])],
+) -> AuctionVehiclesIngestResponse:
+    """Upsert vehicles of an auction feed from a streamed NDJSON body, one AuctionVehicleIngestRow per line."""
+    return await service.ingest(auction_id, request.stream())
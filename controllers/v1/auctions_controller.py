@@ -2,10 +2,11 @@ from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, Query, status
+from fastapi.responses import StreamingResponse
 
 from contracts import AuctionResponse, AuctionsListQuery, AuctionsListResponse
 from core.dependency_injection import Container
-from services import AuctionsService
+from services import AuctionsService, LiveFeedHub
 
 router = APIRouter(prefix="/api/v1")
 
@@ -26,3 +27,29 @@ async def get_auction(
     service: Annotated[AuctionsService, Depends(Provide[Container.auctions_service])],
 ) -> AuctionResponse:
     return await service.get_auction(auction_id)
+
+
+@router.get(
+    "/auctions/{auction_id}/events",
+    status_code=status.HTTP_200_OK,
+    operation_id="get_auction_events",
+    response_class=StreamingResponse,
+    responses={200: {"content": {"text/event-stream": {}}}},
+)
+@inject
+async def get_auction_events(
+    auction_id: int,
+    hub: Annotated[LiveFeedHub, Depends(Provide[Container.live_feed_hub])],
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of bids (`bid`), vehicle changes (`vehicle_updated`), soft-close extensions
+    (`auction_extended`) and the close (`auction_closed`) of an auction.
+
+    A client that falls behind receives a `dropped` event and the stream ends, it should reload the auction
+    and reconnect.
+    """
+    return StreamingResponse(
+        hub.stream(auction_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
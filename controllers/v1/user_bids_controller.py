@@ -0,0 +1,23 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, status
+
+from contracts import PlaceBidRequest, PlaceBidResponse
+from core.dependency_injection import Container, provided
+from services import UserBidsService
+
+router = APIRouter(prefix="/api/v1")
+
+
+@router.post(
+    "/auction-vehicles/{vehicle_id}/bids",
+    status_code=status.HTTP_201_CREATED,
+    operation_id="place_bid",
+    responses={status.HTTP_409_CONFLICT: {"description": "Bid is too low, was outbid or bidding is closed"}},
+)
+async def place_bid(
+    vehicle_id: int,
+    request: PlaceBidRequest,
+    service: Annotated[UserBidsService, Depends(provided(Container.user_bids_service))],
+) -> PlaceBidResponse:
+    return await service.place_bid(vehicle_id, request)
@@ -1,3 +1,4 @@
+import uuid
 from typing import Annotated
 
 from dependency_injector.wiring import Provide, inject
@@ -23,9 +24,8 @@ async def get_user(
 @router.put("/users/{user_id}", status_code=status.HTTP_200_OK, operation_id="update_user")
 @inject
 async def update_user(
-    user_id: int,
+    user_id: uuid.UUID,
     request: UserRegistrationUpdateRequest,
     service: Annotated[UsersService, Depends(Provide[Container.users_service])],
 ) -> UserRegistrationResponse:
-    existing_user = await service.users_repository.get_by_id(user_id)
-    return await service.update_user(existing_user, request)
+    return await service.update_user(user_id, request)
@@ -0,0 +1,34 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Path, Query, status
+
+from contracts import VehicleSearchQuery, VehicleSearchResponse, VehicleVinHistoryResponse
+from core.dependency_injection import Container, provided
+from services import AuctionVehiclesService
+
+router = APIRouter(prefix="/api/v1")
+
+
+@router.get("/vehicles/search", status_code=status.HTTP_200_OK, operation_id="search_vehicles")
+async def search_vehicles(
+    request: Annotated[VehicleSearchQuery, Query()],
+    service: Annotated[AuctionVehiclesService, Depends(provided(Container.auction_vehicles_service))],
+) -> VehicleSearchResponse:
+    """Vehicles of every open auction matching the filters, with the filters and facets of auction vehicle lists."""
+    return await service.search_vehicles(request)
+
+
+@router.get("/vehicles/by-vin/{vin}", status_code=status.HTTP_200_OK, operation_id="get_vehicle_vin_history")
+async def get_vehicle_vin_history(
+    vin: Annotated[
+        str,
+        Path(
+            description="Full VIN, or its first 8 to 16 characters to list every matching VIN",
+            pattern=r"^[A-HJ-NPR-Za-hj-npr-z0-9]{8,17}$",
+        ),
+    ],
+    service: Annotated[AuctionVehiclesService, Depends(provided(Container.auction_vehicles_service))],
+    limit: Annotated[int, Query(ge=1, le=200, description="Maximum number of appearances")] = 50,
+) -> VehicleVinHistoryResponse:
+    """Auction appearances of a vehicle with their starting prices and results, latest first."""
+    return await service.get_vin_history(vin, limit)
@@ -1,6 +1,22 @@
-from .config import settings
-from .dependency_injection import Container
-from .logging import UVICORN_LOGGING_CONFIG, logger
+import importlib
+
+# Exports are resolved lazily, so importing e.g. `core.config` does not build the DI container and import every
+# service and repository with it
+_EXPORTS = {
+    "settings": ".config",
+    "Container": ".dependency_injection",
+    "logger": ".logging",
+    "configure_logging": ".logging",
+    "UVICORN_LOGGING_CONFIG": ".logging",
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+
 
 # Type annotations for exports
-__all__ = ["settings", "logger", "Container", "UVICORN_LOGGING_CONFIG"]
+__all__ = ["settings", "logger", "configure_logging", "Container", "UVICORN_LOGGING_CONFIG"]
@@ -1,7 +1,8 @@
 import os
+from typing import Literal
 from urllib.parse import quote_plus
 
-from pydantic import ConfigDict, computed_field
+from pydantic import ConfigDict, computed_field, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -29,9 +30,115 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = "Autobid API"
     PROJECT_VERSION: str = "1.0.0"
 
+    # Production server settings, see server.py
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int | None = None  # One per available CPU when unset
+    SERVER_MAX_REQUESTS: int | None = 10_000  # Requests a worker serves before it is replaced
+    SERVER_GRACEFUL_SHUTDOWN_SECONDS: int = 30
+    SERVER_KEEP_ALIVE_SECONDS: int = 5
+
+    # Database pool settings, per worker process
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    # Connections all workers may open together, pools shrink to fit it. Keep it below max_connections minus
+    # the connections of migrations, scripts and administration. No limit when unset.
+    DB_CONNECTION_BUDGET: int | None = None
+
+    # Startup warm-up settings, /ready reports not ready until the warm-up finished
+    WARMUP_ENABLED: bool = True
+
+    # Database health monitor settings, /ready is served from the last check
+    HEALTH_CHECK_INTERVAL_SECONDS: float = 5.0
+    HEALTH_CHECK_TIMEOUT_SECONDS: float = 2.0
+    HEALTH_CHECK_FAILURE_THRESHOLD: int = 3
+    HEALTH_CHECK_SLOW_PING_MS: float = 100.0
+    HEALTH_CHECK_POOL_SATURATION: float = 0.9
+
+    # Pagination totals: "exact" counts every row, "capped" stops counting at COUNT_THRESHOLD and reports it as a
+    # lower bound, "estimate" uses the planner estimate above COUNT_THRESHOLD for unfiltered queries
+    COUNT_STRATEGY: Literal["exact", "capped", "estimate"] = "capped"
+    COUNT_THRESHOLD: int = 10_000
+
+    # Catalog and ingestion settings
+    CATALOG_CACHE_TTL_SECONDS: int = 300
+    INGEST_BATCH_SIZE: int = 1000
+    BULK_UPDATE_BATCH_SIZE: int = 1000
+    CATALOG_SEARCH_REFRESH_BATCH_SIZE: int = 1000
+    VEHICLE_DETAIL_CACHE_SIZE: int = 10_000
+    VEHICLE_DETAIL_CACHE_TTL_SECONDS: int = 300
+
+    # Bidding settings
+    BID_MIN_INCREMENT: int = 100
+    BID_PRICE_CACHE_SIZE: int = 100_000
+    BID_PRICE_CACHE_TTL_SECONDS: int = 30
+    # A bid within the window before the end pushes the end to the extension from now. An extension longer
+    # than the window means an auction is extended at most once per (extension - window) of bidding.
+    BID_SOFT_CLOSE_WINDOW_SECONDS: int = 60
+    BID_SOFT_CLOSE_EXTENSION_SECONDS: int = 120
+
+    # Auction scheduler settings
+    AUCTION_SCHEDULER_ENABLED: bool = True
+    AUCTION_SCHEDULER_RESYNC_SECONDS: int = 3600
+    AUCTION_SCHEDULER_LEADER_RETRY_SECONDS: int = 15
+
+    # Live feed settings
+    LIVE_FEED_ENABLED: bool = True
+    LIVE_FEED_QUEUE_SIZE: int = 100
+    LIVE_FEED_HEARTBEAT_SECONDS: float = 15.0
+
+    # Profiling settings
+    PROFILING_ENABLED: bool = False
+    PROFILING_SECRET: str | None = None
+    PROFILING_SAMPLE_RATE: float = 0.01
+    PROFILING_INTERVAL_MS: float = 5.0
+    PROFILING_BUFFER_SIZE: int = 50
+    PROFILING_RETENTION: str = "recent"  # "recent" or "slowest"
+    PROFILING_PATH_PREFIX: str = "/api/v1"
+
     # Nested settings - will be populated in create_settings
     postgres: PostgresSettings
 
+    @computed_field
+    @property
+    def server_workers(self) -> int:
+        return self.SERVER_WORKERS or os.process_cpu_count() or 1
+
+    @computed_field
+    @property
+    def db_dedicated_connections(self) -> int:
+        """Connections every worker opens outside of the pool: the health check, the events listener and the
+        scheduler election."""
+        return 1 + int(self.LIVE_FEED_ENABLED) + int(self.AUCTION_SCHEDULER_ENABLED)
+
+    @computed_field
+    @property
+    def db_pool_size(self) -> int:
+        if self.DB_CONNECTION_BUDGET is None:
+            return self.DB_POOL_SIZE
+
+        return min(self.DB_POOL_SIZE, self._db_pool_connections_per_worker())
+
+    @computed_field
+    @property
+    def db_max_overflow(self) -> int:
+        if self.DB_CONNECTION_BUDGET is None:
+            return self.DB_MAX_OVERFLOW
+
+        return min(self.DB_MAX_OVERFLOW, self._db_pool_connections_per_worker() - self.db_pool_size)
+
+    def _db_pool_connections_per_worker(self) -> int:
+        return self.DB_CONNECTION_BUDGET // self.server_workers - self.db_dedicated_connections
+
+    @model_validator(mode="after")
+    def check_db_connection_budget(self) -> "Settings":
+        if self.DB_CONNECTION_BUDGET is not None and self._db_pool_connections_per_worker() < 1:
+            raise ValueError(
+                f"DB_CONNECTION_BUDGET={self.DB_CONNECTION_BUDGET} leaves no pool connection to each of "
+                f"{self.server_workers} workers, raise it or lower SERVER_WORKERS"
+            )
+        return self
+
     @computed_field
     @property
     def is_test(self) -> bool:
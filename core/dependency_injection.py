@@ -1,22 +1,40 @@
-from dependency_injector import containers, providers
+from collections.abc import Awaitable, Callable
+from typing import Any
 
+from dependency_injector import containers, providers
+from fastapi import Request
 
 from database.database import Database
 from repositories import (
+    AuctionEventsRepository,
     AuctionsRepository,
     AuctionVehiclesRepository,
+    UserBidsRepository,
     UsersRepository,
     VehicleManufacturersRepository,
     VehicleModelsRepository,
+    VehicleVinHistoryRepository,
 )
 from services import (
+    AuctionEventsListener,
+    AuctionLifecycleScheduler,
     AuctionsService,
+    AuctionVehiclesIngestService,
     AuctionVehiclesService,
+    BidPriceCache,
+    CatalogSearchRefresher,
+    DatabaseHealthMonitor,
+    LiveFeedHub,
+    StartupWarmup,
+    UserBidsService,
     UsersService,
+    VehicleCatalogCache,
+    VehicleDetailCache,
     VehicleManufacturersService,
 )
 
 from .config import settings
+from .profiling import RequestProfiler
 
 
 class Container(containers.DeclarativeContainer):
@@ -28,54 +46,207 @@ class Container(containers.DeclarativeContainer):
         Database,
         db_url=config.postgres.DATABASE_URL,
         schema=config.postgres.POSTGRES_SCHEMA,
+        pool_size=config.db_pool_size,
+        max_overflow=config.db_max_overflow,
     )
 
+    request_profiler = providers.Singleton(
+        RequestProfiler,
+        enabled=config.PROFILING_ENABLED,
+        secret=config.PROFILING_SECRET,
+        sample_rate=config.PROFILING_SAMPLE_RATE,
+        interval_ms=config.PROFILING_INTERVAL_MS,
+        buffer_size=config.PROFILING_BUFFER_SIZE,
+        retention=config.PROFILING_RETENTION,
+        path_prefix=config.PROFILING_PATH_PREFIX,
+    )
+
+    # Repositories and services are stateless: they hold collaborators and settings only, never request or
+    # session state, so a single instance of each serves every request. Keep it that way when adding fields.
+
     # Repositories
-    auctions_repository = providers.Factory(
+    auctions_repository = providers.Singleton(
         AuctionsRepository,
         session_factory=db.provided.session_factory,
     )
-    auction_vehicles_repository = providers.Factory(
+    auction_vehicles_repository = providers.Singleton(
         AuctionVehiclesRepository,
         session_factory=db.provided.session_factory,
     )
-    vehicle_manufacturers_repository = providers.Factory(
+    vehicle_manufacturers_repository = providers.Singleton(
         VehicleManufacturersRepository,
         session_factory=db.provided.session_factory,
     )
-    vehicle_models_repository = providers.Factory(
+    vehicle_models_repository = providers.Singleton(
         VehicleModelsRepository,
         session_factory=db.provided.session_factory,
     )
-    users_repository = providers.Factory(
+    users_repository = providers.Singleton(
         UsersRepository,
         session_factory=db.provided.session_factory,
     )
+    user_bids_repository = providers.Singleton(
+        UserBidsRepository,
+        session_factory=db.provided.session_factory,
+    )
+    auction_events_repository = providers.Singleton(
+        AuctionEventsRepository,
+        session_factory=db.provided.session_factory,
+    )
+    vehicle_vin_history_repository = providers.Singleton(
+        VehicleVinHistoryRepository,
+        session_factory=db.provided.session_factory,
+    )
+
+    # Caches
+    vehicle_catalog_cache = providers.Singleton(
+        VehicleCatalogCache,
+        manufacturers_repository=vehicle_manufacturers_repository,
+        models_repository=vehicle_models_repository,
+        ttl_seconds=config.CATALOG_CACHE_TTL_SECONDS,
+    )
+    bid_price_cache = providers.Singleton(
+        BidPriceCache,
+        user_bids_repository=user_bids_repository,
+        maxsize=config.BID_PRICE_CACHE_SIZE,
+        ttl_seconds=config.BID_PRICE_CACHE_TTL_SECONDS,
+    )
+    vehicle_detail_cache = providers.Singleton(
+        VehicleDetailCache,
+        auction_vehicles_repository=auction_vehicles_repository,
+        maxsize=config.VEHICLE_DETAIL_CACHE_SIZE,
+        ttl_seconds=config.VEHICLE_DETAIL_CACHE_TTL_SECONDS,
+    )
+
+    # Live feed
+    live_feed_hub = providers.Singleton(
+        LiveFeedHub,
+        queue_size=config.LIVE_FEED_QUEUE_SIZE,
+        heartbeat_seconds=config.LIVE_FEED_HEARTBEAT_SECONDS,
+    )
+
+    # Auction lifecycle
+    auction_scheduler = providers.Singleton(
+        AuctionLifecycleScheduler,
+        auctions_repository=auctions_repository,
+        auction_vehicles_repository=auction_vehicles_repository,
+        auction_events_repository=auction_events_repository,
+        database_url=config.postgres.DATABASE_URL,
+        enabled=config.AUCTION_SCHEDULER_ENABLED,
+        resync_seconds=config.AUCTION_SCHEDULER_RESYNC_SECONDS,
+        leader_retry_seconds=config.AUCTION_SCHEDULER_LEADER_RETRY_SECONDS,
+    )
+
+    # Delivers events NOTIFY'd by every worker to the in-process consumers
+    auction_events_listener = providers.Singleton(
+        AuctionEventsListener,
+        database_url=config.postgres.DATABASE_URL,
+        handlers=providers.List(
+            live_feed_hub.provided.handle_event,
+            bid_price_cache.provided.handle_event,
+            vehicle_detail_cache.provided.handle_event,
+            auction_scheduler.provided.handle_event,
+        ),
+        enabled=config.LIVE_FEED_ENABLED,
+    )
 
     # Services
-    auctions_service = providers.Factory(
+    auctions_service = providers.Singleton(
         AuctionsService,
         auctions_repository=auctions_repository,
         auction_vehicles_repository=auction_vehicles_repository,
+        count_strategy=config.COUNT_STRATEGY,
+        count_threshold=config.COUNT_THRESHOLD,
     )
-    auction_vehicles_service = providers.Factory(
+    auction_vehicles_service = providers.Singleton(
         AuctionVehiclesService,
         auction_vehicles_repository=auction_vehicles_repository,
         vehicle_manufacturers_repository=vehicle_manufacturers_repository,
         vehicle_models_repository=vehicle_models_repository,
+        user_bids_repository=user_bids_repository,
+        auction_events_repository=auction_events_repository,
+        vehicle_vin_history_repository=vehicle_vin_history_repository,
+        vehicle_detail_cache=vehicle_detail_cache,
+        bid_price_cache=bid_price_cache,
+        bulk_update_batch_size=config.BULK_UPDATE_BATCH_SIZE,
+        count_strategy=config.COUNT_STRATEGY,
+        count_threshold=config.COUNT_THRESHOLD,
+    )
+    auction_vehicles_ingest_service = providers.Singleton(
+        AuctionVehiclesIngestService,
+        auction_vehicles_repository=auction_vehicles_repository,
+        auctions_repository=auctions_repository,
+        auction_events_repository=auction_events_repository,
+        catalog_cache=vehicle_catalog_cache,
+        batch_size=config.INGEST_BATCH_SIZE,
+    )
+    catalog_search_refresher = providers.Singleton(
+        CatalogSearchRefresher,
+        auction_vehicles_repository=auction_vehicles_repository,
+        batch_size=config.CATALOG_SEARCH_REFRESH_BATCH_SIZE,
     )
-    vehicle_manufacturer_service = providers.Factory(
+    vehicle_manufacturer_service = providers.Singleton(
         VehicleManufacturersService,
         manufacturers_repository=vehicle_manufacturers_repository,
         models_repository=vehicle_models_repository,
+        catalog_cache=vehicle_catalog_cache,
+        vehicle_detail_cache=vehicle_detail_cache,
+        auction_events_repository=auction_events_repository,
+        catalog_search_refresher=catalog_search_refresher,
     )
-    users_service = providers.Factory(
+    users_service = providers.Singleton(
         UsersService,
         users_repository=users_repository,
     )
+    user_bids_service = providers.Singleton(
+        UserBidsService,
+        user_bids_repository=user_bids_repository,
+        bid_price_cache=bid_price_cache,
+        vehicle_detail_cache=vehicle_detail_cache,
+        min_increment=config.BID_MIN_INCREMENT,
+        soft_close_window_seconds=config.BID_SOFT_CLOSE_WINDOW_SECONDS,
+        soft_close_extension_seconds=config.BID_SOFT_CLOSE_EXTENSION_SECONDS,
+    )
+
+    # Startup
+    startup_warmup = providers.Singleton(
+        StartupWarmup,
+        db=db,
+        auctions_service=auctions_service,
+        auction_vehicles_service=auction_vehicles_service,
+        vehicle_manufacturer_service=vehicle_manufacturer_service,
+        catalog_cache=vehicle_catalog_cache,
+        connections=config.db_pool_size,
+        enabled=config.WARMUP_ENABLED,
+    )
+    database_health_monitor = providers.Singleton(
+        DatabaseHealthMonitor,
+        db=db,
+        database_url=config.postgres.DATABASE_URL,
+        interval_seconds=config.HEALTH_CHECK_INTERVAL_SECONDS,
+        timeout_seconds=config.HEALTH_CHECK_TIMEOUT_SECONDS,
+        failure_threshold=config.HEALTH_CHECK_FAILURE_THRESHOLD,
+        slow_ping_ms=config.HEALTH_CHECK_SLOW_PING_MS,
+        pool_saturation_threshold=config.HEALTH_CHECK_POOL_SATURATION,
+    )
 
 
 def create_container(app_settings=settings):
     container = Container()
     container.config.from_pydantic(app_settings)
     return container
+
+
+def provided(provider: providers.Provider) -> Callable[[Request], Awaitable[Any]]:
+    """
+    FastAPI dependency returning a singleton from the app's container, a fast path for hot endpoints.
+
+    Skips the `@inject` wrapper that `Depends(Provide[...])` runs on every request to patch the arguments, the
+    provider is looked up once here.
+    """
+    name = next(name for name, candidate in Container.providers.items() if candidate is provider)
+
+    async def dependency(request: Request) -> Any:
+        return getattr(request.app.container, name)()
+
+    return dependency
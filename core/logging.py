@@ -92,8 +92,10 @@ UVICORN_LOGGING_CONFIG: dict[str, Any] = {
     },
 }
 
-# Configure logging
-logging.config.dictConfig(UVICORN_LOGGING_CONFIG)
-logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
-
 logger: Logger = logging.getLogger(__name__)
+
+
+def configure_logging() -> None:
+    """Install the logging configuration, called once by every entry point (API, scripts, benchmarks)."""
+    logging.config.dictConfig(UVICORN_LOGGING_CONFIG)
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
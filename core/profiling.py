@@ -0,0 +1,231 @@
+import hashlib
+import heapq
+import hmac
+import itertools
+import marshal
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from types import FrameType
+
+from starlette.requests import Request
+
+PROFILE_HEADER = "X-Profile"
+SIGNATURE_MAX_AGE_SECONDS = 300
+
+FrameKey = tuple[str, int, str]
+
+
+def _frame_key(frame: FrameType) -> FrameKey:
+    code = frame.f_code
+    return code.co_filename, code.co_firstlineno, code.co_name
+
+
+class SamplingProfiler:
+    """
+    Low-overhead wall-clock sampler for a single thread.
+
+    A daemon thread wakes every ``interval`` seconds and records the current stack of the target thread
+    (the event loop thread). Since coroutines of concurrent requests share that thread, samples taken while
+    other requests are running are attributed to the profiled request as well.
+    """
+
+    def __init__(self, interval: float, thread_id: int | None = None):
+        self.interval = interval
+        self.thread_id = thread_id or threading.get_ident()
+        self.stacks: Counter[tuple[FrameKey, ...]] = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                stack.append(_frame_key(frame))
+                frame = frame.f_back
+            if stack:
+                # Root first, as expected by the collapsed-stack format
+                self.stacks[tuple(reversed(stack))] += 1
+
+
+@dataclass
+class ProfileRecord:
+    id: str
+    method: str
+    path: str
+    started_at: datetime
+    interval: float
+    duration_ms: float = 0.0
+    status_code: int | None = None
+    stacks: Counter[tuple[FrameKey, ...]] = field(default_factory=Counter)
+
+    @property
+    def sample_count(self) -> int:
+        return sum(self.stacks.values())
+
+    def summary(self) -> dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "started_at": self.started_at.isoformat(),
+            "duration_ms": round(self.duration_ms, 2),
+            "status_code": self.status_code,
+            "samples": self.sample_count,
+        }
+
+    def to_collapsed(self) -> bytes:
+        """Render samples in the collapsed-stack format understood by flamegraph.pl and speedscope."""
+        lines = [
+            ";".join(f"{name} ({filename}:{lineno})" for filename, lineno, name in stack) + f" {count}"
+            for stack, count in self.stacks.items()
+        ]
+        return ("\n".join(lines) + "\n").encode()
+
+    def to_pstats(self) -> bytes:
+        """
+        Render samples as a marshalled ``pstats`` dump loadable with ``pstats.Stats(path)`` or snakeviz.
+
+        Times are estimated from sample counts: every sample accounts for one profiler interval.
+        """
+        self_samples: Counter[FrameKey] = Counter()
+        total_samples: Counter[FrameKey] = Counter()
+        callers: dict[FrameKey, Counter[FrameKey]] = {}
+
+        for stack, count in self.stacks.items():
+            self_samples[stack[-1]] += count
+            # Count recursive frames only once per stack for inclusive time
+            for func in set(stack):
+                total_samples[func] += count
+            for caller, callee in itertools.pairwise(stack):
+                callers.setdefault(callee, Counter())[caller] += count
+
+        stats = {}
+        for func, total in total_samples.items():
+            tt = self_samples[func] * self.interval
+            ct = total * self.interval
+            func_callers = {
+                caller: (calls, calls, calls * self.interval, calls * self.interval)
+                for caller, calls in callers.get(func, {}).items()
+            }
+            stats[func] = (total, total, tt, ct, func_callers)
+
+        return marshal.dumps(stats)
+
+
+class ProfileStore:
+    """Bounded ring buffer keeping either the most recent or the slowest profiles."""
+
+    def __init__(self, capacity: int, retention: str = "recent"):
+        if retention not in ("recent", "slowest"):
+            raise ValueError("retention must be either 'recent' or 'slowest'.")
+
+        self.capacity = capacity
+        self.retention = retention
+        self._recent: deque[ProfileRecord] = deque(maxlen=capacity)
+        self._slowest: list[tuple[float, int, ProfileRecord]] = []
+        self._counter = itertools.count()
+
+    def add(self, record: ProfileRecord) -> None:
+        if self.retention == "recent":
+            self._recent.append(record)
+            return
+
+        entry = (record.duration_ms, next(self._counter), record)
+        if len(self._slowest) < self.capacity:
+            heapq.heappush(self._slowest, entry)
+        elif record.duration_ms > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def list(self) -> list[ProfileRecord]:
+        if self.retention == "recent":
+            return list(reversed(self._recent))
+        return [record for _, _, record in sorted(self._slowest, reverse=True)]
+
+    def get(self, profile_id: str) -> ProfileRecord | None:
+        return next((record for record in self.list() if record.id == profile_id), None)
+
+
+class RequestProfiler:
+    """Decides which requests get profiled and keeps the resulting profiles."""
+
+    def __init__(
+        self,
+        enabled: bool,
+        secret: str | None,
+        sample_rate: float,
+        interval_ms: float,
+        buffer_size: int,
+        retention: str,
+        path_prefix: str,
+    ):
+        self.enabled = enabled
+        self.secret = secret
+        self.sample_rate = sample_rate
+        self.interval = interval_ms / 1000
+        self.path_prefix = path_prefix
+        self.store = ProfileStore(buffer_size, retention)
+
+    def sign(self, method: str, path: str, timestamp: int | None = None) -> str:
+        """Build an ``X-Profile`` header value for the given request, valid for a few minutes."""
+        if not self.secret:
+            raise ValueError("Profiling secret is not configured.")
+
+        timestamp = timestamp or int(time.time())
+        message = f"{timestamp}:{method.upper()} {path}".encode()
+        signature = hmac.new(self.secret.encode(), message, hashlib.sha256).hexdigest()
+        return f"{timestamp}:{signature}"
+
+    def is_signed(self, request: Request) -> bool:
+        header = request.headers.get(PROFILE_HEADER)
+        if not header or not self.secret:
+            return False
+
+        timestamp, _, _ = header.partition(":")
+        if not timestamp.isdigit() or abs(time.time() - int(timestamp)) > SIGNATURE_MAX_AGE_SECONDS:
+            return False
+
+        expected = self.sign(request.method, request.url.path, int(timestamp))
+        return hmac.compare_digest(header, expected)
+
+    def should_profile(self, request: Request) -> bool:
+        if not request.url.path.startswith(self.path_prefix):
+            return False
+        if self.is_signed(request):
+            return True
+        return self.enabled and random.random() < self.sample_rate
+
+    @contextmanager
+    def profile(self, request: Request) -> Iterator[ProfileRecord]:
+        record = ProfileRecord(
+            id=uuid.uuid4().hex,
+            method=request.method,
+            path=request.url.path,
+            started_at=datetime.now(UTC),
+            interval=self.interval,
+        )
+        sampler = SamplingProfiler(self.interval)
+        start_time = time.perf_counter()
+        sampler.start()
+        try:
+            yield record
+        finally:
+            sampler.stop()
+            record.duration_ms = (time.perf_counter() - start_time) * 1000
+            record.stacks = sampler.stacks
+            self.store.add(record)
@@ -1,9 +1,11 @@
+import asyncio
 from asyncio import current_task
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import cached_property
 from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import AsyncSession, async_scoped_session, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.schema import CreateSchema
@@ -19,13 +21,18 @@ def _get_current_task_id() -> Any:
 
 
 class Database:
-    def __init__(self, db_url: str, schema: str):
+    def __init__(self, db_url: str, schema: str, pool_size: int = 5, max_overflow: int = 10):
+        self.db_url = db_url
         self.schema = schema
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
         async_engine = create_async_engine(
             db_url,
             echo=False,
             future=True,
             pool_pre_ping=True,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
             # pool_recycle=,  # TODO
         )
         self.async_engine = async_engine.execution_options(schema_translate_map={None: self.schema})
@@ -37,14 +44,29 @@ class Database:
             expire_on_commit=False,
         )
 
+    @cached_property
+    def engine(self) -> Engine:
+        # Only scripts use the sync engine, the API never pays for creating it and importing psycopg2
         engine = create_engine(
-            db_url.replace("postgresql+asyncpg://", "postgresql://"),
+            self.db_url.replace("postgresql+asyncpg://", "postgresql://"),
             echo=False,
             future=True,
         )
+        return engine.execution_options(schema_translate_map={None: self.schema})
 
-        self.engine = engine.execution_options(schema_translate_map={None: self.schema})
-        self.sync_session_factory = sessionmaker(self.engine, class_=Session, autoflush=True, expire_on_commit=False)
+    @cached_property
+    def sync_session_factory(self) -> sessionmaker[Session]:
+        return sessionmaker(self.engine, class_=Session, autoflush=True, expire_on_commit=False)
+
+    async def open_pool(self, connections: int | None = None) -> None:
+        """Open pool connections up front, so the first requests do not pay for connecting."""
+        opened = await asyncio.gather(*[self.async_engine.connect() for _ in range(connections or self.pool_size)])
+        for connection in opened:
+            await connection.close()
+
+    def pool_saturation(self) -> float:
+        """Share of the pool capacity, overflow included, checked out right now."""
+        return self.async_engine.pool.checkedout() / (self.pool_size + self.max_overflow)
 
     async def init_db(self) -> None:
         async with self.async_engine.begin() as conn:
@@ -53,7 +75,8 @@ class Database:
 
     async def close_db(self) -> None:
         await self.async_engine.dispose()
-        self.engine.dispose()
+        if "engine" in self.__dict__:
+            self.engine.dispose()
 
     @asynccontextmanager
     async def session_factory(self) -> AsyncGenerator[AsyncSession, None]:
@@ -1,8 +1,10 @@
 from .base import AppError
-from .types import NotFoundError, UnauthorizedError
+from .types import ConflictError, NotFoundError, UnauthorizedError, VersionConflictError
 
 __all__ = [
     "AppError",
+    "ConflictError",
     "NotFoundError",
     "UnauthorizedError",
+    "VersionConflictError",
 ]
@@ -14,3 +14,19 @@ class UnauthorizedError(AppError):
         super().__init__(
             message="You are not authorized to perform this action.",
         )
+
+
+class ConflictError(AppError):
+    def __init__(self, message: str, details: str | None = None):
+        super().__init__(
+            message=message,
+            payload={"details": details} if details else None,
+        )
+
+
+class VersionConflictError(ConflictError):
+    def __init__(self, id: str | int, obj_class: str, version: int, current_version: int):
+        super().__init__(
+            message=f"{obj_class} with id {id} was changed concurrently.",
+            details=f"Expected version {version}, current version is {current_version}.",
+        )
@@ -1,30 +1,49 @@
 from contextlib import asynccontextmanager
 
-import uvicorn
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 
-from contracts import AuctionsListQuery, AuctionVehiclesQuery, PaginationParams
+from contracts import (
+    AuctionsListQuery,
+    AuctionVehicleIngestRow,
+    AuctionVehiclesQuery,
+    PaginationParams,
+    VehicleSearchQuery,
+)
 from controllers import (
+    admin_router,
     auction_vehicles_router,
     auctions_router,
     health_router,
     manufacturers_router,
+    user_bids_router,
     users_router,
+    vehicles_router,
 )
-from core import UVICORN_LOGGING_CONFIG, logger, settings
+from core import UVICORN_LOGGING_CONFIG, configure_logging, logger, settings
 from core.dependency_injection import create_container
-from middlewares import ExceptionMiddleware, RequestMiddleware, validation_exception_handler
+from middlewares import ExceptionMiddleware, ProfilingMiddleware, RequestMiddleware, validation_exception_handler
+
+configure_logging()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting the application with Uvicorn, environment: %s", settings.ENVIRONMENT)
+    await app.container.startup_warmup().start()
+    await app.container.database_health_monitor().start()
+    await app.container.auction_events_listener().start()
+    await app.container.auction_scheduler().start()
 
     yield
 
+    await app.container.auction_scheduler().stop()
+    await app.container.catalog_search_refresher().stop()
+    await app.container.auction_events_listener().stop()
+    await app.container.database_health_monitor().stop()
+    await app.container.startup_warmup().stop()
     await app.container.db().close_db()
 
 
@@ -46,6 +65,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(ProfilingMiddleware)
 app.add_middleware(ExceptionMiddleware)
 app.add_middleware(RequestMiddleware)
 
@@ -54,10 +74,13 @@ app.add_exception_handler(RequestValidationError, validation_exception_handler)
 
 # Include API routers
 app.include_router(health_router)
+app.include_router(admin_router)
 app.include_router(auctions_router)
 app.include_router(auction_vehicles_router)
 app.include_router(manufacturers_router)
+app.include_router(user_bids_router)
 app.include_router(users_router)
+app.include_router(vehicles_router)
 
 
 def custom_openapi():
@@ -74,6 +97,8 @@ def custom_openapi():
     openapi_schema["components"]["schemas"]["PaginationParams"] = PaginationParams.model_json_schema()
     openapi_schema["components"]["schemas"]["AuctionsListQuery"] = AuctionsListQuery.model_json_schema()
     openapi_schema["components"]["schemas"]["AuctionVehiclesQuery"] = AuctionVehiclesQuery.model_json_schema()
+    openapi_schema["components"]["schemas"]["VehicleSearchQuery"] = VehicleSearchQuery.model_json_schema()
+    openapi_schema["components"]["schemas"]["AuctionVehicleIngestRow"] = AuctionVehicleIngestRow.model_json_schema()
 
     app.openapi_schema = openapi_schema
     return app.openapi_schema
@@ -93,6 +118,8 @@ async def root():
 
 
 if __name__ == "__main__":
+    import uvicorn
+
     uvicorn.run(
         "main_api:app",
         reload=True,
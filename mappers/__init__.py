@@ -1,11 +1,13 @@
 from .auction_mapper import AuctionMapper
 from .auction_vehicle_mapper import AuctionVehicleMapper
+from .user_bid_mapper import UserBidMapper
 from .user_mapper import UserMapper
 from .vehicle_manufacturer_mapper import VehicleManufacturerMapper, VehicleModelMapper
 
 __all__ = [
     "AuctionMapper",
     "AuctionVehicleMapper",
+    "UserBidMapper",
     "UserMapper",
     "VehicleManufacturerMapper",
     "VehicleModelMapper",
@@ -14,7 +14,8 @@ class AuctionMapper:
             country=auction.country,
             car_count=car_count,
             close_date=auction.end_datetime,
-            status='active' if auction.end_datetime > datetime.now(UTC) else 'closed',
+            # The scheduler may close an auction a moment after its end, until then it is closed by time
+            status='closed' if auction.closed_at or auction.end_datetime <= datetime.now(UTC) else 'active',
             car_preview=car_preview,
         )
 
@@ -1,6 +1,22 @@
-from contracts import AuctionVehicle, AuctionVehicleFacet, ClientBid
+from contracts import (
+    AuctionVehicle,
+    AuctionVehicleDetail,
+    AuctionVehicleFacet,
+    AuctionVehicleRangeFacet,
+    VehicleSearchResult,
+    VehicleVinAppearance,
+)
+from repositories.models import VehicleVinHistory
+from repositories.views import (
+    AuctionVehicleDetailView,
+    AuctionVehicleView,
+    FacetView,
+    RangeFacetView,
+    UserBidView,
+    VehicleSearchView,
+)
 
-from repositories.views import AuctionVehicleView, FacetView
+from .user_bid_mapper import UserBidMapper
 
 
 class AuctionVehicleMapper:
@@ -16,6 +32,7 @@ class AuctionVehicleMapper:
             engine=auction_vehicle_view.vehicle.engine,
             transmission=auction_vehicle_view.vehicle.transmission,
             vin=auction_vehicle_view.vehicle.vin,
+            version=auction_vehicle_view.vehicle.version,
             images=auction_vehicle_view.vehicle.image_list,
         )
 
@@ -24,10 +41,9 @@ class AuctionVehicleMapper:
         return [AuctionVehicleMapper.to_contract(view) for view in auction_vehicle_views]
 
     @staticmethod
-    def to_contract_with_bids(auction_vehicle_view: AuctionVehicleView) -> AuctionVehicle:
-
-        latest_bid = None
-
+    def to_contract_with_bids(
+        auction_vehicle_view: AuctionVehicleView, latest_bid: UserBidView | None
+    ) -> AuctionVehicle:
         return AuctionVehicle(
             vehicle_id=auction_vehicle_view.vehicle.id,
             is_active=auction_vehicle_view.vehicle.active,
@@ -38,33 +54,84 @@ class AuctionVehicleMapper:
             engine=auction_vehicle_view.vehicle.engine,
             transmission=auction_vehicle_view.vehicle.transmission,
             vin=auction_vehicle_view.vehicle.vin,
-            client_bid=latest_bid,
+            version=auction_vehicle_view.vehicle.version,
+            client_bid=UserBidMapper.to_contract(latest_bid) if latest_bid else None,
             images=auction_vehicle_view.vehicle.image_list,
         )
 
     @staticmethod
-    def to_contract_list_with_bids(auction_vehicle_views: list[AuctionVehicleView]) -> list[AuctionVehicle]:
-        latest_bid_by_vehicle_id = {}
-
-        # Sort auction vehicle views by last bid date (most recent first)
-        # Vehicles with no bids will appear at the end
-        sorted_views = sorted(
-            auction_vehicle_views,
-            key=lambda view: (
-                latest_bid_by_vehicle_id[view.vehicle.id].created_at.timestamp()
-                if view.vehicle.id in latest_bid_by_vehicle_id
-                else 0
-            ),
-            reverse=True,
-        )
+    def to_contract_list_with_bids(
+        auction_vehicle_views: list[AuctionVehicleView], latest_bid_by_vehicle_id: dict[int, UserBidView]
+    ) -> list[AuctionVehicle]:
+        # Views are already ordered by last bid date in the query
+        return [
+            AuctionVehicleMapper.to_contract_with_bids(view, latest_bid_by_vehicle_id.get(view.vehicle.id))
+            for view in auction_vehicle_views
+        ]
 
+    @staticmethod
+    def to_search_contract_list_with_bids(
+        search_views: list[VehicleSearchView], latest_bid_by_vehicle_id: dict[int, UserBidView]
+    ) -> list[VehicleSearchResult]:
         return [
-            AuctionVehicleMapper.to_contract_with_bids(
-                view, [latest_bid_by_vehicle_id[view.vehicle.id]] if view.vehicle.id in latest_bid_by_vehicle_id else []
+            VehicleSearchResult(
+                **dict(AuctionVehicleMapper.to_contract_with_bids(view, latest_bid_by_vehicle_id.get(view.vehicle.id))),
+                auction_id=view.vehicle.auction_id,
+                auction_country=view.auction_country,
+                auction_end_datetime=view.auction_end_datetime,
             )
-            for view in sorted_views
+            for view in search_views
         ]
 
+    @staticmethod
+    def to_vin_appearance_contract(appearance: VehicleVinHistory) -> VehicleVinAppearance:
+        result = "sold" if appearance.final_bid is not None else "unsold"
+        if appearance.closed_at is None:
+            result = "open"
+
+        return VehicleVinAppearance(
+            vehicle_id=appearance.vehicle_id,
+            vin=appearance.vin,
+            auction_id=appearance.auction_id,
+            auction_country=appearance.auction_country,
+            auction_end_datetime=appearance.auction_end_datetime,
+            manufacturer=appearance.manufacturer_name,
+            model=appearance.model_name,
+            mileage=appearance.mileage,
+            start_price=appearance.start_price,
+            result=result,
+            final_bid=appearance.final_bid,
+            bid_count=appearance.bid_count,
+        )
+
+    @staticmethod
+    def to_detail_contract(detail_view: AuctionVehicleDetailView) -> AuctionVehicleDetail:
+        vehicle = detail_view.vehicle
+        return AuctionVehicleDetail(
+            vehicle_id=vehicle.id,
+            is_active=vehicle.active,
+            manufacturer=str(detail_view.manufacturer.name),
+            model=str(detail_view.model.name),
+            manufacturing_date=vehicle.manufacturing_date,
+            mileage=vehicle.mileage,
+            engine=vehicle.engine,
+            transmission=vehicle.transmission,
+            vin=vehicle.vin,
+            version=vehicle.version,
+            client_bid=UserBidMapper.to_contract(detail_view.current_bid) if detail_view.current_bid else None,
+            images=vehicle.image_list,
+            body_type=vehicle.body_type,
+            color=vehicle.color,
+            engine_power=vehicle.engine_power,
+            engine_cc=vehicle.engine_cc,
+            start_price=vehicle.start_price,
+            is_damaged=vehicle.is_damaged,
+            number_plates=vehicle.number_plates,
+            equipment=vehicle.equipment or [],
+            description=vehicle.description,
+            damaged_images=vehicle.damaged_image_list or [],
+        )
+
     @staticmethod
     def facet_to_contract(facet_view: FacetView) -> AuctionVehicleFacet:
         """Map FacetView to AuctionVehicleFacet contract"""
@@ -78,3 +145,8 @@ class AuctionVehicleMapper:
     def facets_to_contract(facet_views: list[FacetView]) -> list[AuctionVehicleFacet]:
         """Map list of FacetView to list of AuctionVehicleFacet contracts"""
         return [AuctionVehicleMapper.facet_to_contract(facet) for facet in facet_views]
+
+    @staticmethod
+    def range_facets_to_contract(facet_views: list[RangeFacetView]) -> list[AuctionVehicleRangeFacet]:
+        """Map list of RangeFacetView to list of AuctionVehicleRangeFacet contracts"""
+        return [AuctionVehicleRangeFacet(min=facet.min, max=facet.max, count=facet.count) for facet in facet_views]
@@ -0,0 +1,12 @@
+from contracts import ClientBid
+from repositories.views import UserBidView
+
+
+class UserBidMapper:
+    @staticmethod
+    def to_contract(user_bid_view: UserBidView) -> ClientBid:
+        return ClientBid(
+            client_id=user_bid_view.user_id,
+            bid_amount=user_bid_view.amount,
+            bid_time=user_bid_view.created_at,
+        )
@@ -16,6 +16,7 @@ class UserMapper:
             registration_date=user.registration_date,
             comments=user.comments,
             status=user.status,
+            version=user.version,
             created_at=user.created_at,
             updated_at=user.updated_at,
         )
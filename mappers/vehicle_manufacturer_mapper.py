@@ -17,6 +17,7 @@ class VehicleManufacturerMapper:
             id=manufacturer.id,
             name=manufacturer.name,
             synonyms=manufacturer.synonyms,
+            version=manufacturer.version,
             created_at=manufacturer.created_at,
         )
 
@@ -41,6 +42,7 @@ class VehicleModelMapper:
             name=model.name,
             default_vehicle_type=model.default_vehicle_type,
             synonyms=model.synonyms,
+            version=model.version,
             created_at=model.created_at,
         )
 
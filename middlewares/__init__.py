@@ -1,9 +1,11 @@
 from .exception_handling import ExceptionMiddleware
+from .profiling import ProfilingMiddleware
 from .request_logging import RequestMiddleware
 from .validation_handling import validation_exception_handler
 
 __all__ = [
     "ExceptionMiddleware",
+    "ProfilingMiddleware",
     "RequestMiddleware",
     "validation_exception_handler",
 ]
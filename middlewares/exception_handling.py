@@ -6,7 +6,7 @@ from starlette.responses import JSONResponse
 from core.config import settings
 from core.logging import logger
 from exceptions.base import AppError
-from exceptions.types import NotFoundError
+from exceptions.types import ConflictError, NotFoundError, UnauthorizedError
 
 
 class ExceptionMiddleware(BaseHTTPMiddleware):
@@ -18,6 +18,14 @@ class ExceptionMiddleware(BaseHTTPMiddleware):
             logger.error(f"NotFoundException: {nfe.message} - {nfe.payload}")
             return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content=nfe.to_dict())
 
+        except UnauthorizedError as ue:
+            logger.error(f"UnauthorizedException: {ue.message} - {ue.payload}")
+            return JSONResponse(status_code=status.HTTP_401_UNAUTHORIZED, content=ue.to_dict())
+
+        except ConflictError as ce:
+            logger.warning(f"ConflictException: {ce.message} - {ce.payload}")
+            return JSONResponse(status_code=status.HTTP_409_CONFLICT, content=ce.to_dict())
+
         except AppError as ae:
             logger.error(f"AppException: {ae.message} - {ae.payload}")
             return JSONResponse(status_code=status.HTTP_400_BAD_REQUEST, content=ae.to_dict())
@@ -0,0 +1,19 @@
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from core.profiling import RequestProfiler
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        profiler: RequestProfiler = request.app.container.request_profiler()
+
+        if not profiler.should_profile(request):
+            return await call_next(request)
+
+        with profiler.profile(request) as record:
+            response = await call_next(request)
+            record.status_code = response.status_code
+
+        response.headers["X-Profile-Id"] = record.id
+        return response
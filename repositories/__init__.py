@@ -1,15 +1,20 @@
+from .auction_events_repository import AuctionEventsRepository
 from .auction_vehicles_repository import AuctionVehiclesRepository
 from .auctions_repository import AuctionsRepository
+from .user_bids_repository import UserBidsRepository
 from .users_repository import UsersRepository
 from .vehicle_manufacturers_repository import VehicleManufacturersRepository
 from .vehicle_models_repository import VehicleModelsRepository
+from .vehicle_vin_history_repository import VehicleVinHistoryRepository
 
 __all__ = [
+    "AuctionEventsRepository",
     "AuctionsRepository",
     "AuctionVehiclesRepository",
     "FailedVehiclesRepository",
     "VehicleManufacturersRepository",
     "VehicleModelsRepository",
+    "VehicleVinHistoryRepository",
     "UsersRepository",
     "UserBidsRepository",
 ]
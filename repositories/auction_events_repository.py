@@ -0,0 +1,31 @@
+import json
+
+from sqlalchemy import Select, func, select
+
+from repositories.base_repository import BaseRepository
+
+AUCTION_EVENTS_CHANNEL = "auction_events"
+# Postgres rejects NOTIFY payloads of 8000 bytes and more
+MAX_EVENT_PAYLOAD_BYTES = 7999
+
+
+def notify_statement(event: dict) -> Select:
+    """
+    Build the NOTIFY of an auction event, for repositories broadcasting it in the transaction of their write.
+
+    Postgres delivers it on commit only, so listeners never see an event of a rolled back write.
+    """
+    payload = json.dumps(event, separators=(",", ":"), default=str)
+    if len(payload.encode()) > MAX_EVENT_PAYLOAD_BYTES:
+        raise ValueError(f"Auction event payload exceeds {MAX_EVENT_PAYLOAD_BYTES} bytes.")
+
+    return select(func.pg_notify(AUCTION_EVENTS_CHANNEL, payload))
+
+
+class AuctionEventsRepository(BaseRepository):
+    async def notify(self, event: dict) -> None:
+        """Broadcast an auction event to every API worker listening on the auction events channel."""
+        statement = notify_statement(event)
+
+        async with self.session_factory() as session:
+            await session.execute(statement)
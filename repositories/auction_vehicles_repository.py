@@ -1,35 +1,204 @@
-from sqlalchemy import extract, func, select
-
-from repositories.models import AuctionVehicle, VehicleManufacturer, VehicleModel
+from collections.abc import AsyncIterator
+
+from sqlalchemy import and_, extract, func, literal_column, or_, select, true, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+from sqlalchemy.sql import ColumnElement, Select
+from sqlalchemy.sql.selectable import TableValuedAlias
+
+from exceptions.base import AppError
+from repositories.models import (
+    Auction,
+    AuctionVehicle,
+    VehicleCurrentBid,
+    VehicleManufacturer,
+    VehicleModel,
+    VehicleSearchEntry,
+)
 from repositories.views import (
+    AuctionVehicleDetailSchema,
+    AuctionVehicleDetailView,
     AuctionVehicleSchema,
     AuctionVehicleView,
     FacetView,
+    RangeFacetView,
+    UserBidView,
     VehicleManufacturerSchema,
     VehicleModelSchema,
+    VehicleSearchView,
+)
+
+from .base_repository import BaseRepository, search_query
+
+# Filter key of full-text searches, matched against the search vector maintained by a trigger
+SEARCH_FILTER = "search_vector__match"
+
+# Orders of vehicle lists supporting seek pagination, as (columns ending with the id tiebreak, descending). Each
+# one is served by an index on auction_id and the columns.
+VEHICLE_SORTS = {
+    "price_asc": ((AuctionVehicle.start_price, AuctionVehicle.id), False),
+    "price_desc": ((AuctionVehicle.start_price, AuctionVehicle.id), True),
+    "mileage_asc": ((AuctionVehicle.mileage, AuctionVehicle.id), False),
+    "mileage_desc": ((AuctionVehicle.mileage, AuctionVehicle.id), True),
+    "year_asc": ((AuctionVehicle.manufacturing_date, AuctionVehicle.id), False),
+    "year_desc": ((AuctionVehicle.manufacturing_date, AuctionVehicle.id), True),
+    "updated_desc": ((AuctionVehicle.updated_at, AuctionVehicle.id), True),
+}
+
+# Bucket lower bounds of the range facets, the last bucket is open ended
+FACET_RANGES = {
+    "start_prices": (0, 1000, 2500, 5000, 7500, 10_000, 15_000, 20_000, 30_000, 50_000),
+    "mileages": (0, 10_000, 25_000, 50_000, 75_000, 100_000, 150_000, 200_000, 300_000),
+    "engine_powers": (0, 75, 100, 125, 150, 200, 250, 300, 400),
+}
+
+
+def _bucket(column: InstrumentedAttribute, family: str) -> ColumnElement[int]:
+    # Bounds are rendered inline, so the expression is identical in the SELECT and GROUP BY clauses
+    bounds = literal_column(f"ARRAY[{', '.join(map(str, FACET_RANGES[family]))}]")
+    return func.width_bucket(column, bounds)
+
+
+def _equipment_features(equipment: InstrumentedAttribute) -> TableValuedAlias:
+    # One row per equipment feature of a vehicle numbered from 1, joined to compute the equipment facet
+    return (
+        func.unnest(equipment)
+        .table_valued("feature", with_ordinality="ordinal")
+        .render_derived("equipment_features")
+        .lateral()
+    )
+
+
+def _facet_groups(
+    vehicle: type[AuctionVehicle] | type[VehicleSearchEntry],
+    manufacturer: tuple[InstrumentedAttribute, InstrumentedAttribute],
+    model: tuple[InstrumentedAttribute, InstrumentedAttribute],
+    equipment_features: TableValuedAlias,
+) -> dict[str, tuple]:
+    # Grouping columns of each facet family, the first one identifies the family's rows
+    return {
+        "manufacturers": manufacturer,
+        "models": model,
+        "registration_years": (extract("year", vehicle.manufacturing_date),),
+        "start_prices": (_bucket(vehicle.start_price, "start_prices"),),
+        "mileages": (_bucket(vehicle.mileage, "mileages"),),
+        "engine_powers": (_bucket(vehicle.engine_power, "engine_powers"),),
+        "body_types": (vehicle.body_type,),
+        "colors": (vehicle.color,),
+        "transmissions": (vehicle.transmission,),
+        "damaged": (vehicle.is_damaged,),
+        "equipment": (equipment_features.c.feature,),
+    }
+
+
+EQUIPMENT_FEATURES = _equipment_features(AuctionVehicle.equipment)
+FACET_GROUPS = _facet_groups(
+    AuctionVehicle,
+    (VehicleManufacturer.id, VehicleManufacturer.name),
+    (VehicleModel.id, VehicleModel.name),
+    EQUIPMENT_FEATURES,
 )
 
-from .base_repository import BaseRepository
+# Facets of searches across auctions, over the denormalized search entries
+SEARCH_EQUIPMENT_FEATURES = _equipment_features(VehicleSearchEntry.equipment)
+SEARCH_FACET_GROUPS = _facet_groups(
+    VehicleSearchEntry,
+    (VehicleSearchEntry.manufacturer_id, VehicleSearchEntry.manufacturer_name),
+    (VehicleSearchEntry.model_id, VehicleSearchEntry.model_name),
+    SEARCH_EQUIPMENT_FEATURES,
+)
+
+# Search filter on the end of the auction, read from the auction by primary key: soft-close extensions move it too
+# often to copy it into the search entries
+AUCTION_END_FILTER = "auction_end_datetime"
+
+# Orders of searches across auctions, all supporting seek pagination, see ``VEHICLE_SORTS``. The auction end order
+# walks the auctions by end and each one's entries by id, on ix_auctions_end_datetime_id and an index on the
+# entries' auction_id and id.
+SEARCH_SORTS = {
+    "ending_soon": ((Auction.end_datetime, VehicleSearchEntry.auction_id, VehicleSearchEntry.id), False),
+    "price_asc": ((VehicleSearchEntry.start_price, VehicleSearchEntry.id), False),
+    "price_desc": ((VehicleSearchEntry.start_price, VehicleSearchEntry.id), True),
+    "mileage_asc": ((VehicleSearchEntry.mileage, VehicleSearchEntry.id), False),
+    "mileage_desc": ((VehicleSearchEntry.mileage, VehicleSearchEntry.id), True),
+    "year_asc": ((VehicleSearchEntry.manufacturing_date, VehicleSearchEntry.id), False),
+    "year_desc": ((VehicleSearchEntry.manufacturing_date, VehicleSearchEntry.id), True),
+    "updated_desc": ((VehicleSearchEntry.updated_at, VehicleSearchEntry.id), True),
+}
+
+
+def _to_facet_view(family: str, key: list, count: int) -> FacetView | RangeFacetView:
+    if family in FACET_RANGES:
+        # width_bucket numbers the buckets from 1, 0 would be below the first bound
+        bounds = FACET_RANGES[family]
+        bucket = key[0]
+        return RangeFacetView(
+            min=bounds[bucket - 1] if bucket > 0 else None,
+            max=bounds[bucket] if bucket < len(bounds) else None,
+            count=count,
+        )
+    if family in ("manufacturers", "models"):
+        return FacetView(id=key[0], name=key[1], count=count)
+    if family == "registration_years":
+        return FacetView(id=None, name=str(int(key[0])), count=count)
+
+    return FacetView(id=None, name=str(key[0]).lower() if isinstance(key[0], bool) else key[0], count=count)
 
 
 class AuctionVehiclesRepository(BaseRepository):
-    async def get_by_auction_id(self, auction_id: int, _from: int, size: int, **kwargs) -> list[AuctionVehicleView]:
+    async def get_by_auction_id(
+        self,
+        auction_id: int,
+        _from: int,
+        size: int,
+        sort: str = "recent_bids",
+        after: list | None = None,
+        **kwargs,
+    ) -> tuple[list[AuctionVehicleView], list | None]:
+        """
+        Get a page of auction vehicles in one of the ``VEHICLE_SORTS`` orders, by relevance to the full-text search,
+        or most recently bid on first and vehicles without bids last.
+
+        :param after: sort key of the last vehicle of the previous page, to seek past instead of skipping ``_from``
+        :return: the page and the sort key of its last vehicle, None when the page is the last one or the order does
+            not support seeking
+        """
         query = (
             select(AuctionVehicle, VehicleManufacturer, VehicleModel)
             .where(AuctionVehicle.auction_id == auction_id)
             .join(VehicleManufacturer, AuctionVehicle.manufacturer_id == VehicleManufacturer.id)
             .join(VehicleModel, AuctionVehicle.model_id == VehicleModel.id)
-            .offset(_from)
             .limit(size)
         )
 
+        sort_columns = None
+        if sort in VEHICLE_SORTS:
+            sort_columns, descending = VEHICLE_SORTS[sort]
+            query = self._apply_sort(query, sort_columns, descending, after)
+        elif after is not None:
+            raise AppError(message="Invalid cursor.", payload={"details": f"Sort {sort} does not support cursors."})
+        elif sort == "relevance" and kwargs.get(SEARCH_FILTER):
+            # Matches on names weigh more than on equipment, and on equipment more than on the description
+            rank = func.ts_rank_cd(AuctionVehicle.search_vector, search_query(kwargs[SEARCH_FILTER]))
+            query = query.order_by(rank.desc(), AuctionVehicle.id)
+        else:
+            # Known limitation: no index serves this order, every page sorts all the matching vehicles of the auction.
+            # Vehicles without bids come last, an index on the current bids alone could not produce them.
+            query = query.outerjoin(VehicleCurrentBid, VehicleCurrentBid.vehicle_id == AuctionVehicle.id).order_by(
+                VehicleCurrentBid.last_bid_at.desc().nulls_last(), AuctionVehicle.id
+            )
+
+        if after is None:
+            query = query.offset(_from)
+
         query = self._apply_filters(query, kwargs, AuctionVehicle)
 
         async with self.session_factory() as session:
             result = await session.execute(query)
             rows = result.all()
 
-            return [
+            views = [
                 AuctionVehicleView(
                     vehicle=AuctionVehicleSchema.model_validate(vehicle),
                     manufacturer=VehicleManufacturerSchema.model_validate(manufacturer),
@@ -38,13 +207,132 @@ class AuctionVehiclesRepository(BaseRepository):
                 for vehicle, manufacturer, model in rows
             ]
 
-    async def get_by_auction_id_count(self, auction_id: int, **kwargs) -> int:
-        query = select(func.count()).select_from(AuctionVehicle).where(AuctionVehicle.auction_id == auction_id)
+        last_key = None
+        if sort_columns and len(rows) == size:
+            last_vehicle = rows[-1][0]
+            last_key = [getattr(last_vehicle, column.key) for column in sort_columns]
+
+        return views, last_key
+
+    async def stream_by_auction_id(
+        self, auction_id: int, batch_size: int, **kwargs
+    ) -> AsyncIterator[list[AuctionVehicleView]]:
+        """
+        Stream vehicles of an auction ordered by id through a server-side cursor.
+
+        Rows are fetched ``batch_size`` at a time, so memory stays bounded regardless of the auction size.
+        """
+        query = (
+            select(AuctionVehicle, VehicleManufacturer, VehicleModel)
+            .where(AuctionVehicle.auction_id == auction_id)
+            .join(VehicleManufacturer, AuctionVehicle.manufacturer_id == VehicleManufacturer.id)
+            .join(VehicleModel, AuctionVehicle.model_id == VehicleModel.id)
+            .order_by(AuctionVehicle.id)
+            .execution_options(yield_per=batch_size)
+        )
+
         query = self._apply_filters(query, kwargs, AuctionVehicle)
 
+        async with self.session_factory() as session:
+            result = await session.stream(query)
+
+            async for rows in result.partitions():
+                yield [
+                    AuctionVehicleView(
+                        vehicle=AuctionVehicleSchema.model_validate(vehicle),
+                        manufacturer=VehicleManufacturerSchema.model_validate(manufacturer),
+                        model=VehicleModelSchema.model_validate(model),
+                    )
+                    for vehicle, manufacturer, model in rows
+                ]
+                # Drop the identity map so loaded objects do not accumulate over the whole export
+                session.expunge_all()
+
+    async def get_by_auction_id_count(
+        self, auction_id: int, strategy: str = "exact", threshold: int | None = None, **kwargs
+    ) -> tuple[int, bool]:
+        """Count the vehicles of an auction matching the filters, see ``_count`` for the strategies."""
+        query = select(AuctionVehicle.id).where(AuctionVehicle.auction_id == auction_id)
+        query = self._apply_filters(query, kwargs, AuctionVehicle)
+
+        return await self._count(query, strategy, threshold, filtered=bool(kwargs))
+
+    async def search(
+        self,
+        _from: int,
+        size: int,
+        sort: str = "ending_soon",
+        after: list | None = None,
+        **kwargs,
+    ) -> tuple[list[VehicleSearchView], list | None]:
+        """
+        Get a page of the vehicles of every open auction in one of the ``SEARCH_SORTS`` orders, or by relevance to
+        the full-text search.
+
+        Filters and orders apply to the search entries and their auction's end, joined by primary key, only the
+        vehicles of the page are joined.
+
+        :param after: sort key of the last vehicle of the previous page, to seek past instead of skipping ``_from``
+        :return: the page and the sort key of its last vehicle, None when the page is the last one or the order does
+            not support seeking
+        """
+        query = (
+            select(AuctionVehicle, VehicleSearchEntry, Auction.end_datetime)
+            .select_from(VehicleSearchEntry)
+            .join(Auction, Auction.id == VehicleSearchEntry.auction_id)
+            .join(AuctionVehicle, AuctionVehicle.id == VehicleSearchEntry.id)
+            .limit(size)
+        )
+
+        sort_columns = None
+        if sort == "relevance" and kwargs.get(SEARCH_FILTER):
+            if after is not None:
+                raise AppError(message="Invalid cursor.", payload={"details": f"Sort {sort} does not support cursors."})
+            rank = func.ts_rank_cd(VehicleSearchEntry.search_vector, search_query(kwargs[SEARCH_FILTER]))
+            query = query.order_by(rank.desc(), VehicleSearchEntry.id)
+        else:
+            sort_columns, descending = SEARCH_SORTS.get(sort, SEARCH_SORTS["ending_soon"])
+            query = self._apply_sort(query, sort_columns, descending, after)
+
+        if after is None:
+            query = query.offset(_from)
+
+        auction_filters, entry_filters = self._split_auction_filters(kwargs)
+        query = self._apply_filters(query, auction_filters, Auction)
+        query = self._apply_filters(query, entry_filters, VehicleSearchEntry)
+
         async with self.session_factory() as session:
             result = await session.execute(query)
-            return result.scalar()
+            rows = result.all()
+
+            views = [
+                VehicleSearchView(
+                    vehicle=AuctionVehicleSchema.model_validate(vehicle),
+                    manufacturer=VehicleManufacturerSchema(id=entry.manufacturer_id, name=entry.manufacturer_name),
+                    model=VehicleModelSchema(id=entry.model_id, name=entry.model_name),
+                    auction_country=entry.auction_country,
+                    auction_end_datetime=auction_end_datetime,
+                )
+                for vehicle, entry, auction_end_datetime in rows
+            ]
+
+        last_key = None
+        if sort_columns and len(rows) == size:
+            _, last_entry, last_end_datetime = rows[-1]
+            last_key = [
+                last_end_datetime if column is Auction.end_datetime else getattr(last_entry, column.key)
+                for column in sort_columns
+            ]
+
+        return views, last_key
+
+    async def search_count(self, strategy: str = "exact", threshold: int | None = None, **kwargs) -> tuple[int, bool]:
+        """Count the vehicles of every open auction matching the filters, see ``_count`` for the strategies."""
+        auction_filters, entry_filters = self._split_auction_filters(kwargs)
+        query = self._join_auction_filters(select(VehicleSearchEntry.id), auction_filters)
+        query = self._apply_filters(query, entry_filters, VehicleSearchEntry)
+
+        return await self._count(query, strategy, threshold, filtered=bool(kwargs))
 
     async def get_by_id(self, vehicle_id: int) -> AuctionVehicle | None:
         query = (
@@ -80,6 +368,48 @@ class AuctionVehiclesRepository(BaseRepository):
                 model=VehicleModelSchema.model_validate(model),
             )
 
+    async def get_detail_view_by_id(self, vehicle_id: int) -> AuctionVehicleDetailView | None:
+        """Get the full record of a vehicle with its manufacturer, model and current highest bid in one query."""
+        query = (
+            select(
+                AuctionVehicle,
+                VehicleManufacturer,
+                VehicleModel,
+                VehicleCurrentBid.user_id,
+                VehicleCurrentBid.amount,
+                VehicleCurrentBid.last_bid_at,
+            )
+            .where(AuctionVehicle.id == vehicle_id)
+            .join(VehicleManufacturer, AuctionVehicle.manufacturer_id == VehicleManufacturer.id)
+            .join(VehicleModel, AuctionVehicle.model_id == VehicleModel.id)
+            .outerjoin(VehicleCurrentBid, VehicleCurrentBid.vehicle_id == AuctionVehicle.id)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            row = result.first()
+
+            if not row:
+                return None
+
+            vehicle, manufacturer, model, user_id, amount, last_bid_at = row
+            current_bid = None
+            if amount is not None:
+                current_bid = UserBidView(
+                    vehicle_id=vehicle.id,
+                    auction_id=vehicle.auction_id,
+                    user_id=user_id,
+                    amount=amount,
+                    created_at=last_bid_at,
+                )
+
+            return AuctionVehicleDetailView(
+                vehicle=AuctionVehicleDetailSchema.model_validate(vehicle),
+                manufacturer=VehicleManufacturerSchema.model_validate(manufacturer),
+                model=VehicleModelSchema.model_validate(model),
+                current_bid=current_bid,
+            )
+
     async def get_car_counts_by_auction_ids(self, auction_ids: list[int]) -> dict[int, int]:
         query = (
             select(AuctionVehicle.auction_id, func.count())
@@ -98,73 +428,289 @@ class AuctionVehiclesRepository(BaseRepository):
 
             return vehicle
 
-    async def get_manufacturer_facets(self, auction_id: int, **kwargs) -> list[FacetView]:
-        """Get manufacturer facets with ID, name and count for vehicles in an auction"""
-        filters = {**kwargs, 'auction_id': auction_id}
+    async def upsert_many(self, vehicles: list[dict]) -> list[tuple[int, str]]:
+        """
+        Insert or update vehicles by auction and VIN in one batch, a VIN already sold in another auction is inserted
+        as a new vehicle.
+
+        When the batch fails (e.g. a vehicle id already belongs to another VIN), every row is retried in its own
+        savepoint so only the offending rows are rejected.
+
+        :return: (index, error) pairs of the rows that could not be stored
+        """
+        if not vehicles:
+            return []
+
+        statement = insert(AuctionVehicle)
+        updated_columns = {
+            column: statement.excluded[column]
+            for column in vehicles[0]
+            if column not in (AuctionVehicle.id.key, AuctionVehicle.auction_id.key, AuctionVehicle.vin.key)
+        }
+        statement = statement.on_conflict_do_update(
+            index_elements=[AuctionVehicle.auction_id, AuctionVehicle.vin],
+            set_={
+                **updated_columns,
+                AuctionVehicle.version.key: AuctionVehicle.version + 1,
+                AuctionVehicle.updated_at.key: func.now(),
+            },
+        )
 
-        query = (
-            select(VehicleManufacturer.id, VehicleManufacturer.name, func.count().label("count"))
-            .join(AuctionVehicle, AuctionVehicle.manufacturer_id == VehicleManufacturer.id)
-            .group_by(VehicleManufacturer.id, VehicleManufacturer.name)
-            .order_by(VehicleManufacturer.name)
+        async with self.session_factory() as session:
+            try:
+                async with session.begin_nested():
+                    await session.execute(statement, vehicles)
+                return []
+            except DBAPIError:
+                pass
+
+            errors = []
+            for index, vehicle in enumerate(vehicles):
+                try:
+                    async with session.begin_nested():
+                        await session.execute(statement, [vehicle])
+                except DBAPIError as e:
+                    errors.append((index, str(e.orig)))
+
+            return errors
+
+    async def deactivate_by_auction_id(self, auction_id: int, batch_size: int) -> int:
+        """
+        Deactivate up to ``batch_size`` active vehicles of an auction in a short transaction.
+
+        :return: number of deactivated vehicles, 0 once the auction has no active vehicles left
+        """
+        batch = (
+            select(AuctionVehicle.id)
+            .where(AuctionVehicle.auction_id == auction_id, AuctionVehicle.active.is_(True))
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        statement = (
+            update(AuctionVehicle)
+            .where(AuctionVehicle.id.in_(batch))
+            .values(active=False, version=AuctionVehicle.version + 1, updated_at=func.now())
+            .execution_options(synchronize_session=False)
         )
-        query = self._apply_filters(query, filters, AuctionVehicle)
 
         async with self.session_factory() as session:
-            result = await session.execute(query)
-            return [
-                FacetView(id=manufacturer_id, name=name, count=count) for manufacturer_id, name, count in result.all()
-            ]
+            result = await session.execute(statement)
+            return result.rowcount
+
+    async def update_many(
+        self, auction_id: int, values: dict, batch_size: int, after_id: int = 0, **kwargs
+    ) -> list[int]:
+        """
+        Set the given columns on the next ``batch_size`` vehicles of an auction matching the filters, by id after
+        ``after_id``, in one set-based UPDATE and a short transaction.
+
+        Walking the ids keeps each batch disjoint from the previous ones, even when the update changes a column
+        the filters match on.
+
+        :return: ids of the updated vehicles in ascending order, fewer than ``batch_size`` once none are left
+        """
+        batch = (
+            select(AuctionVehicle.id)
+            .where(AuctionVehicle.auction_id == auction_id, AuctionVehicle.id > after_id)
+            .order_by(AuctionVehicle.id)
+            .limit(batch_size)
+        )
+        batch = self._apply_filters(batch, kwargs, AuctionVehicle)
+        statement = (
+            update(AuctionVehicle)
+            .where(AuctionVehicle.id.in_(batch.scalar_subquery()))
+            .values(**values, version=AuctionVehicle.version + 1, updated_at=func.now())
+            .returning(AuctionVehicle.id)
+            .execution_options(synchronize_session=False)
+        )
 
-    async def get_model_facets(self, auction_id: int, **kwargs) -> list[FacetView]:
-        """Get model facets with ID, name and count for vehicles in an auction"""
-        filters = {**kwargs, 'auction_id': auction_id}
+        async with self.session_factory() as session:
+            result = await session.execute(statement)
+            return sorted(result.scalars().all())
 
-        query = (
-            select(VehicleModel.id, VehicleModel.name, func.count().label("count"))
-            .join(AuctionVehicle, AuctionVehicle.model_id == VehicleModel.id)
-            .group_by(VehicleModel.id, VehicleModel.name)
-            .order_by(VehicleModel.name)
+    async def get_ids_by_catalog(self, manufacturer_id: int | None = None, model_id: int | None = None) -> list[int]:
+        """Ids of the vehicles of a manufacturer or of a model, in ascending order."""
+        column = AuctionVehicle.manufacturer_id if manufacturer_id is not None else AuctionVehicle.model_id
+        catalog_id = manufacturer_id if manufacturer_id is not None else model_id
+        async with self.session_factory() as session:
+            result = await session.execute(select(AuctionVehicle.id).where(column == catalog_id))
+            return sorted(result.scalars().all())
+
+    async def refresh_catalog_names(self, vehicle_ids: list[int]) -> int:
+        """
+        Rebuild the search vectors and the catalog names copied into the search entries and the VIN history of the
+        given vehicles, in a short transaction. Versions and update times are left alone, the vehicles did not change.
+
+        :return: number of refreshed vehicles
+        """
+        statement = (
+            update(AuctionVehicle)
+            .where(AuctionVehicle.id.in_(vehicle_ids))
+            # Fires the search vector trigger, the statement triggers sync the entries and the history
+            .values(manufacturer_id=AuctionVehicle.manufacturer_id, updated_at=AuctionVehicle.updated_at)
+            .execution_options(synchronize_session=False)
         )
-        query = self._apply_filters(query, filters, AuctionVehicle)
 
         async with self.session_factory() as session:
-            result = await session.execute(query)
-            return [FacetView(id=model_id, name=name, count=count) for model_id, name, count in result.all()]
+            result = await session.execute(statement)
+            return result.rowcount
 
-    async def get_registration_year_facets(self, auction_id: int, **kwargs) -> list[FacetView]:
-        """Get registration year facets for vehicles in an auction"""
-        filters = {**kwargs, 'auction_id': auction_id}
+    async def get_facets(self, auction_id: int, facet_filters: dict[str, dict]) -> dict[str, list]:
+        """
+        Compute facet families of the vehicles of an auction together, see ``_get_facets``.
+
+        :param facet_filters: filters of each family, keyed by a family of ``FACET_GROUPS``
+        :return: FacetView lists of term families and RangeFacetView lists of range families, keyed by family,
+            values without vehicles left out
+        """
+        query = (
+            select()
+            .select_from(AuctionVehicle)
+            .join(VehicleManufacturer, AuctionVehicle.manufacturer_id == VehicleManufacturer.id)
+            .join(VehicleModel, AuctionVehicle.model_id == VehicleModel.id)
+            .where(AuctionVehicle.auction_id == auction_id)
+        )
+        return await self._get_facets(query, AuctionVehicle, FACET_GROUPS, EQUIPMENT_FEATURES, facet_filters)
+
+    async def get_search_facets(self, facet_filters: dict[str, dict]) -> dict[str, list]:
+        """
+        Compute facet families of the vehicles of every open auction from the search entries, the auction is only
+        joined to filter on its end.
+        """
+        # Every family shares the auction filters, see VehicleSearchFilterBuilder
+        auction_filters, _ = self._split_auction_filters(next(iter(facet_filters.values())))
+        facet_filters = {family: self._split_auction_filters(filters)[1] for family, filters in facet_filters.items()}
+        query = self._join_auction_filters(select().select_from(VehicleSearchEntry), auction_filters)
+        return await self._get_facets(
+            query, VehicleSearchEntry, SEARCH_FACET_GROUPS, SEARCH_EQUIPMENT_FEATURES, facet_filters
+        )
 
+    @staticmethod
+    def _split_auction_filters(filters: dict) -> tuple[dict, dict]:
+        """Split search filters into the filters of the auction, on its own column names, and of the entries."""
+        auction_filters, entry_filters = {}, {}
+        for key, value in filters.items():
+            if key.split("__")[0] == AUCTION_END_FILTER:
+                auction_filters[key.removeprefix("auction_")] = value
+            else:
+                entry_filters[key] = value
+
+        return auction_filters, entry_filters
+
+    def _join_auction_filters(self, query: Select, auction_filters: dict) -> Select:
+        """Filter a query of the search entries on their auction, joined by primary key only when filtered on."""
+        conditions = self._build_conditions(auction_filters, Auction)
+        if not conditions:
+            return query
+
+        return query.join(Auction, Auction.id == VehicleSearchEntry.auction_id).where(*conditions)
+
+    async def _get_facets(
+        self,
+        query: Select,
+        model: type[AuctionVehicle] | type[VehicleSearchEntry],
+        facet_groups: dict[str, tuple],
+        equipment_features: TableValuedAlias,
+        facet_filters: dict[str, dict],
+    ) -> dict[str, list]:
+        """
+        Compute facet families together, in one scan of the vehicles of a query with GROUPING SETS.
+
+        Each family is counted under its own filters through an aggregate FILTER clause, only the filters shared by
+        every family go to the WHERE clause. The equipment family joins the unnested equipment of every vehicle.
+        """
+        families = list(facet_filters)
+        first, *others = facet_filters.values()
+        shared_filters = {
+            key: value for key, value in first.items() if all(key in f and f[key] == value for f in others)
+        }
+
+        # The equipment features multiply the rows of a vehicle, other families only count its first one
+        with_equipment = "equipment" in facet_filters
+        first_feature = or_(equipment_features.c.ordinal.is_(None), equipment_features.c.ordinal == 1)
+
+        counts = []
+        for family in families:
+            own_filters = {key: value for key, value in facet_filters[family].items() if key not in shared_filters}
+            conditions = self._build_conditions(own_filters, model)
+            if with_equipment and family != "equipment":
+                conditions.append(first_feature)
+            count = func.count().filter(and_(*conditions)) if conditions else func.count()
+            counts.append(count.label(f"{family}_count"))
+
+        group_columns = [column for family in families for column in facet_groups[family]]
         query = (
-            select(extract('year', AuctionVehicle.manufacturing_date), func.count().label("count"))
-            .group_by(extract('year', AuctionVehicle.manufacturing_date))
-            .order_by(extract('year', AuctionVehicle.manufacturing_date))
+            # One bit per family, cleared for the family a row is grouped by
+            query.add_columns(
+                func.grouping(*(facet_groups[family][0] for family in families)), *group_columns, *counts
+            ).group_by(func.grouping_sets(*(tuple_(*facet_groups[family]) for family in families)))
         )
-        query = self._apply_filters(query, filters, AuctionVehicle)
+        if with_equipment:
+            # Vehicles without equipment keep a row with a NULL feature
+            query = query.outerjoin(equipment_features, true())
+        query = self._apply_filters(query, shared_filters, model)
 
         async with self.session_factory() as session:
             result = await session.execute(query)
-            return [FacetView(id=None, name=str(int(year)), count=count) for year, count in result.all()]
-
-    async def update(self, vehicle: AuctionVehicle) -> AuctionVehicle:
-        async with self.session_factory() as session:
-            db_vehicle = await session.merge(vehicle)
-
-            await session.flush()
-            await session.refresh(db_vehicle)
-            await session.commit()
-
-            return db_vehicle
+            rows = result.all()
 
-            await session.flush()
-            await session.refresh(db_vehicle)
-            await session.commit()
+        # Bit of each family in the grouping mask and position of its columns in the rows
+        bits, key_slices, start = {}, {}, 0
+        for index, family in enumerate(families):
+            bits[family] = 1 << (len(families) - 1 - index)
+            key_slices[family] = slice(start, start + len(facet_groups[family]))
+            start += len(facet_groups[family])
+
+        facets = {family: [] for family in families}
+        for grouping, *values in rows:
+            index, family = next((i, family) for i, family in enumerate(families) if not grouping & bits[family])
+            key = values[key_slices[family]]
+            count = values[len(group_columns) + index]
+            if count and key[0] is not None:
+                facets[family].append(_to_facet_view(family, key, count))
+
+        for views in facets.values():
+            if views and isinstance(views[0], RangeFacetView):
+                views.sort(key=lambda view: -1 if view.min is None else view.min)
+            else:
+                views.sort(key=lambda view: view.name)
+
+        return facets
+
+    async def update(self, vehicle_id: int, values: dict, version: int | None = None) -> AuctionVehicleView | None:
+        """
+        Update the given columns of a vehicle and return its view with manufacturer and model in one statement.
+
+        :return: the updated vehicle, or None when the vehicle, its manufacturer or model does not exist or the
+            vehicle is no longer at ``version``
+        """
+        statement = self._versioned_update(AuctionVehicle, vehicle_id, values, version)
+        # A new manufacturer or model must exist, otherwise the joins below would drop the updated row
+        if AuctionVehicle.manufacturer_id.key in values:
+            manufacturer_ids = select(VehicleManufacturer.id).where(VehicleManufacturer.id == values["manufacturer_id"])
+            statement = statement.where(manufacturer_ids.exists())
+        if AuctionVehicle.model_id.key in values:
+            model_ids = select(VehicleModel.id).where(VehicleModel.id == values["model_id"])
+            statement = statement.where(model_ids.exists())
+
+        updated = statement.returning(*AuctionVehicle.__table__.columns).cte("updated_vehicle")
+        vehicle = aliased(AuctionVehicle, updated)
+        query = (
+            select(vehicle, VehicleManufacturer, VehicleModel)
+            .join(VehicleManufacturer, vehicle.manufacturer_id == VehicleManufacturer.id)
+            .join(VehicleModel, vehicle.model_id == VehicleModel.id)
+        )
 
-            return db_vehicle
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            row = result.first()
 
-            await session.flush()
-            await session.refresh(db_vehicle)
-            await session.commit()
+            if not row:
+                return None
 
-            return db_vehicle
+            vehicle, manufacturer, model = row
+            return AuctionVehicleView(
+                vehicle=AuctionVehicleSchema.model_validate(vehicle),
+                manufacturer=VehicleManufacturerSchema.model_validate(manufacturer),
+                model=VehicleModelSchema.model_validate(model),
+            )
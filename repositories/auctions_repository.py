@@ -1,26 +1,56 @@
-from sqlalchemy import func, select
+from datetime import datetime
+
+from sqlalchemy import func, select, update
 
 from repositories.base_repository import BaseRepository
 
-from .models import Auction
+from .models import Auction, AuctionVehicle
+
+# Orders of auction lists, as (columns ending with the id tiebreak, descending), each served by an index
+AUCTION_SORTS = {
+    "end_asc": ((Auction.end_datetime, Auction.id), False),
+    "end_desc": ((Auction.end_datetime, Auction.id), True),
+    "newest": ((Auction.created_at, Auction.id), True),
+}
 
 
 class AuctionsRepository(BaseRepository):
-    async def get_newest(self, _from: int, size: int, **kwargs) -> list[Auction]:
-        query = select(Auction).offset(_from).limit(size).order_by(Auction.end_datetime.asc())
+    async def get_newest(
+        self, _from: int, size: int, sort: str = "end_asc", after: list | None = None, **kwargs
+    ) -> tuple[list[Auction], list | None]:
+        """
+        Get a page of auctions in one of the ``AUCTION_SORTS`` orders.
+
+        :param after: sort key of the last auction of the previous page, to seek past instead of skipping ``_from``
+        :return: the page and the sort key of its last auction, None when the page is the last one
+        """
+        sort_columns, descending = AUCTION_SORTS[sort]
+        query = select(Auction).limit(size)
+        query = self._apply_sort(query, sort_columns, descending, after)
+        if after is None:
+            query = query.offset(_from)
         query = self._apply_filters(query, kwargs, Auction)
 
         async with self.session_factory() as session:
             result = await session.execute(query)
-            return result.scalars().all()
+            auctions = result.scalars().all()
 
-    async def get_newest_count(self, **kwargs) -> int:
-        query = select(func.count()).select_from(Auction)
+        last_key = None
+        if len(auctions) == size:
+            last_key = [getattr(auctions[-1], column.key) for column in sort_columns]
+
+        return auctions, last_key
+
+    async def get_newest_count(
+        self, strategy: str = "exact", threshold: int | None = None, **kwargs
+    ) -> tuple[int, bool]:
+        """Count the auctions matching the filters, see ``_count`` for the strategies."""
+        query = select(Auction.id)
         query = self._apply_filters(query, kwargs, Auction)
 
-        async with self.session_factory() as session:
-            result = await session.execute(query)
-            return result.scalar()
+        # Filters on attributes the model does not have are ignored by _apply_filters
+        filtered = any(value is not None and hasattr(Auction, key) for key, value in kwargs.items())
+        return await self._count(query, strategy, threshold, filtered)
 
     async def get_by_id(self, auction_id: int) -> Auction | None:
         async with self.session_factory() as session:
@@ -33,3 +63,39 @@ class AuctionsRepository(BaseRepository):
             await session.commit()
 
         return auction
+
+    async def get_open_end_datetimes(self) -> dict[int, datetime]:
+        """Get the end of every auction that has not been closed yet."""
+        query = select(Auction.id, Auction.end_datetime).where(Auction.closed_at.is_(None))
+
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            return dict(result.all())
+
+    async def get_closed_with_active_vehicles(self) -> dict[int, datetime]:
+        """Get the closing time of every closed auction whose vehicles were not all deactivated."""
+        active_vehicle = select(AuctionVehicle.id).where(AuctionVehicle.auction_id == Auction.id, AuctionVehicle.active)
+        query = select(Auction.id, Auction.closed_at).where(Auction.closed_at.is_not(None), active_vehicle.exists())
+
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            return dict(result.all())
+
+    async def close(self, auction_id: int) -> datetime | None:
+        """
+        Mark an auction as closed if its end has passed.
+
+        The update locks the auction row, so it waits for a soft-close extension in flight and then sees its new end.
+
+        :return: the closing time, or None when the auction is already closed or was extended in the meantime
+        """
+        statement = (
+            update(Auction)
+            .where(Auction.id == auction_id, Auction.closed_at.is_(None), Auction.end_datetime <= func.now())
+            .values(closed_at=func.now())
+            .returning(Auction.closed_at)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(statement)
+            return result.scalar_one_or_none()
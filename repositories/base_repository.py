@@ -1,12 +1,35 @@
+import json
 from collections.abc import AsyncGenerator, Callable
+from datetime import date, datetime
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import DeclarativeMeta, InstrumentedAttribute
-from sqlalchemy.sql import Select
+from sqlalchemy.sql import ColumnElement, Select, Update
+
+from exceptions.base import AppError
+
+# Text search configuration of the search vectors maintained in the database
+TEXT_SEARCH_CONFIG = "simple"
+
+
+def search_query(text: str) -> ColumnElement:
+    """Build the tsquery of a user search, quoted phrases, "or" and "-" exclusions as in web search engines."""
+    return func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, text)
+
+
+def _parse_sort_value(column: InstrumentedAttribute, value: Any) -> Any:
+    python_type = column.type.python_type
+    if python_type in (date, datetime):
+        return python_type.fromisoformat(value)
+
+    return python_type(value)
 
 
 class BaseRepository:
+    """Repositories are shared by all requests, they keep no state besides the session factory."""
+
     def __init__(self, session_factory: Callable[[], AsyncGenerator[AsyncSession, None]]):
         self.session_factory = session_factory
 
@@ -15,21 +38,137 @@ class BaseRepository:
             await session.commit()
             await session.close()
 
+    async def get_version(self, model: DeclarativeMeta, key: Any) -> int | None:
+        """Get the current version of a record, None when it does not exist."""
+        async with self.session_factory() as session:
+            result = await session.execute(select(model.version).where(model.id == key))
+            return result.scalar_one_or_none()
+
+    async def _count(
+        self, query: Select, strategy: str = "exact", threshold: int | None = None, filtered: bool = False
+    ) -> tuple[int, bool]:
+        """
+        Count the rows of a query with one of the counting strategies.
+
+        - exact: COUNT(*) over every matching row
+        - capped: counts at most ``threshold`` + 1 rows and returns ``threshold`` as a lower bound above it
+        - estimate: the planner's row estimate when it is above ``threshold``, an exact count below it. Estimates
+          of filtered queries are too far off, those are capped instead
+
+        :param query: select of the rows to count
+        :param filtered: whether the query has user filters besides its fixed scope
+        :return: the count and whether it is exact
+        """
+        if strategy == "estimate" and filtered:
+            strategy = "capped"
+
+        async with self.session_factory() as session:
+            if strategy == "estimate" and threshold is not None:
+                connection = await session.connection()
+                # Rendered with the engine's schema, the statement bypasses its schema translation
+                explained = query.compile(
+                    dialect=connection.dialect,
+                    schema_translate_map=connection.sync_connection.get_execution_options().get("schema_translate_map"),
+                    render_schema_translate=True,
+                    compile_kwargs={"literal_binds": True},
+                )
+                # Sent as is, so literal values are not taken for bind parameters
+                result = await connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {explained}")
+                plan = result.scalar()
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                estimate = int(plan[0]["Plan"]["Plan Rows"])
+                if estimate > threshold:
+                    return estimate, False
+
+            if strategy == "capped" and threshold is not None:
+                # Stops scanning after the threshold, the cost no longer grows with the result set
+                query = query.limit(threshold + 1)
+
+            result = await session.execute(select(func.count()).select_from(query.subquery()))
+            count = result.scalar()
+
+        if strategy == "capped" and threshold is not None and count > threshold:
+            return threshold, False
+
+        return count, True
+
+    def _versioned_update(self, model: DeclarativeMeta, key: Any, values: dict, version: int | None) -> Update:
+        """
+        Build a single UPDATE of the given columns of a record that bumps its version.
+
+        With ``version``, only a record still at that version is updated (optimistic concurrency): a concurrent
+        change makes the statement match no row instead of being overwritten.
+        """
+        statement = (
+            update(model)
+            .where(model.id == key)
+            .values(**values, version=model.version + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if version is not None:
+            statement = statement.where(model.version == version)
+
+        return statement
+
+    def _apply_sort(
+        self, query: Select, columns: tuple[InstrumentedAttribute, ...], descending: bool, after: list | None
+    ) -> Select:
+        """
+        Order a query by the columns, the last one being a unique tiebreak, and seek past the ``after`` sort key.
+
+        All columns go in the same direction, so the seek is a single row comparison that an index on the columns
+        serves forward or backward, whatever page is requested.
+
+        :param after: values of the columns on the last row of the previous page, as encoded in a cursor
+        """
+        query = query.order_by(*(column.desc() if descending else column.asc() for column in columns))
+        if after is None:
+            return query
+
+        try:
+            if len(after) != len(columns):
+                raise ValueError(f"expected {len(columns)} values")
+            values = [_parse_sort_value(column, value) for column, value in zip(columns, after, strict=True)]
+        except (ValueError, TypeError) as e:
+            raise AppError(message="Invalid cursor.", payload={"details": str(e)}) from e
+
+        keys = tuple_(*columns)
+        bound = tuple_(*(literal(value, column.type) for column, value in zip(columns, values, strict=True)))
+        return query.where(keys < bound if descending else keys > bound)
+
     def _apply_filters(self, query: Select, filters: dict, model: DeclarativeMeta) -> Select:
         """
         Apply filters to a query based on the provided model and filters dictionary.
 
+        :param query: The SQLAlchemy query to modify.
+        :param filters: A dictionary of filters to apply, see ``_build_conditions``.
+        :param model: The SQLAlchemy model to filter on.
+        :return: The modified query with filters applied.
+        """
+        conditions = self._build_conditions(filters, model)
+        return query.filter(*conditions) if conditions else query
+
+    def _build_conditions(self, filters: dict, model: DeclarativeMeta) -> list[ColumnElement[bool]]:
+        """
+        Build the conditions of a filters dictionary, for WHERE clauses or aggregate FILTER clauses.
+
         Supports range filtering with operators:
         - field__gte: Greater than or equal
         - field__lte: Less than or equal
         - field__gt: Greater than
         - field__lt: Less than
         - field__between: Between two values (expects list/tuple with 2 values)
+        - field__match: Full-text match of a tsvector field, with web search syntax (quotes, or, -)
+        - field__contains: Array field containing all the values of a list
+        - field__overlap: Array field containing any of the values of a list
+
+        Other keys are compared for equality, or membership when the value is a list. None values and keys that are
+        not attributes of the model are ignored.
 
-        :param query: The SQLAlchemy query to modify.
         :param filters: A dictionary of filters to apply.
         :param model: The SQLAlchemy model to filter on.
-        :return: The modified query with filters applied.
+        :return: The conditions, to be combined with AND.
         """
         range_operators = {
             '__gte': lambda field, val: field >= val,
@@ -39,8 +178,12 @@ class BaseRepository:
             '__between': lambda field, val: (
                 field.between(val[0], val[1]) if isinstance(val, list | tuple) and len(val) == 2 else None
             ),
+            '__match': lambda field, val: field.op('@@')(search_query(val)),
+            '__contains': lambda field, val: field.contains(val),
+            '__overlap': lambda field, val: field.overlap(val),
         }
 
+        conditions = []
         for key, value in filters.items():
             if value is None:
                 continue
@@ -53,17 +196,17 @@ class BaseRepository:
                     if hasattr(model, field_name):
                         condition = filter_func(getattr(model, field_name), value)
                         if condition is not None:
-                            query = query.filter(condition)
+                            conditions.append(condition)
                         range_applied = True
                     break
 
             # Apply original equality/in logic if no range operator was used
             if not range_applied and hasattr(model, key):
                 if isinstance(value, list):
-                    query = query.filter(getattr(model, key).in_(value))
+                    conditions.append(getattr(model, key).in_(value))
                 else:
-                    query = query.filter(getattr(model, key) == value)
-        return query
+                    conditions.append(getattr(model, key) == value)
+        return conditions
 
     async def get_column_facets(self, column: InstrumentedAttribute, model: DeclarativeMeta, **kwargs) -> dict:
         """
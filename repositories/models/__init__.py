@@ -1,13 +1,21 @@
 from .auction import Auction
 from .auction_vehicle import AuctionVehicle
 from .user import User
+from .user_bid import UserBid
+from .vehicle_current_bid import VehicleCurrentBid
 from .vehicle_manufacturer import VehicleManufacturer
 from .vehicle_model import VehicleModel
+from .vehicle_search_entry import VehicleSearchEntry
+from .vehicle_vin_history import VehicleVinHistory
 
 __all__ = [
     'Auction',
     'User',
+    'UserBid',
     'AuctionVehicle',
     'VehicleManufacturer',
     'VehicleModel',
+    'VehicleCurrentBid',
+    'VehicleSearchEntry',
+    'VehicleVinHistory',
 ]
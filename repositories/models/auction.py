@@ -14,4 +14,5 @@ class Auction(ModelDeclarativeBase):
     reference_url: Mapped[String | None] = Column(String(2048), nullable=True)
     country: Mapped[String] = Column(String(2), nullable=False)
     end_datetime: Mapped[DateTime] = Column(DateTime(timezone=True), nullable=False)
+    closed_at: Mapped[DateTime | None] = Column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[DateTime] = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,14 +1,16 @@
 from datetime import date
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Integer, String, Text, func
-from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import Mapped
+from sqlalchemy import Boolean, Column, Date, DateTime, Integer, String, Text, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import Mapped, deferred
 
 from database.schema_base import ModelDeclarativeBase
 
 
 class AuctionVehicle(ModelDeclarativeBase):
     __tablename__ = "auction_vehicles"
+    # Conflict target of the ingest upsert
+    __table_args__ = (UniqueConstraint("auction_id", "vin", name="uq_auction_vehicles_auction_id_vin"),)
 
     id: Mapped[Integer] = Column(Integer, primary_key=True, autoincrement=False)
     auction_id: Mapped[Integer] = Column(Integer, nullable=False)
@@ -18,7 +20,7 @@ class AuctionVehicle(ModelDeclarativeBase):
     mileage: Mapped[Integer] = Column(Integer, nullable=False)
     engine: Mapped[String] = Column(String(255), nullable=False)  # Fuel type
     transmission: Mapped[String] = Column(String(255), nullable=False)
-    vin: Mapped[String] = Column(String(17), nullable=False, unique=True)
+    vin: Mapped[String] = Column(String(17), nullable=False)  # Unique per auction, a car can be sold again later
     body_type: Mapped[String] = Column(String(255), nullable=True)
     color: Mapped[String] = Column(String(255), nullable=True)
     engine_power: Mapped[Integer] = Column(Integer, nullable=False)
@@ -31,6 +33,10 @@ class AuctionVehicle(ModelDeclarativeBase):
     description: Mapped[String] = Column(Text, nullable=True)
     image_list: Mapped[ARRAY[String]] = Column(ARRAY(String), nullable=True)
     damaged_image_list: Mapped[ARRAY[String]] = Column(ARRAY(String), nullable=True)
+    version: Mapped[Integer] = Column(Integer, nullable=False, server_default="1")
+    # Maintained by a trigger from the catalog names, equipment and description, refreshed in the background after
+    # catalog renames, only used in WHERE clauses
+    search_vector: Mapped[TSVECTOR] = deferred(Column(TSVECTOR, nullable=True))
     created_at: Mapped[DateTime] = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
@@ -1,7 +1,7 @@
 import uuid
 from uuid import uuid4
 
-from sqlalchemy import ARRAY, UUID, Column, DateTime, String, Text, func
+from sqlalchemy import ARRAY, UUID, Column, DateTime, Integer, String, Text, func
 from sqlalchemy.orm import Mapped
 
 from database.schema_base import ModelDeclarativeBase
@@ -20,6 +20,7 @@ class User(ModelDeclarativeBase):
     registration_date: Mapped[DateTime] = Column(DateTime(timezone=True), nullable=False)
     comments: Mapped[ARRAY[String]] = Column(ARRAY(String), nullable=True)
     status: Mapped[String] = Column(String(50), nullable=False, server_default="unverified")
+    version: Mapped[Integer] = Column(Integer, nullable=False, server_default="1")
     created_at: Mapped[DateTime] = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
@@ -0,0 +1,17 @@
+import uuid
+
+from sqlalchemy import UUID, BigInteger, Column, DateTime, Integer, func
+from sqlalchemy.orm import Mapped
+
+from database.schema_base import ModelDeclarativeBase
+
+
+class UserBid(ModelDeclarativeBase):
+    __tablename__ = "user_bids"
+
+    id: Mapped[BigInteger] = Column(BigInteger, primary_key=True, autoincrement=True)
+    vehicle_id: Mapped[Integer] = Column(Integer, nullable=False)
+    auction_id: Mapped[Integer] = Column(Integer, nullable=False)
+    user_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), nullable=False)
+    amount: Mapped[Integer] = Column(Integer, nullable=False)
+    created_at: Mapped[DateTime] = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
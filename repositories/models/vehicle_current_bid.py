@@ -0,0 +1,19 @@
+import uuid
+
+from sqlalchemy import UUID, Column, DateTime, Integer
+from sqlalchemy.orm import Mapped
+
+from database.schema_base import ModelDeclarativeBase
+
+
+class VehicleCurrentBid(ModelDeclarativeBase):
+    """Highest bid of every vehicle, the row bids of one vehicle are serialized on."""
+
+    __tablename__ = "vehicle_current_bids"
+
+    vehicle_id: Mapped[Integer] = Column(Integer, primary_key=True, autoincrement=False)
+    auction_id: Mapped[Integer] = Column(Integer, nullable=False)
+    user_id: Mapped[uuid.UUID] = Column(UUID(as_uuid=True), nullable=False)
+    amount: Mapped[Integer] = Column(Integer, nullable=False)
+    bid_count: Mapped[Integer] = Column(Integer, nullable=False, default=1)
+    last_bid_at: Mapped[DateTime] = Column(DateTime(timezone=True), nullable=False)
@@ -11,6 +11,7 @@ class VehicleManufacturer(ModelDeclarativeBase):
     id: Mapped[Integer] = Column(Integer, primary_key=True, autoincrement=True)
     name: Mapped[String] = Column(String(255), nullable=False, unique=True)
     synonyms: Mapped[ARRAY[String]] = Column(ARRAY(String), nullable=True)
+    version: Mapped[Integer] = Column(Integer, nullable=False, server_default="1")
     created_at: Mapped[DateTime] = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
@@ -15,6 +15,7 @@ class VehicleModel(ModelDeclarativeBase):
         String(50), nullable=False, comment="Default vehicle type for the model (e.g., suv, sedan...)"
     )
     synonyms: Mapped[ARRAY[String]] = Column(ARRAY(String), nullable=True)
+    version: Mapped[Integer] = Column(Integer, nullable=False, server_default="1")
     created_at: Mapped[DateTime] = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[DateTime] = Column(
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
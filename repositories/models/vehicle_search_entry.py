@@ -0,0 +1,43 @@
+from datetime import date
+
+from sqlalchemy import Boolean, Column, Date, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import Mapped, deferred
+
+from database.schema_base import ModelDeclarativeBase
+
+
+class VehicleSearchEntry(ModelDeclarativeBase):
+    """
+    Denormalized copy of the vehicles of open auctions with their auction country and catalog names, for searches
+    across auctions without joining the catalog.
+
+    Maintained by triggers on auction_vehicles and auctions, never written by the application. Catalog renames reach
+    the entries through the vehicles, see CatalogSearchRefresher. Vehicle columns keep their auction_vehicles names
+    so the same filters apply to both tables.
+
+    The auction end is not copied, soft-close extensions move it too often: searches join the auction for it.
+    """
+
+    __tablename__ = "vehicle_search_entries"
+
+    id: Mapped[Integer] = Column(Integer, primary_key=True, autoincrement=False)
+    auction_id: Mapped[Integer] = Column(Integer, nullable=False)
+    auction_country: Mapped[String] = Column(String(2), nullable=False)
+    manufacturer_id: Mapped[Integer] = Column(Integer, nullable=False)
+    manufacturer_name: Mapped[String] = Column(String(255), nullable=False)
+    model_id: Mapped[Integer] = Column(Integer, nullable=False)
+    model_name: Mapped[String] = Column(String(255), nullable=False)
+    manufacturing_date: Mapped[date] = Column(Date, nullable=False)
+    mileage: Mapped[Integer] = Column(Integer, nullable=False)
+    transmission: Mapped[String] = Column(String(255), nullable=False)
+    body_type: Mapped[String] = Column(String(255), nullable=True)
+    color: Mapped[String] = Column(String(255), nullable=True)
+    engine_power: Mapped[Integer] = Column(Integer, nullable=False)
+    engine_cc: Mapped[Integer] = Column(Integer, nullable=False)
+    start_price: Mapped[Integer] = Column(Integer, nullable=False)
+    active: Mapped[bool] = Column(Boolean, nullable=False)
+    is_damaged: Mapped[bool] = Column(Boolean, nullable=False)
+    equipment: Mapped[ARRAY[String]] = Column(ARRAY(String), nullable=True)
+    search_vector: Mapped[TSVECTOR] = deferred(Column(TSVECTOR, nullable=True))
+    updated_at: Mapped[DateTime] = Column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,33 @@
+from sqlalchemy import Column, DateTime, Integer, String, select
+from sqlalchemy.orm import Mapped, column_property
+
+from database.schema_base import ModelDeclarativeBase
+
+from .auction import Auction
+
+
+class VehicleVinHistory(ModelDeclarativeBase):
+    """
+    Appearance of a VIN in an auction with its starting price and result, kept after the auction closes.
+
+    Maintained by triggers on auction_vehicles and auctions, never written by the application. The result is copied
+    from the current bid of the vehicle when its auction closes. The auction end is read from the auction, like the
+    search entries.
+    """
+
+    __tablename__ = "vehicle_vin_history"
+
+    vehicle_id: Mapped[Integer] = Column(Integer, primary_key=True, autoincrement=False)
+    vin: Mapped[String] = Column(String(17), nullable=False)
+    auction_id: Mapped[Integer] = Column(Integer, nullable=False)
+    auction_country: Mapped[String] = Column(String(2), nullable=False)
+    manufacturer_name: Mapped[String] = Column(String(255), nullable=False)
+    model_name: Mapped[String] = Column(String(255), nullable=False)
+    mileage: Mapped[Integer] = Column(Integer, nullable=False)
+    start_price: Mapped[Integer] = Column(Integer, nullable=False)
+    closed_at: Mapped[DateTime | None] = Column(DateTime(timezone=True), nullable=True)
+    final_bid: Mapped[Integer | None] = Column(Integer, nullable=True)
+    bid_count: Mapped[Integer] = Column(Integer, nullable=False, default=0)
+    auction_end_datetime: Mapped[DateTime] = column_property(
+        select(Auction.end_datetime).where(Auction.id == auction_id).correlate_except(Auction).scalar_subquery()
+    )
@@ -0,0 +1,192 @@
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, literal, select, true, update
+from sqlalchemy.dialects.postgresql import insert
+
+from repositories.auction_events_repository import notify_statement
+from repositories.base_repository import BaseRepository
+from repositories.views import BidPlacementView, UserBidView, VehicleBiddingView
+
+from .models import Auction, AuctionVehicle, UserBid, VehicleCurrentBid
+
+
+class UserBidsRepository(BaseRepository):
+    async def get_bidding_state(self, vehicle_id: int) -> VehicleBiddingView | None:
+        query = (
+            select(
+                AuctionVehicle.id.label("vehicle_id"),
+                AuctionVehicle.auction_id,
+                AuctionVehicle.active,
+                AuctionVehicle.start_price,
+                Auction.end_datetime.label("auction_end_datetime"),
+                VehicleCurrentBid.amount.label("current_amount"),
+            )
+            .join(Auction, Auction.id == AuctionVehicle.auction_id)
+            .outerjoin(VehicleCurrentBid, VehicleCurrentBid.vehicle_id == AuctionVehicle.id)
+            .where(AuctionVehicle.id == vehicle_id)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            row = result.first()
+
+            return VehicleBiddingView.model_validate(row) if row else None
+
+    async def place(
+        self,
+        vehicle_id: int,
+        auction_id: int,
+        user_id: uuid.UUID,
+        amount: int,
+        min_increment: int,
+        events: Callable[[UserBidView, datetime | None], list[dict]],
+        soft_close_window: timedelta | None = None,
+        soft_close_extension: timedelta | None = None,
+    ) -> BidPlacementView:
+        """
+        Store a bid if its auction is still open, the vehicle is active and the bid reaches the start price and
+        outbids the current highest bid by at least ``min_increment``.
+
+        The conditional upsert locks only the vehicle's current bid row, so concurrent bids on one vehicle are
+        applied one after another while bids on other vehicles proceed in parallel. It takes its row from the vehicle,
+        only while the vehicle is active and its auction open, so the database rejects bids on closed auctions,
+        inactive vehicles and below the start price whatever the caller's cache says. The bid is inserted in the same
+        statement, only when the upsert went through.
+
+        The auction row is not locked to check it is open, a bid that passed the check before the end may commit
+        right after the close. It was placed in time.
+
+        With a ``soft_close_window``, an accepted bid placed within the window before the end then pushes the end to
+        ``soft_close_extension`` from now. Only that update locks the auction row, after the bid is stored.
+
+        :param events: auction events of the stored bid and the new auction end, notified in its transaction so they
+            are sent exactly when the bid commits, without a second connection
+        """
+        open_auction = (
+            select(Auction.id)
+            .where(Auction.id == auction_id, Auction.closed_at.is_(None), Auction.end_datetime > func.now())
+            .exists()
+        )
+        open_vehicle = (
+            select(AuctionVehicle.id, AuctionVehicle.auction_id, AuctionVehicle.start_price)
+            .where(
+                AuctionVehicle.id == vehicle_id,
+                AuctionVehicle.auction_id == auction_id,
+                AuctionVehicle.active,
+                open_auction,
+            )
+            .cte("open_vehicle")
+        )
+
+        upsert = insert(VehicleCurrentBid).from_select(
+            [
+                VehicleCurrentBid.vehicle_id,
+                VehicleCurrentBid.auction_id,
+                VehicleCurrentBid.user_id,
+                VehicleCurrentBid.amount,
+                VehicleCurrentBid.bid_count,
+                VehicleCurrentBid.last_bid_at,
+            ],
+            select(
+                open_vehicle.c.id,
+                open_vehicle.c.auction_id,
+                literal(user_id, VehicleCurrentBid.user_id.type),
+                literal(amount, VehicleCurrentBid.amount.type),
+                literal(1, VehicleCurrentBid.bid_count.type),
+                func.now(),
+            ).where(open_vehicle.c.start_price <= amount),
+        )
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[VehicleCurrentBid.vehicle_id],
+            set_={
+                VehicleCurrentBid.user_id.key: upsert.excluded.user_id,
+                VehicleCurrentBid.amount.key: upsert.excluded.amount,
+                VehicleCurrentBid.bid_count.key: VehicleCurrentBid.bid_count + 1,
+                VehicleCurrentBid.last_bid_at.key: upsert.excluded.last_bid_at,
+            },
+            where=VehicleCurrentBid.amount + min_increment <= upsert.excluded.amount,
+        ).returning(
+            VehicleCurrentBid.vehicle_id,
+            VehicleCurrentBid.auction_id,
+            VehicleCurrentBid.user_id,
+            VehicleCurrentBid.amount,
+            VehicleCurrentBid.last_bid_at,
+        )
+        current_bid = upsert.cte("current_bid")
+
+        stored_bid = (
+            insert(UserBid)
+            .from_select(
+                [UserBid.vehicle_id, UserBid.auction_id, UserBid.user_id, UserBid.amount, UserBid.created_at],
+                select(
+                    current_bid.c.vehicle_id,
+                    current_bid.c.auction_id,
+                    current_bid.c.user_id,
+                    current_bid.c.amount,
+                    current_bid.c.last_bid_at,
+                ),
+            )
+            .returning(UserBid.vehicle_id, UserBid.auction_id, UserBid.user_id, UserBid.amount, UserBid.created_at)
+            .cte("stored_bid")
+        )
+
+        # No row when the vehicle takes no bids, no bid when it was outbid or below the start price
+        statement = select(
+            open_vehicle.c.start_price,
+            stored_bid.c.vehicle_id,
+            stored_bid.c.auction_id,
+            stored_bid.c.user_id,
+            stored_bid.c.amount,
+            stored_bid.c.created_at,
+        ).outerjoin(stored_bid, true())
+
+        async with self.session_factory() as session:
+            result = await session.execute(statement)
+            row = result.first()
+            if not row:
+                return BidPlacementView(bidding_open=False)
+            if row.vehicle_id is None:
+                return BidPlacementView(bidding_open=True, start_price=row.start_price)
+
+            bid = UserBidView.model_validate(row)
+
+            extended_end_datetime = None
+            if soft_close_window is not None and soft_close_extension is not None:
+                extension = (
+                    update(Auction)
+                    .where(
+                        Auction.id == auction_id,
+                        Auction.closed_at.is_(None),
+                        Auction.end_datetime < func.now() + soft_close_window,
+                    )
+                    .values(end_datetime=func.now() + soft_close_extension)
+                    .returning(Auction.end_datetime)
+                )
+                result = await session.execute(extension)
+                extended_end_datetime = result.scalar_one_or_none()
+
+            for event in events(bid, extended_end_datetime):
+                await session.execute(notify_statement(event))
+
+            return BidPlacementView(
+                bidding_open=True, start_price=row.start_price, bid=bid, extended_end_datetime=extended_end_datetime
+            )
+
+    async def get_latest_by_vehicle_ids(self, vehicle_ids: list[int]) -> dict[int, UserBidView]:
+        """Get the highest bid of every given vehicle in one primary key lookup on the current bids table."""
+        if not vehicle_ids:
+            return {}
+
+        query = select(
+            VehicleCurrentBid.vehicle_id,
+            VehicleCurrentBid.auction_id,
+            VehicleCurrentBid.user_id,
+            VehicleCurrentBid.amount,
+            VehicleCurrentBid.last_bid_at.label("created_at"),
+        ).where(VehicleCurrentBid.vehicle_id.in_(vehicle_ids))
+
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            return {row.vehicle_id: UserBidView.model_validate(row) for row in result.all()}
@@ -13,12 +13,13 @@ class UsersRepository(BaseRepository):
             result = await session.execute(select(User).where(User.id == user_id))
             return result.scalar_one_or_none()
 
-    async def update(self, user: User) -> User:
-        async with self.session_factory() as session:
-            merged_user = await session.merge(user)
-            await session.commit()
+    async def update(self, user_id: uuid.UUID, values: dict, version: int | None = None) -> User | None:
+        """Update the given columns in one statement, None when missing or no longer at ``version``."""
+        statement = self._versioned_update(User, user_id, values, version).returning(User)
 
-            return merged_user
+        async with self.session_factory() as session:
+            result = await session.execute(statement)
+            return result.scalar_one_or_none()
 
     async def create(self, user: User) -> User:
         async with self.session_factory() as session:
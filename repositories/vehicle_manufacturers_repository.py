@@ -30,12 +30,14 @@ class VehicleManufacturersRepository(BaseRepository):
 
         return manufacturer
 
-    async def update(self, manufacturer: VehicleManufacturer) -> VehicleManufacturer:
-        async with self.session_factory() as session:
-            db_manufacturer = await session.merge(manufacturer)
-
-            await session.flush()
-            await session.refresh(db_manufacturer)
-            await session.commit()
+    async def update(
+        self, manufacturer_id: int, values: dict, version: int | None = None
+    ) -> VehicleManufacturer | None:
+        """Update the given columns in one statement, None when missing or no longer at ``version``."""
+        statement = self._versioned_update(VehicleManufacturer, manufacturer_id, values, version).returning(
+            VehicleManufacturer
+        )
 
-            return db_manufacturer
+        async with self.session_factory() as session:
+            result = await session.execute(statement)
+            return result.scalar_one_or_none()
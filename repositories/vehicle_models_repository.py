@@ -44,9 +44,21 @@ class VehicleModelsRepository(BaseRepository):
 
         return model
 
-    async def update(self, model: VehicleModel) -> VehicleModel:
-        async with self.session_factory() as session:
-            merged_model = await session.merge(model)
-            await session.commit()
+    async def update(
+        self, model_id: int, manufacturer_id: int, values: dict, version: int | None = None
+    ) -> VehicleModel | None:
+        """
+        Update the given columns of a manufacturer's model in one statement.
+
+        :return: the updated model, None when it does not exist, belongs to another manufacturer or is no longer
+            at ``version``
+        """
+        statement = (
+            self._versioned_update(VehicleModel, model_id, values, version)
+            .where(VehicleModel.manufacturer_id == manufacturer_id)
+            .returning(VehicleModel)
+        )
 
-            return merged_model
+        async with self.session_factory() as session:
+            result = await session.execute(statement)
+            return result.scalar_one_or_none()
@@ -0,0 +1,35 @@
+from sqlalchemy import select
+
+from repositories.base_repository import BaseRepository
+from repositories.models import VehicleVinHistory
+
+VIN_LENGTH = 17
+
+
+class VehicleVinHistoryRepository(BaseRepository):
+    async def get_by_vin(self, vin: str, limit: int) -> list[VehicleVinHistory]:
+        """
+        Get the auction appearances of a VIN, or of every VIN starting with a partial VIN, latest first.
+
+        Both are answered by one range scan of the VIN index, the few appearances of a VIN are then ordered by the
+        end of their auction. Its pattern operator class compares bytes, so the prefix bounds hold whatever the
+        database collation.
+        """
+        vin_column = VehicleVinHistory.vin
+        if len(vin) == VIN_LENGTH:
+            condition = vin_column == vin
+        else:
+            # VIN characters are ASCII letters and digits, the next character bounds the prefix
+            upper_bound = vin[:-1] + chr(ord(vin[-1]) + 1)
+            condition = vin_column.op("~>=~")(vin) & vin_column.op("~<~")(upper_bound)
+
+        query = (
+            select(VehicleVinHistory)
+            .where(condition)
+            .order_by(vin_column, VehicleVinHistory.auction_end_datetime.desc())
+            .limit(limit)
+        )
+
+        async with self.session_factory() as session:
+            result = await session.execute(query)
+            return result.scalars().all()
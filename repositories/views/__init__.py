@@ -1,15 +1,27 @@
 from .auction_vehicle_view import (
+    AuctionVehicleDetailSchema,
+    AuctionVehicleDetailView,
     AuctionVehicleSchema,
     AuctionVehicleView,
     FacetView,
+    RangeFacetView,
     VehicleManufacturerSchema,
     VehicleModelSchema,
+    VehicleSearchView,
 )
+from .user_bid_view import BidPlacementView, UserBidView, VehicleBiddingView
 
 __all__ = [
     "AuctionVehicleView",
     "AuctionVehicleSchema",
+    "AuctionVehicleDetailView",
+    "AuctionVehicleDetailSchema",
     "FacetView",
+    "RangeFacetView",
     "VehicleManufacturerSchema",
     "VehicleModelSchema",
+    "VehicleSearchView",
+    "BidPlacementView",
+    "UserBidView",
+    "VehicleBiddingView",
 ]
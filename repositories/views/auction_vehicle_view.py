@@ -2,6 +2,8 @@ from datetime import datetime
 
 from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
+from .user_bid_view import UserBidView
+
 
 class AuctionVehicleSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
@@ -15,9 +17,23 @@ class AuctionVehicleSchema(BaseModel):
     engine: str
     transmission: str
     vin: str
+    version: int
     image_list: list[HttpUrl] = Field(default_factory=list)
 
 
+class AuctionVehicleDetailSchema(AuctionVehicleSchema):
+    body_type: str | None
+    color: str | None
+    engine_power: int
+    engine_cc: int
+    start_price: int
+    is_damaged: bool
+    number_plates: str | None
+    equipment: list[str] | None
+    description: str | None
+    damaged_image_list: list[HttpUrl] | None
+
+
 class VehicleManufacturerSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -42,9 +58,33 @@ class FacetView(BaseModel):
     count: int
 
 
+class RangeFacetView(BaseModel):
+    """View for a histogram bucket with its bounds and count, open ended when a bound is None"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    min: int | None
+    max: int | None
+    count: int
+
+
 class AuctionVehicleView(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     vehicle: AuctionVehicleSchema
     manufacturer: VehicleManufacturerSchema
     model: VehicleModelSchema
+
+
+class VehicleSearchView(AuctionVehicleView):
+    auction_country: str
+    auction_end_datetime: datetime
+
+
+class AuctionVehicleDetailView(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    vehicle: AuctionVehicleDetailSchema
+    manufacturer: VehicleManufacturerSchema
+    model: VehicleModelSchema
+    current_bid: UserBidView | None
@@ -0,0 +1,37 @@
+import uuid
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+
+class UserBidView(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    vehicle_id: int
+    auction_id: int
+    user_id: uuid.UUID
+    amount: int
+    created_at: datetime
+
+
+class VehicleBiddingView(BaseModel):
+    """Everything needed to validate a bid on a vehicle"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    vehicle_id: int
+    auction_id: int
+    active: bool
+    start_price: int
+    auction_end_datetime: datetime
+    current_amount: int | None
+
+
+class BidPlacementView(BaseModel):
+    """Outcome of placing a bid"""
+
+    # False when the auction is closed or the vehicle deactivated
+    bidding_open: bool
+    start_price: int | None = None
+    bid: UserBidView | None = None
+    extended_end_datetime: datetime | None = None
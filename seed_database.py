@@ -10,12 +10,19 @@ Usage:
     python seed_database.py --auctions 20      # 20 users, 20 auctions, 8 vehicles
     python seed_database.py --vehicles 50      # 20 users, 10 auctions, 50 vehicles
     python seed_database.py --users 50 --auctions 15 --vehicles 100 --bids 50
+    python seed_database.py --bulk --vehicles 1000000 --workers 4   # COPY based seeding for benchmark datasets
+    python seed_database.py --scale large --random-seed 42          # Preset sizes with realistic distributions
 
 Options:
-    --users     Number of users to generate (default: 20)
-    --auctions  Number of auctions to generate (default: 10)
-    --vehicles  Number of vehicles to generate (default: 8)
-    --bids      Number of user bids to generate (default: 20)
+    --users        Number of users to generate (default: 20)
+    --auctions     Number of auctions to generate (default: 10)
+    --vehicles     Number of vehicles to generate (default: 8)
+    --bids         Number of user bids to generate (default: 20)
+    --bulk         Stream vehicles through COPY in chunks instead of ORM inserts
+    --scale        Dataset size preset (small, medium, large), implies --bulk
+    --random-seed  Seed for the random generators, makes the dataset reproducible
+    --workers      Number of processes generating vehicle rows in bulk mode (default: 1)
+    --chunk-size   Number of vehicles per COPY chunk in bulk mode (default: 10000)
 
 Make sure to run this after the database migrations have been applied.
 """
@@ -24,11 +31,14 @@ import argparse
 import asyncio
 import os
 import random
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
 
 from sqlalchemy import select
 
-from core.logging import logger
+from core.logging import configure_logging, logger
 from database.database import Database
 from database.init_database import async_database_url
 from repositories.models import (
@@ -39,16 +49,176 @@ from repositories.models import (
     VehicleModel,
 )
 
+# Dataset sizes used with --scale, vehicle ids must stay within the 7 digit range of the API contract
+SCALE_PRESETS = {
+    "small": {"auctions": 10, "vehicles": 240, "users": 20},
+    "medium": {"auctions": 100, "vehicles": 100_000, "users": 200},
+    "large": {"auctions": 300, "vehicles": 1_000_000, "users": 1_000},
+}
+
+VIN_CHARS = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
+CAR_IMAGE_IDS = [111, 183, 193, 305, 306, 309, 310, 311, 312, 313, 378, 379, 380]
+IMAGE_SIZES = ["800/600", "600/400", "900/600", "700/500", "1000/700"]
+
+VEHICLE_COPY_COLUMNS = [
+    "id",
+    "auction_id",
+    "manufacturer_id",
+    "model_id",
+    "manufacturing_date",
+    "mileage",
+    "engine",
+    "transmission",
+    "vin",
+    "body_type",
+    "color",
+    "engine_power",
+    "engine_cc",
+    "start_price",
+    "active",
+    "is_damaged",
+    "number_plates",
+    "equipment",
+    "description",
+    "image_list",
+]
+
+
+def build_image_list(index: int) -> list[str]:
+    num_images = 3 + (index % 3)  # 3-5 images
+    image_list = []
+    for img_idx in range(num_images):
+        # Select a car image ID and add some variation
+        base_id = CAR_IMAGE_IDS[(index + img_idx) % len(CAR_IMAGE_IDS)]
+        image_id = base_id + (index * 7 + img_idx * 13) % 50
+        size = IMAGE_SIZES[img_idx % len(IMAGE_SIZES)]
+        image_list.append(f"https://picsum.photos/id/{image_id}/{size}")
+
+    return image_list
+
+
+def build_unique_vin(rng: random.Random, vehicle_id: int) -> str:
+    """Generate a VIN whose serial section encodes the vehicle id, so bulk generated VINs never collide."""
+    wmi = ''.join(rng.choice("ABCDEFGHJKLMNPRSTUVWXYZ") for _ in range(3))
+    vds = ''.join(rng.choice(VIN_CHARS) for _ in range(6))
+
+    vis = []
+    for _ in range(8):
+        vehicle_id, remainder = divmod(vehicle_id, len(VIN_CHARS))
+        vis.append(VIN_CHARS[remainder])
+
+    return wmi + vds + ''.join(reversed(vis))
+
+
+def generate_vehicle_rows(
+    chunk_index: int,
+    first_vehicle_id: int,
+    count: int,
+    random_seed: int | None,
+    auction_ids: list[int],
+    auction_weights: list[float],
+    catalog: list[tuple[int, list[int]]],
+    manufacturer_weights: list[float],
+) -> list[tuple]:
+    """
+    Generate COPY records for one chunk of vehicles.
+
+    Every chunk gets its own generator derived from the seed and the chunk index, so the dataset does not depend
+    on the number of worker processes. Manufacturers follow a Zipf-like popularity curve, auction sizes a
+    log-normal one, and mileage and price depend on the vehicle age.
+    """
+    rng = random.Random(f"{random_seed}:{chunk_index}")
+    current_year = date.today().year
+
+    transmissions = ["Automatic", "Manual", "S tronic", "CVT"]
+    transmission_weights = [55, 35, 5, 5]
+    fuels = ["Diesel", "Petrol", "Hybrid", "Electric"]
+    fuel_weights = [45, 35, 15, 5]
+    body_types = ["sedan", "suv", "hatchback", "wagon", "coupe", "van"]
+    body_type_weights = [30, 30, 20, 12, 4, 4]
+    colors = ["Black", "White", "Grey", "Silver", "Blue", "Red", "Green", "Brown"]
+    color_weights = [25, 22, 18, 15, 10, 6, 2, 2]
+    equipment_options = [
+        "Navigation",
+        "Leather seats",
+        "Air conditioning",
+        "Parking sensors",
+        "Heated seats",
+        "Cruise control",
+        "Panoramic roof",
+        "Towbar",
+    ]
+
+    auctions = rng.choices(auction_ids, weights=auction_weights, k=count)
+    manufacturers = rng.choices(catalog, weights=manufacturer_weights, k=count)
+
+    rows = []
+    for offset in range(count):
+        vehicle_id = first_vehicle_id + offset
+        manufacturer_id, model_ids = manufacturers[offset]
+        # Earlier models of a manufacturer are more popular
+        model_id = rng.choices(model_ids, weights=[1 / (rank + 1) for rank in range(len(model_ids))])[0]
+
+        age_years = min(int(rng.expovariate(1 / 4)), 11)
+        manufacturing_date = date(current_year - age_years, rng.randint(1, 12), rng.randint(1, 28))
+        mileage = max(0, int(age_years * rng.gauss(15000, 5000) + rng.randint(0, 5000)))
+        start_price = max(500, round(rng.lognormvariate(9.9, 0.5) * 0.9**age_years, -2))
+        engine_power = rng.choice([75, 90, 110, 130, 150, 190, 250, 340])
+        fuel = rng.choices(fuels, weights=fuel_weights)[0]
+
+        rows.append(
+            (
+                vehicle_id,
+                auctions[offset],
+                manufacturer_id,
+                model_id,
+                manufacturing_date,
+                mileage,
+                f"{rng.choice([1.0, 1.4, 1.6, 2.0, 2.5, 3.0]):.1f}L {fuel}",
+                rng.choices(transmissions, weights=transmission_weights)[0],
+                build_unique_vin(rng, vehicle_id),
+                rng.choices(body_types, weights=body_type_weights)[0],
+                rng.choices(colors, weights=color_weights)[0],
+                engine_power,
+                rng.choice([999, 1200, 1400, 1598, 1968, 2487, 2993]),
+                int(start_price),
+                rng.random() < 0.85,
+                rng.random() < 0.08,
+                f"GEN-{vehicle_id:04d}",
+                rng.sample(equipment_options, k=rng.randint(2, 6)),
+                f"Generated vehicle {vehicle_id} - {fuel.lower()} in good condition.",
+                build_image_list(vehicle_id),
+            )
+        )
+
+    return rows
+
 
 class DatabaseSeeder:
-    def __init__(self, num_auctions: int = 10, num_vehicles: int = 8, num_users: int = 20):
+    def __init__(
+        self,
+        num_auctions: int = 10,
+        num_vehicles: int = 8,
+        num_users: int = 20,
+        bulk: bool = False,
+        random_seed: int | None = None,
+        workers: int = 1,
+        chunk_size: int = 10_000,
+    ):
         self.db = Database(async_database_url(), os.getenv("POSTGRES_SCHEMA"))
         self.num_auctions = num_auctions
         self.num_vehicles = num_vehicles
         self.num_users = num_users
+        self.bulk = bulk
+        self.random_seed = random_seed
+        self.workers = workers
+        self.chunk_size = chunk_size
 
     async def seed_all(self):
         """Seeds the database with all sample data."""
+        if self.random_seed is not None:
+            random.seed(self.random_seed)
+
         try:
             logger.info(
                 f"Successfully seeded database with {self.num_auctions} auctions, "
@@ -67,7 +237,10 @@ class DatabaseSeeder:
                 await self._seed_vehicle_manufacturers(session)
                 await self._seed_vehicle_models(session)
                 await self._seed_auctions(session)
-                await self._seed_auction_vehicles(session)
+                if self.bulk:
+                    await self._seed_auction_vehicles_bulk(session)
+                else:
+                    await self._seed_auction_vehicles(session)
 
                 logger.info("Database seeding completed successfully!")
 
@@ -627,6 +800,94 @@ class DatabaseSeeder:
         await session.flush()
         logger.info(f"Added {len(vehicles)} vehicles")
 
+    async def _seed_auction_vehicles_bulk(self, session):
+        """Seeds vehicle data by streaming generated chunks through COPY."""
+        logger.info(
+            f"Bulk seeding {self.num_vehicles} vehicles in chunks of {self.chunk_size} "
+            f"with {self.workers} worker(s)..."
+        )
+
+        auction_result = await session.execute(select(Auction.id).order_by(Auction.id))
+        auction_ids = list(auction_result.scalars().all())
+
+        model_result = await session.execute(
+            select(VehicleModel.manufacturer_id, VehicleModel.id).order_by(
+                VehicleModel.manufacturer_id, VehicleModel.id
+            )
+        )
+        models_by_manufacturer: dict[int, list[int]] = {}
+        for manufacturer_id, model_id in model_result.all():
+            models_by_manufacturer.setdefault(manufacturer_id, []).append(model_id)
+
+        if not auction_ids or not models_by_manufacturer:
+            logger.warning("No auctions or models found, cannot seed vehicles")
+            return
+
+        # Popularity ranks and auction sizes are drawn once, so every chunk shares the same distributions
+        rng = random.Random(self.random_seed)
+        catalog = list(models_by_manufacturer.items())
+        rng.shuffle(catalog)
+        manufacturer_weights = [1 / (rank + 1) ** 1.1 for rank in range(len(catalog))]
+        auction_weights = [rng.lognormvariate(0, 1) for _ in auction_ids]
+
+        chunks = iter(
+            (chunk_index, 1000000 + first, min(self.chunk_size, self.num_vehicles - first))
+            for chunk_index, first in enumerate(range(0, self.num_vehicles, self.chunk_size))
+        )
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        driver_connection = raw_connection.driver_connection
+
+        loop = asyncio.get_running_loop()
+        # Without extra workers rows are generated in the default thread pool, overlapping with COPY
+        executor = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 1 else None
+        in_flight = deque()
+
+        def submit_next_chunk():
+            chunk = next(chunks, None)
+            if chunk is not None:
+                in_flight.append(
+                    loop.run_in_executor(
+                        executor,
+                        generate_vehicle_rows,
+                        *chunk,
+                        self.random_seed,
+                        auction_ids,
+                        auction_weights,
+                        catalog,
+                        manufacturer_weights,
+                    )
+                )
+
+        start_time = time.perf_counter()
+        copied = 0
+        try:
+            # Keep a bounded number of generated chunks in memory
+            for _ in range(self.workers * 2):
+                submit_next_chunk()
+
+            while in_flight:
+                records = await in_flight.popleft()
+                submit_next_chunk()
+
+                await driver_connection.copy_records_to_table(
+                    AuctionVehicle.__tablename__,
+                    records=records,
+                    columns=VEHICLE_COPY_COLUMNS,
+                    schema_name=self.db.schema,
+                )
+                copied += len(records)
+
+                elapsed = time.perf_counter() - start_time
+                logger.info(f"Copied {copied}/{self.num_vehicles} vehicles ({copied / elapsed:.0f} rows/sec)")
+        finally:
+            if executor:
+                executor.shutdown(cancel_futures=True)
+
+        elapsed = time.perf_counter() - start_time
+        logger.info(f"Added {copied} vehicles in {elapsed:.1f}s ({copied / elapsed:.0f} rows/sec)")
+
     async def generate_realistic_vin(self) -> str:
         """Generate a more realistic VIN following standard structure"""
         valid_chars = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
@@ -643,42 +904,37 @@ class DatabaseSeeder:
         return wmi + vds + vis
 
     async def generate_images(self, index) -> list[str]:
-        num_images = 3 + (index % 3)  # 3-5 images
-        image_list = []
-        for img_idx in range(num_images):
-            car_image_ids = [
-                111,
-                183,
-                193,
-                305,
-                306,
-                309,
-                310,
-                311,
-                312,
-                313,
-                378,
-                379,
-                380,
-            ]
+        return build_image_list(index)
+
+    async def cleanup(self):
+        """Cleanup database connections."""
+        await self.db.close_db()
 
-            # Select a random car image ID and add some randomness
-            base_id = car_image_ids[(index + img_idx) % len(car_image_ids)]
-            random_offset = (index * 7 + img_idx * 13) % 50  # Add some variation
-            image_id = base_id + random_offset
 
-            # Different image sizes for variety
-            sizes = ["800/600", "600/400", "900/600", "700/500", "1000/700"]
-            size = sizes[img_idx % len(sizes)]
+def add_bulk_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--bulk", action="store_true", help="Seed vehicles through COPY instead of ORM inserts")
+    parser.add_argument(
+        "--scale", choices=SCALE_PRESETS.keys(), help="Dataset size preset with realistic distributions, implies --bulk"
+    )
+    parser.add_argument("--random-seed", type=int, default=None, help="Seed for reproducible datasets")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Processes generating vehicles in bulk mode (default: 1)"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=10_000, help="Vehicles per COPY chunk in bulk mode (default: 10000)"
+    )
 
-            image_url = f"https://picsum.photos/id/{image_id}/{size}"
-            image_list.append(image_url)
 
-        return image_list
+def apply_scale_preset(args: argparse.Namespace) -> None:
+    if not args.scale:
+        return
 
-    async def cleanup(self):
-        """Cleanup database connections."""
-        await self.db.close_db()
+    preset = SCALE_PRESETS[args.scale]
+    args.auctions = preset["auctions"]
+    args.vehicles = preset["vehicles"]
+    if hasattr(args, "users"):
+        args.users = preset["users"]
+    args.bulk = True
 
 
 async def main():
@@ -687,10 +943,20 @@ async def main():
     parser.add_argument("--auctions", type=int, default=10, help="Number of auctions to generate (default: 10)")
     parser.add_argument("--vehicles", type=int, default=8, help="Number of vehicles to generate (default: 8)")
     parser.add_argument("--users", type=int, default=20, help="Number of users to generate (default: 20)")
+    add_bulk_arguments(parser)
 
     args = parser.parse_args()
-
-    seeder = DatabaseSeeder(num_auctions=args.auctions, num_vehicles=args.vehicles, num_users=args.users)
+    apply_scale_preset(args)
+
+    seeder = DatabaseSeeder(
+        num_auctions=args.auctions,
+        num_vehicles=args.vehicles,
+        num_users=args.users,
+        bulk=args.bulk,
+        random_seed=args.random_seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
 
     try:
         await seeder.seed_all()
@@ -702,4 +968,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(main())
@@ -12,6 +12,7 @@ Usage:
     python seed_utility.py --seed --auctions 15 --vehicles 100 --bids 50 # Seed with 15 auctions, 100 vehicles, 50 bids
     python seed_utility.py --clear                             # Clear all data
     python seed_utility.py --reset --auctions 5 --vehicles 20  # Clear and then seed with custom amounts
+    python seed_utility.py --reset --scale large --workers 4   # Clear and bulk seed a benchmark sized dataset
 
 Options:
     --seed      Seed the database with sample data
@@ -19,6 +20,8 @@ Options:
     --reset     Clear and then seed the database
     --auctions  Number of auctions to generate (default: 10)
     --vehicles  Number of vehicles to generate (default: 8)
+
+Bulk seeding options (--bulk, --scale, --random-seed, --workers, --chunk-size) are described in seed_database.py.
 """
 
 import argparse
@@ -27,17 +30,17 @@ import os
 
 from sqlalchemy import text
 
-from core.logging import logger
+from core.logging import configure_logging, logger
 from database.database import Database
 from database.init_database import async_database_url
-from seed_database import DatabaseSeeder
+from seed_database import DatabaseSeeder, add_bulk_arguments, apply_scale_preset
 
 
 class SeedUtility:
-    def __init__(self, num_auctions: int = 10, num_vehicles: int = 8, num_bids: int = 20):
+    def __init__(self, num_auctions: int = 10, num_vehicles: int = 8, num_bids: int = 20, **seeder_options):
         self.postgres_schema = os.getenv("POSTGRES_SCHEMA")
         self.db = Database(async_database_url(), self.postgres_schema)
-        self.seeder = DatabaseSeeder(num_auctions=num_auctions, num_vehicles=num_vehicles)
+        self.seeder = DatabaseSeeder(num_auctions=num_auctions, num_vehicles=num_vehicles, **seeder_options)
 
     async def clear_database(self):
         """Clears all data from the database tables."""
@@ -98,9 +101,20 @@ async def main():
         '--bids', type=int, default=20, help='Number of user bids to generate when seeding (default: 20)'
     )
 
-    args = parser.parse_args()
+    add_bulk_arguments(parser)
 
-    utility = SeedUtility(num_auctions=args.auctions, num_vehicles=args.vehicles, num_bids=args.bids)
+    args = parser.parse_args()
+    apply_scale_preset(args)
+
+    utility = SeedUtility(
+        num_auctions=args.auctions,
+        num_vehicles=args.vehicles,
+        num_bids=args.bids,
+        bulk=args.bulk,
+        random_seed=args.random_seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+    )
 
     try:
         if args.seed:
@@ -120,4 +134,5 @@ async def main():
 
 
 if __name__ == "__main__":
+    configure_logging()
     asyncio.run(main())
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Production server
+
+Runs the API in `settings.server_workers` uvicorn worker processes:
+- uvloop and httptools are used when installed, the asyncio loop and h11 otherwise
+- a worker is replaced after serving SERVER_MAX_REQUESTS requests, which bounds slow memory growth
+- SIGHUP restarts the workers one by one, SIGTERM drains in-flight requests for up to
+  SERVER_GRACEFUL_SHUTDOWN_SECONDS
+- every worker sizes its database pool so that all workers together stay within DB_CONNECTION_BUDGET
+
+Usage:
+    python server.py
+    SERVER_WORKERS=4 DB_CONNECTION_BUDGET=80 python server.py
+"""
+
+import importlib.util
+import os
+
+import uvicorn
+
+from core.config import settings
+from core.logging import UVICORN_LOGGING_CONFIG, configure_logging, logger
+
+
+def main() -> None:
+    workers = settings.server_workers
+    # Workers are spawned processes reading the settings again, they need the count to size their pools
+    os.environ["SERVER_WORKERS"] = str(workers)
+
+    logger.info(
+        "Starting %s workers on %s:%s, event loop: %s, HTTP parser: %s, pool per worker: %s + %s overflow",
+        workers,
+        settings.SERVER_HOST,
+        settings.SERVER_PORT,
+        "uvloop" if importlib.util.find_spec("uvloop") else "asyncio",
+        "httptools" if importlib.util.find_spec("httptools") else "h11",
+        settings.db_pool_size,
+        settings.db_max_overflow,
+    )
+
+    uvicorn.run(
+        "main_api:app",
+        host=settings.SERVER_HOST,
+        port=settings.SERVER_PORT,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        limit_max_requests=settings.SERVER_MAX_REQUESTS,
+        timeout_graceful_shutdown=settings.SERVER_GRACEFUL_SHUTDOWN_SECONDS,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE_SECONDS,
+        log_config=UVICORN_LOGGING_CONFIG,
+        # RequestMiddleware already logs every request
+        access_log=False,
+    )
+
+
+if __name__ == "__main__":
+    configure_logging()
+    main()
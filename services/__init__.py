@@ -1,11 +1,32 @@
+from .auction_scheduler import AuctionLifecycleScheduler
+from .auction_vehicles_ingest_service import AuctionVehiclesIngestService
 from .auction_vehicles_service import AuctionVehiclesService
 from .auctions_service import AuctionsService
+from .bid_price_cache import BidPriceCache
+from .catalog_cache import VehicleCatalogCache
+from .catalog_search_refresher import CatalogSearchRefresher
+from .health_monitor import DatabaseHealthMonitor
+from .live_feed import AuctionEventsListener, LiveFeedHub
+from .user_bids_service import UserBidsService
 from .users_service import UsersService
+from .vehicle_detail_cache import VehicleDetailCache
 from .vehicle_manufacturers_service import VehicleManufacturersService
+from .warmup import StartupWarmup
 
 __all__ = [
     "AuctionsService",
     "AuctionVehiclesService",
+    "AuctionVehiclesIngestService",
+    "VehicleCatalogCache",
+    "CatalogSearchRefresher",
+    "BidPriceCache",
+    "VehicleDetailCache",
+    "LiveFeedHub",
+    "AuctionEventsListener",
+    "AuctionLifecycleScheduler",
+    "UserBidsService",
     "VehicleManufacturersService",
     "UsersService",
+    "StartupWarmup",
+    "DatabaseHealthMonitor",
 ]
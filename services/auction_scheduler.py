@@ -0,0 +1,173 @@
+import asyncio
+import contextlib
+from datetime import UTC, datetime
+
+import asyncpg
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy.engine import make_url
+
+from core.logging import logger
+from repositories import AuctionEventsRepository, AuctionsRepository, AuctionVehiclesRepository
+
+# Advisory lock key held by the worker running the scheduler
+AUCTION_SCHEDULER_LOCK_ID = 4_187_262_631
+DEACTIVATION_BATCH_SIZE = 1000
+# The leader pings its lock connection this often and steps down when a ping fails or times out
+LEADER_CHECK_SECONDS = 10
+LEADER_CHECK_TIMEOUT_SECONDS = 5
+
+
+def _close_job_id(auction_id: int) -> str:
+    return f"close-auction-{auction_id}"
+
+
+class AuctionLifecycleScheduler:
+    """
+    Closes auctions at their end and deactivates their vehicles.
+
+    Every auction gets a one-off job at its end in an in-memory APScheduler job store, which keeps jobs ordered
+    by run time and sleeps until the next one is due instead of polling the table. Only one API worker runs the
+    jobs: the one holding a Postgres advisory lock on a dedicated connection. The others retry to take it over
+    and do so as soon as the leader's connection is gone. The leader pings that connection, a half-open connection
+    never reports its termination while the server may already have released the lock.
+    """
+
+    def __init__(
+        self,
+        auctions_repository: AuctionsRepository,
+        auction_vehicles_repository: AuctionVehiclesRepository,
+        auction_events_repository: AuctionEventsRepository,
+        database_url: str,
+        enabled: bool,
+        resync_seconds: int,
+        leader_retry_seconds: int,
+    ):
+        self.auctions_repository = auctions_repository
+        self.auction_vehicles_repository = auction_vehicles_repository
+        self.auction_events_repository = auction_events_repository
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.enabled = enabled
+        self.resync_seconds = resync_seconds
+        self.leader_retry_seconds = leader_retry_seconds
+        self.scheduler: AsyncIOScheduler | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self.scheduler is not None
+
+    async def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run(), name="auction-lifecycle-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    def schedule_close(self, auction_id: int, end_datetime: datetime) -> None:
+        if not self.is_leader:
+            return
+
+        self.scheduler.add_job(
+            self._close_auction,
+            trigger="date",
+            run_date=end_datetime,
+            args=[auction_id],
+            id=_close_job_id(auction_id),
+            replace_existing=True,
+            # Auctions that ended while no worker was leading are closed right away
+            misfire_grace_time=None,
+        )
+
+    def handle_event(self, event: dict, payload: str) -> None:
+        """Move the close of soft-close extended auctions, received through the auction events listener."""
+        if event["type"] == "auction_extended":
+            self.schedule_close(event["auction_id"], datetime.fromisoformat(event["end_datetime"]))
+
+    async def _run(self) -> None:
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                if await connection.fetchval("SELECT pg_try_advisory_lock($1)", AUCTION_SCHEDULER_LOCK_ID):
+                    await self._lead(connection)
+            except Exception:
+                # Database errors surface from asyncpg and SQLAlchemy alike, none may end the scheduler
+                logger.exception("Auction scheduler failed, retrying in %ss", self.leader_retry_seconds)
+            finally:
+                self._stop_scheduler()
+                if connection is not None and not connection.is_closed():
+                    # Closing the session releases the advisory lock
+                    with contextlib.suppress(Exception):
+                        await connection.close(timeout=LEADER_CHECK_TIMEOUT_SECONDS)
+
+            await asyncio.sleep(self.leader_retry_seconds)
+
+    async def _lead(self, connection: asyncpg.Connection) -> None:
+        logger.info("Became the auction scheduler leader")
+        closed = asyncio.Event()
+        connection.add_termination_listener(lambda _: closed.set())
+
+        self.scheduler = AsyncIOScheduler(timezone=UTC, job_defaults={"coalesce": True, "max_instances": 1})
+        self.scheduler.start()
+        # Picks up auctions created or changed outside of the API
+        self.scheduler.add_job(self._resync, trigger="interval", seconds=self.resync_seconds, id="resync-auctions")
+        await self._resync()
+
+        while not closed.is_set():
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(closed.wait(), LEADER_CHECK_SECONDS)
+                break
+
+            try:
+                await asyncio.wait_for(connection.fetchval("SELECT 1"), LEADER_CHECK_TIMEOUT_SECONDS)
+            except Exception as e:
+                logger.warning("Auction scheduler leader connection check failed: %r", e)
+                break
+
+        logger.warning("Lost the auction scheduler leader connection")
+
+    def _stop_scheduler(self) -> None:
+        if self.scheduler is not None:
+            self.scheduler.shutdown(wait=False)
+            self.scheduler = None
+
+    async def _resync(self) -> None:
+        end_datetimes = await self.auctions_repository.get_open_end_datetimes()
+        for auction_id, end_datetime in end_datetimes.items():
+            self.schedule_close(auction_id, end_datetime)
+
+        logger.info("Scheduled the close of %s open auctions", len(end_datetimes))
+
+        # Closes interrupted between committing the close and deactivating the last vehicle
+        for auction_id, closed_at in (await self.auctions_repository.get_closed_with_active_vehicles()).items():
+            await self._deactivate_vehicles(auction_id, closed_at)
+
+    async def _close_auction(self, auction_id: int) -> None:
+        closed_at = await self.auctions_repository.close(auction_id)
+        if closed_at is None:
+            auction = await self.auctions_repository.get_by_id(auction_id)
+            if auction and auction.closed_at is None:
+                # Extended by a late bid after the job was scheduled
+                self.schedule_close(auction_id, auction.end_datetime)
+            return
+
+        await self._deactivate_vehicles(auction_id, closed_at)
+
+    async def _deactivate_vehicles(self, auction_id: int, closed_at: datetime) -> None:
+        # Short batches keep bids on other vehicles going, the resync finishes what a failure left over
+        deactivated = 0
+        while batch := await self.auction_vehicles_repository.deactivate_by_auction_id(
+            auction_id, DEACTIVATION_BATCH_SIZE
+        ):
+            deactivated += batch
+
+        logger.info("Closed auction %s and deactivated %s vehicles", auction_id, deactivated)
+        await self.auction_events_repository.notify(
+            {"type": "auction_closed", "auction_id": auction_id, "closed_at": closed_at.isoformat()}
+        )
@@ -0,0 +1,149 @@
+import time
+from collections.abc import AsyncIterator
+
+from pydantic import ValidationError
+
+from contracts import AuctionVehicleIngestError, AuctionVehicleIngestRow, AuctionVehiclesIngestResponse
+from core.logging import logger
+from exceptions.types import NotFoundError
+from repositories import AuctionEventsRepository, AuctionsRepository, AuctionVehiclesRepository
+from services.catalog_cache import CatalogSnapshot, VehicleCatalogCache
+
+MAX_REPORTED_ERRORS = 1000
+
+
+class AuctionVehiclesIngestService:
+    def __init__(
+        self,
+        auction_vehicles_repository: AuctionVehiclesRepository,
+        auctions_repository: AuctionsRepository,
+        auction_events_repository: AuctionEventsRepository,
+        catalog_cache: VehicleCatalogCache,
+        batch_size: int,
+    ):
+        self.auction_vehicles_repository = auction_vehicles_repository
+        self.auctions_repository = auctions_repository
+        self.auction_events_repository = auction_events_repository
+        self.catalog_cache = catalog_cache
+        self.batch_size = batch_size
+
+    async def ingest(self, auction_id: int, body: AsyncIterator[bytes]) -> AuctionVehiclesIngestResponse:
+        """Validate NDJSON rows as they arrive and upsert them in batches, collecting per-row errors."""
+        auction = await self.auctions_repository.get_by_id(auction_id)
+        if not auction:
+            raise NotFoundError(auction_id, "Auction")
+
+        catalog = await self.catalog_cache.get()
+        start_time = time.perf_counter()
+
+        received = upserted = failed = 0
+        errors: list[AuctionVehicleIngestError] = []
+        batch: list[tuple[int, str, dict]] = []
+
+        def reject(line_number: int, vin: str | None, error: str) -> None:
+            nonlocal failed
+            failed += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(AuctionVehicleIngestError(line=line_number, vin=vin, error=error))
+
+        async def flush() -> None:
+            nonlocal upserted
+            batch_errors = await self.auction_vehicles_repository.upsert_many([vehicle for _, _, vehicle in batch])
+            upserted += len(batch) - len(batch_errors)
+            for index, error in batch_errors:
+                line_number, vin, _ = batch[index]
+                reject(line_number, vin, error)
+            batch.clear()
+
+        async for line_number, line in self._iter_lines(body):
+            received += 1
+            try:
+                row = AuctionVehicleIngestRow.model_validate_json(line)
+            except ValidationError as e:
+                reject(line_number, None, "; ".join(error["msg"] for error in e.errors()))
+                continue
+
+            vehicle, error = self._to_vehicle(auction_id, row, catalog)
+            if error:
+                reject(line_number, row.vin, error)
+                continue
+
+            batch.append((line_number, row.vin, vehicle))
+            if len(batch) >= self.batch_size:
+                await flush()
+
+        if batch:
+            await flush()
+
+        if upserted:
+            # Lets every worker drop the auction's cached vehicle details
+            await self.auction_events_repository.notify(
+                {"type": "vehicles_ingested", "auction_id": auction_id, "upserted": upserted}
+            )
+
+        duration = time.perf_counter() - start_time
+        logger.info(
+            f"Ingested {upserted}/{received} vehicles into auction {auction_id} in {duration:.2f}s "
+            f"({failed} rejected)"
+        )
+
+        return AuctionVehiclesIngestResponse(
+            received=received,
+            upserted=upserted,
+            failed=failed,
+            errors=errors,
+            duration_ms=int(duration * 1000),
+            rows_per_second=round(received / duration, 2) if duration > 0 else 0,
+        )
+
+    def _to_vehicle(
+        self, auction_id: int, row: AuctionVehicleIngestRow, catalog: CatalogSnapshot
+    ) -> tuple[dict | None, str | None]:
+        manufacturer_id = catalog.resolve_manufacturer(row.manufacturer)
+        if manufacturer_id is None:
+            return None, f"Unknown manufacturer '{row.manufacturer}'"
+
+        model_id = catalog.resolve_model(manufacturer_id, row.model)
+        if model_id is None:
+            return None, f"Unknown model '{row.model}' for manufacturer '{row.manufacturer}'"
+
+        return {
+            "id": row.vehicle_id,
+            "auction_id": auction_id,
+            "manufacturer_id": manufacturer_id,
+            "model_id": model_id,
+            "manufacturing_date": row.manufacturing_date,
+            "mileage": row.mileage,
+            "engine": row.engine,
+            "transmission": row.transmission,
+            "vin": row.vin,
+            "body_type": row.body_type,
+            "color": row.color,
+            "engine_power": row.engine_power,
+            "engine_cc": row.engine_cc,
+            "start_price": row.start_price,
+            "active": row.is_active,
+            "is_damaged": row.is_damaged,
+            "number_plates": row.number_plates,
+            "equipment": row.equipment,
+            "description": row.description,
+            "image_list": [str(image) for image in row.images],
+            "damaged_image_list": [str(image) for image in row.damaged_images],
+        }, None
+
+    @staticmethod
+    async def _iter_lines(body: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+        """Split a chunked request body into numbered, non-empty lines without buffering the whole body."""
+        buffer = b""
+        line_number = 0
+
+        async for chunk in body:
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line_number += 1
+                if line.strip():
+                    yield line_number, line
+
+        if buffer.strip():
+            yield line_number + 1, buffer
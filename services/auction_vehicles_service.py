@@ -1,23 +1,52 @@
 import asyncio
+import csv
+import io
+import time
+from collections.abc import AsyncIterator, Awaitable
+from typing import NoReturn
 
 from contracts import (
+    AuctionVehicle,
+    AuctionVehicleFacet,
     AuctionVehicleFacets,
+    AuctionVehicleFacetsResponse,
     AuctionVehicleResponse,
+    AuctionVehiclesBulkPatch,
+    AuctionVehiclesBulkUpdateRequest,
+    AuctionVehiclesBulkUpdateResponse,
+    AuctionVehiclesExportQuery,
+    AuctionVehiclesFilter,
     AuctionVehiclesQuery,
     AuctionVehiclesResponse,
     AuctionVehicleUpdateRequest,
+    VehicleSearchQuery,
+    VehicleSearchResponse,
+    VehicleSearchResult,
+    VehicleVinHistoryResponse,
 )
 from core.logging import logger
-from exceptions.types import NotFoundError
+from exceptions.base import AppError
+from exceptions.types import NotFoundError, VersionConflictError
 from mappers import AuctionVehicleMapper
 from repositories import (
+    AuctionEventsRepository,
     AuctionVehiclesRepository,
+    UserBidsRepository,
     VehicleManufacturersRepository,
     VehicleModelsRepository,
+    VehicleVinHistoryRepository,
 )
-from repositories.models import User
+from repositories.models import AuctionVehicle as AuctionVehicleModel
 from repositories.views import FacetView
-from services.filters import AuctionVehicleFilterBuilder
+from services.bid_price_cache import BidPriceCache
+from services.filters import AuctionVehicleFilterBuilder, VehicleSearchFilterBuilder
+from services.pagination import decode_cursor, encode_cursor
+from services.vehicle_detail_cache import VehicleDetailCache
+
+EXPORT_BATCH_SIZE = 1000
+# Bids change by the second, exports only carry the vehicle data
+EXPORT_EXCLUDED_FIELDS = {"client_bid"}
+EXPORT_CSV_COLUMNS = [name for name in AuctionVehicle.model_fields if name not in EXPORT_EXCLUDED_FIELDS]
 
 
 class AuctionVehiclesService:
@@ -26,113 +55,345 @@ class AuctionVehiclesService:
         auction_vehicles_repository: AuctionVehiclesRepository,
         vehicle_manufacturers_repository: VehicleManufacturersRepository,
         vehicle_models_repository: VehicleModelsRepository,
+        user_bids_repository: UserBidsRepository,
+        auction_events_repository: AuctionEventsRepository,
+        vehicle_vin_history_repository: VehicleVinHistoryRepository,
+        vehicle_detail_cache: VehicleDetailCache,
+        bid_price_cache: BidPriceCache,
+        bulk_update_batch_size: int,
+        count_strategy: str,
+        count_threshold: int,
     ):
         self.auction_vehicles_repository = auction_vehicles_repository
         self.vehicle_manufacturers_repository = vehicle_manufacturers_repository
         self.vehicle_models_repository = vehicle_models_repository
+        self.user_bids_repository = user_bids_repository
+        self.auction_events_repository = auction_events_repository
+        self.vehicle_vin_history_repository = vehicle_vin_history_repository
+        self.vehicle_detail_cache = vehicle_detail_cache
+        self.bid_price_cache = bid_price_cache
+        self.bulk_update_batch_size = bulk_update_batch_size
+        self.count_strategy = count_strategy
+        self.count_threshold = count_threshold
 
     async def get_auction_vehicles_list(
         self, auction_id: int, parameters: AuctionVehiclesQuery
     ) -> AuctionVehiclesResponse:
-        filter_builder = AuctionVehicleFilterBuilder(parameters)
-        filters = filter_builder.build_main_filters()
+        filters = AuctionVehicleFilterBuilder(parameters).build_main_filters()
 
-        auction_vehicles, auctions_total, vehicle_bids, facets = await asyncio.gather(
-            self.auction_vehicles_repository.get_by_auction_id(
+        # Only the requested sections are queried, the others are left out of the response
+        sections = {}
+        if "items" in parameters.include:
+            sections["items"] = self._get_items(auction_id, parameters, filters)
+        if "total" in parameters.include:
+            sections["total"] = self.auction_vehicles_repository.get_by_auction_id_count(
                 auction_id=auction_id,
-                _from=parameters.from_,
-                size=parameters.size,
+                strategy=self.count_strategy,
+                threshold=self.count_threshold,
                 **filters,
-            ),
-            self.auction_vehicles_repository.get_by_auction_id_count(
-                auction_id=auction_id,
+            )
+        if "facets" in parameters.include:
+            sections["facets"] = self._get_facets(parameters, self._get_auction_facets(auction_id, parameters))
+
+        results = dict(zip(sections, await asyncio.gather(*sections.values()), strict=True))
+        if "total" in results:
+            results["total"], results["total_exact"] = results["total"]
+        if "items" in results:
+            results["items"], results["next_cursor"] = results["items"]
+
+        return AuctionVehiclesResponse(**results)
+
+    async def get_auction_vehicle_facets(
+        self, auction_id: int, parameters: AuctionVehiclesFilter
+    ) -> AuctionVehicleFacetsResponse:
+        facets = await self._get_facets(parameters, self._get_auction_facets(auction_id, parameters))
+        return AuctionVehicleFacetsResponse(facets=facets)
+
+    async def search_vehicles(self, parameters: VehicleSearchQuery) -> VehicleSearchResponse:
+        """Search the vehicles of every open auction, from the search entries maintained by the database."""
+        filter_builder = VehicleSearchFilterBuilder(parameters)
+        filters = filter_builder.build_main_filters()
+
+        sections = {}
+        if "items" in parameters.include:
+            sections["items"] = self._search_items(parameters, filters)
+        if "total" in parameters.include:
+            sections["total"] = self.auction_vehicles_repository.search_count(
+                strategy=self.count_strategy,
+                threshold=self.count_threshold,
                 **filters,
-            ),
-            self._get_facets(auction_id, parameters),
-        )
+            )
+        if "facets" in parameters.include:
+            facets_query = self.auction_vehicles_repository.get_search_facets(filter_builder.build_facet_filters())
+            sections["facets"] = self._get_facets(parameters, facets_query)
 
-        logger.info("user bids: %s", vehicle_bids)
+        results = dict(zip(sections, await asyncio.gather(*sections.values()), strict=True))
+        if "total" in results:
+            results["total"], results["total_exact"] = results["total"]
+        if "items" in results:
+            results["items"], results["next_cursor"] = results["items"]
 
-        auction_vehicles_list = AuctionVehicleMapper.to_contract_list_with_bids(
-            auction_vehicle_views=auction_vehicles,
+        return VehicleSearchResponse(**results)
+
+    async def get_vin_history(self, vin: str, limit: int) -> VehicleVinHistoryResponse:
+        """Auction appearances of a VIN with their results, or of every VIN starting with a partial VIN."""
+        appearances = await self.vehicle_vin_history_repository.get_by_vin(vin.upper(), limit)
+        return VehicleVinHistoryResponse(
+            items=[AuctionVehicleMapper.to_vin_appearance_contract(appearance) for appearance in appearances]
         )
 
-        return AuctionVehiclesResponse(
-            total=auctions_total,
-            items=auction_vehicles_list,
-            facets=facets,
+    async def export_auction_vehicles(
+        self, auction_id: int, parameters: AuctionVehiclesExportQuery
+    ) -> AsyncIterator[bytes]:
+        """Serialize vehicles of an auction batch by batch as NDJSON lines or CSV rows."""
+        filters = AuctionVehicleFilterBuilder(parameters).build_main_filters()
+        batches = self.auction_vehicles_repository.stream_by_auction_id(
+            auction_id=auction_id,
+            batch_size=EXPORT_BATCH_SIZE,
+            **filters,
         )
 
+        if parameters.format == "csv":
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=EXPORT_CSV_COLUMNS)
+            writer.writeheader()
+            yield buffer.getvalue().encode()
+
+        async for views in batches:
+            vehicles = AuctionVehicleMapper.to_contract_list(views)
+
+            if parameters.format == "csv":
+                buffer.seek(0)
+                buffer.truncate()
+                writer.writerows(
+                    {
+                        **vehicle.model_dump(mode="json", exclude=EXPORT_EXCLUDED_FIELDS),
+                        "images": " ".join(map(str, vehicle.images)),
+                    }
+                    for vehicle in vehicles
+                )
+                yield buffer.getvalue().encode()
+            else:
+                yield b"".join(
+                    vehicle.model_dump_json(exclude=EXPORT_EXCLUDED_FIELDS).encode() + b"\n" for vehicle in vehicles
+                )
+
+    async def get_auction_vehicle_detail(self, vehicle_id: int) -> bytes:
+        """Get the serialized AuctionVehicleDetailResponse of a vehicle."""
+        content = await self.vehicle_detail_cache.get(vehicle_id)
+        if content is None:
+            raise NotFoundError(vehicle_id, "AuctionVehicle")
+
+        return content
+
     async def update_auction_vehicle(
         self, vehicle_id: int, request: AuctionVehicleUpdateRequest
     ) -> AuctionVehicleResponse:
-        current_vehicle = await self.auction_vehicles_repository.get_by_id(vehicle_id)
-        if not current_vehicle:
+        values = request.model_dump(exclude_none=True, exclude={"version"})
+        if "is_active" in values:
+            values["active"] = values.pop("is_active")
+
+        vehicle_view = await self.auction_vehicles_repository.update(vehicle_id, values, request.version)
+        if vehicle_view is None:
+            await self._raise_update_failure(vehicle_id, request)
+
+        self.vehicle_detail_cache.invalidate(vehicle_id)
+        self.bid_price_cache.invalidate(vehicle_id)
+        auction_vehicle = AuctionVehicleMapper.to_contract(vehicle_view)
+
+        await self.auction_events_repository.notify(
+            {
+                "type": "vehicle_updated",
+                "auction_id": vehicle_view.vehicle.auction_id,
+                "vehicle_id": vehicle_view.vehicle.id,
+                # Images are left out to stay within the notification payload limit
+                "vehicle": auction_vehicle.model_dump(mode="json", exclude={"images", "client_bid"}),
+            }
+        )
+
+        return AuctionVehicleResponse(vehicle=auction_vehicle)
+
+    async def bulk_update_auction_vehicles(
+        self, auction_id: int, request: AuctionVehiclesBulkUpdateRequest
+    ) -> AuctionVehiclesBulkUpdateResponse:
+        """Apply a patch to the listed or filtered vehicles of an auction in batches of set-based UPDATEs."""
+        values = await self._get_bulk_update_values(request.patch)
+        start_time = time.perf_counter()
+
+        updated = 0
+        not_found = []
+        if request.vehicle_ids is not None:
+            vehicle_ids = sorted(set(request.vehicle_ids))
+            for start in range(0, len(vehicle_ids), self.bulk_update_batch_size):
+                batch = vehicle_ids[start : start + self.bulk_update_batch_size]
+                updated_ids = await self.auction_vehicles_repository.update_many(
+                    auction_id, values, len(batch), id=batch
+                )
+                updated += len(updated_ids)
+                not_found.extend(sorted(set(batch).difference(updated_ids)))
+        else:
+            filters = AuctionVehicleFilterBuilder(request.filter).build_main_filters()
+            after_id = 0
+            while True:
+                updated_ids = await self.auction_vehicles_repository.update_many(
+                    auction_id, values, self.bulk_update_batch_size, after_id, **filters
+                )
+                updated += len(updated_ids)
+                if len(updated_ids) < self.bulk_update_batch_size:
+                    break
+                after_id = updated_ids[-1]
+
+        if updated:
+            # Once per request rather than per vehicle, every worker drops the auction's cached vehicles
+            self.vehicle_detail_cache.invalidate_auction(auction_id)
+            self.bid_price_cache.invalidate_auction(auction_id)
+            await self.auction_events_repository.notify(
+                {"type": "vehicles_updated", "auction_id": auction_id, "updated": updated}
+            )
+
+        duration = time.perf_counter() - start_time
+        logger.info(f"Bulk updated {updated} vehicles of auction {auction_id} in {duration:.2f}s: {values}")
+
+        return AuctionVehiclesBulkUpdateResponse(
+            updated=updated,
+            not_found=not_found,
+            duration_ms=int(duration * 1000),
+        )
+
+    async def _get_bulk_update_values(self, patch: AuctionVehiclesBulkPatch) -> dict:
+        """Check the catalog ids of a bulk patch once, before any vehicle is touched, and map it to columns."""
+        values = patch.model_dump(exclude_none=True)
+        if "is_active" in values:
+            values["active"] = values.pop("is_active")
+
+        manufacturer, model = await asyncio.gather(
+            self._get_if_requested(self.vehicle_manufacturers_repository, patch.manufacturer_id),
+            self._get_if_requested(self.vehicle_models_repository, patch.model_id),
+        )
+
+        if patch.manufacturer_id is not None and manufacturer is None:
+            raise NotFoundError(patch.manufacturer_id, "VehicleManufacturer")
+        if patch.model_id is not None:
+            if model is None:
+                raise NotFoundError(patch.model_id, "VehicleModel")
+            if patch.manufacturer_id is not None and model.manufacturer_id != patch.manufacturer_id:
+                raise AppError(
+                    message=f"Model {patch.model_id} does not belong to manufacturer {patch.manufacturer_id}.",
+                )
+            values["manufacturer_id"] = model.manufacturer_id
+
+        return values
+
+    async def _raise_update_failure(self, vehicle_id: int, request: AuctionVehicleUpdateRequest) -> NoReturn:
+        """Find out why an update matched no row, only queried on this failure path."""
+        current_version, manufacturer, model = await asyncio.gather(
+            self.auction_vehicles_repository.get_version(AuctionVehicleModel, vehicle_id),
+            self._get_if_requested(self.vehicle_manufacturers_repository, request.manufacturer_id),
+            self._get_if_requested(self.vehicle_models_repository, request.model_id),
+        )
+
+        if current_version is None:
             raise NotFoundError(vehicle_id, "AuctionVehicle")
+        if request.manufacturer_id is not None and manufacturer is None:
+            raise NotFoundError(request.manufacturer_id, "VehicleManufacturer")
+        if request.model_id is not None and model is None:
+            raise NotFoundError(request.model_id, "VehicleModel")
+
+        raise VersionConflictError(vehicle_id, "AuctionVehicle", request.version, current_version)
+
+    @staticmethod
+    async def _get_if_requested(repository: VehicleManufacturersRepository | VehicleModelsRepository, key: int | None):
+        return await repository.get_by_id(key) if key is not None else None
+
+    async def _get_items(
+        self, auction_id: int, parameters: AuctionVehiclesQuery, filters: dict
+    ) -> tuple[list[AuctionVehicle], str | None]:
+        """Get a page of vehicles with their latest bids and the cursor of the next page."""
+        auction_vehicles, last_key = await self.auction_vehicles_repository.get_by_auction_id(
+            auction_id=auction_id,
+            _from=parameters.from_,
+            size=parameters.size,
+            sort=parameters.sort,
+            after=decode_cursor(parameters.cursor, parameters.sort) if parameters.cursor else None,
+            **filters,
+        )
+        latest_bid_by_vehicle_id = await self.user_bids_repository.get_latest_by_vehicle_ids(
+            [view.vehicle.id for view in auction_vehicles]
+        )
+
+        items = AuctionVehicleMapper.to_contract_list_with_bids(
+            auction_vehicle_views=auction_vehicles,
+            latest_bid_by_vehicle_id=latest_bid_by_vehicle_id,
+        )
+        return items, encode_cursor(parameters.sort, last_key) if last_key else None
+
+    async def _search_items(
+        self, parameters: VehicleSearchQuery, filters: dict
+    ) -> tuple[list[VehicleSearchResult], str | None]:
+        """Get a page of vehicles across auctions with their latest bids and the cursor of the next page."""
+        search_views, last_key = await self.auction_vehicles_repository.search(
+            _from=parameters.from_,
+            size=parameters.size,
+            sort=parameters.sort,
+            after=decode_cursor(parameters.cursor, parameters.sort) if parameters.cursor else None,
+            **filters,
+        )
+        latest_bid_by_vehicle_id = await self.user_bids_repository.get_latest_by_vehicle_ids(
+            [view.vehicle.id for view in search_views]
+        )
+
+        items = AuctionVehicleMapper.to_search_contract_list_with_bids(
+            search_views=search_views,
+            latest_bid_by_vehicle_id=latest_bid_by_vehicle_id,
+        )
+        return items, encode_cursor(parameters.sort, last_key) if last_key else None
+
+    def _get_auction_facets(self, auction_id: int, parameters: AuctionVehiclesFilter) -> Awaitable[dict[str, list]]:
+        facet_filters = AuctionVehicleFilterBuilder(parameters).build_facet_filters()
+        return self.auction_vehicles_repository.get_facets(auction_id, facet_filters)
 
-        if request.is_active is not None:
-            current_vehicle.active = request.is_active
-        if request.mileage is not None:
-            current_vehicle.mileage = request.mileage
-        if request.manufacturing_date is not None:
-            current_vehicle.manufacturing_date = request.manufacturing_date
-        if request.engine is not None:
-            current_vehicle.engine = request.engine
-        if request.transmission is not None:
-            current_vehicle.transmission = request.transmission
-        if request.vin is not None:
-            current_vehicle.vin = request.vin
-
-        if request.manufacturer_id is not None:
-            manufacturer = await self.vehicle_manufacturers_repository.get_by_id(request.manufacturer_id)
-            if not manufacturer:
-                raise NotFoundError(request.manufacturer_id, "VehicleManufacturer")
-            current_vehicle.manufacturer_id = manufacturer.id
-
-        if request.model_id is not None:
-            model = await self.vehicle_models_repository.get_by_id(request.model_id)
-            if not model:
-                raise NotFoundError(request.model_id, "VehicleModel")
-            current_vehicle.model_id = model.id
-
-        vehicle = await self.auction_vehicles_repository.update(current_vehicle)
-        vehicle_view = await self.auction_vehicles_repository.get_view_by_id(vehicle.id)
-
-        return AuctionVehicleResponse(vehicle=AuctionVehicleMapper.to_contract(vehicle_view))
-
-    async def _get_facets(self, auction_id: int, parameters: AuctionVehiclesQuery) -> AuctionVehicleFacets:
-        filter_builder = AuctionVehicleFilterBuilder(parameters)
-
-        # Get selected manufacturer and model data to preserve them in facets
-        selected_manufacturers = await self._get_selected_manufacturers(parameters.manufacturer_ids)
-        selected_models = await self._get_selected_models(parameters.model_ids)
+    async def _get_facets(
+        self, parameters: AuctionVehiclesFilter, facets_query: Awaitable[dict[str, list]]
+    ) -> AuctionVehicleFacets:
+        """Complete the facets of a repository query with the selected values, so they stay listed."""
+        # Get all facet families in one query, with the selected manufacturers and models to preserve them in facets
+        facets, selected_manufacturers, selected_models = await asyncio.gather(
+            facets_query,
+            self._get_selected_manufacturers(parameters.manufacturer_ids),
+            self._get_selected_models(parameters.model_ids),
+        )
         selected_years = (
             list(range(parameters.registration_year_from or 0, (parameters.registration_year_to or 0) + 1))
             if parameters.registration_year_from and parameters.registration_year_to
             else []
         )
 
-        # Get all facets concurrently with appropriate filters
-        manufacturer_facets, model_facets, year_facets = await asyncio.gather(
-            self.auction_vehicles_repository.get_manufacturer_facets(
-                auction_id, **filter_builder.build_manufacturer_facet_filters()
-            ),
-            self.auction_vehicles_repository.get_model_facets(auction_id, **filter_builder.build_model_facet_filters()),
-            self.auction_vehicles_repository.get_registration_year_facets(
-                auction_id, **filter_builder.build_year_facet_filters()
-            ),
-        )
-
-        merged_manufacturers = self._merge_selected_with_facets(selected_manufacturers, manufacturer_facets)
-        merged_models = self._merge_selected_with_facets(selected_models, model_facets)
+        merged_manufacturers = self._merge_selected_with_facets(selected_manufacturers, facets["manufacturers"])
+        merged_models = self._merge_selected_with_facets(selected_models, facets["models"])
 
         selected_year_facets = [FacetView(id=None, name=str(year), count=0) for year in selected_years]
-        merged_years = self._merge_selected_with_facets(selected_year_facets, year_facets)
+        merged_years = self._merge_selected_with_facets(selected_year_facets, facets["registration_years"])
+
+        def merge_selected_terms(family: str, selected: list[str]) -> list[AuctionVehicleFacet]:
+            selected_facets = [FacetView(id=None, name=name, count=0) for name in selected]
+            return AuctionVehicleMapper.facets_to_contract(
+                self._merge_selected_with_facets(selected_facets, facets[family])
+            )
 
         return AuctionVehicleFacets(
             manufacturers=AuctionVehicleMapper.facets_to_contract(merged_manufacturers),
             models=AuctionVehicleMapper.facets_to_contract(merged_models),
             registration_years=AuctionVehicleMapper.facets_to_contract(merged_years),
+            start_prices=AuctionVehicleMapper.range_facets_to_contract(facets["start_prices"]),
+            mileages=AuctionVehicleMapper.range_facets_to_contract(facets["mileages"]),
+            engine_powers=AuctionVehicleMapper.range_facets_to_contract(facets["engine_powers"]),
+            body_types=merge_selected_terms("body_types", parameters.body_types),
+            colors=merge_selected_terms("colors", parameters.colors),
+            transmissions=merge_selected_terms("transmissions", parameters.transmissions),
+            damaged=AuctionVehicleMapper.facets_to_contract(facets["damaged"]),
+            equipment=merge_selected_terms(
+                "equipment", list(dict.fromkeys(parameters.equipment_all + parameters.equipment_any))
+            ),
         )
 
     async def _get_selected_manufacturers(self, manufacturer_ids: list[int]) -> list[FacetView]:
@@ -5,12 +5,21 @@ from contracts import AuctionCarPreview, AuctionResponse, AuctionsListQuery, Auc
 from exceptions.types import NotFoundError
 from mappers import AuctionMapper
 from repositories import AuctionsRepository, AuctionVehiclesRepository
+from services.pagination import decode_cursor, encode_cursor
 
 
 class AuctionsService:
-    def __init__(self, auctions_repository: AuctionsRepository, auction_vehicles_repository: AuctionVehiclesRepository):
+    def __init__(
+        self,
+        auctions_repository: AuctionsRepository,
+        auction_vehicles_repository: AuctionVehiclesRepository,
+        count_strategy: str,
+        count_threshold: int,
+    ):
         self.auctions_repository = auctions_repository
         self.auction_vehicles_repository = auction_vehicles_repository
+        self.count_strategy = count_strategy
+        self.count_threshold = count_threshold
 
     async def get_newest_auctions(self, request: AuctionsListQuery) -> AuctionsListResponse:
         filters = {
@@ -19,9 +28,12 @@ class AuctionsService:
             "datetime": date.today(),
         }
 
-        auctions, auctions_total = await asyncio.gather(
-            self.auctions_repository.get_newest(_from=request.from_, size=request.size, **filters),
-            self.auctions_repository.get_newest_count(**filters),
+        after = decode_cursor(request.cursor, request.sort) if request.cursor else None
+        (auctions, last_key), (auctions_total, total_exact) = await asyncio.gather(
+            self.auctions_repository.get_newest(
+                _from=request.from_, size=request.size, sort=request.sort, after=after, **filters
+            ),
+            self.auctions_repository.get_newest_count(self.count_strategy, self.count_threshold, **filters),
         )
 
         auction_ids = [auction.id for auction in auctions]
@@ -29,11 +41,14 @@ class AuctionsService:
         car_previews = await self._get_car_previews(auction_ids)
 
         auctions_list = AuctionMapper.to_contract_list(auctions, car_previews, car_counts)
-        auctions_list.sort(key=lambda auction: (auction.status == 'closed', auction.close_date))
+        if request.sort == "end_asc":
+            auctions_list.sort(key=lambda auction: (auction.status == 'closed', auction.close_date))
 
         return AuctionsListResponse(
             total=auctions_total,
+            total_exact=total_exact,
             items=auctions_list,
+            next_cursor=encode_cursor(request.sort, last_key) if last_key else None,
         )
 
     async def get_auction(self, auction_id: int) -> AuctionResponse:
@@ -55,5 +70,5 @@ class AuctionsService:
         return dict(zip(auction_ids, results, strict=False))
 
     async def _get_preview_cars(self, auction_id) -> list[AuctionCarPreview]:
-        cars = await self.auction_vehicles_repository.get_by_auction_id(auction_id, _from=0, size=5, active=True)
+        cars, _ = await self.auction_vehicles_repository.get_by_auction_id(auction_id, _from=0, size=5, active=True)
         return AuctionMapper.to_car_preview_list(cars)
@@ -0,0 +1,96 @@
+import asyncio
+from datetime import datetime
+
+from cachetools import TTLCache
+
+from repositories import UserBidsRepository
+from repositories.views import VehicleBiddingView
+
+
+class BidPriceCache:
+    """
+    In-process cache of the bidding state of every vehicle, so most bids are validated without a query.
+
+    The cached price only ever grows, it can lag behind bids accepted by other workers but never runs ahead of
+    the database, so a bid rejected here would have been rejected by the database too. Vehicles are dropped when
+    they are updated, bulk updated or re-ingested, so deactivations and new start prices apply to the next bid.
+    """
+
+    def __init__(self, user_bids_repository: UserBidsRepository, maxsize: int, ttl_seconds: int):
+        self.user_bids_repository = user_bids_repository
+        self._states: TTLCache[int, VehicleBiddingView] = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._loading: dict[int, asyncio.Future] = {}
+        # Bumped when a whole auction is dropped, loads started before are served but not cached
+        self._auction_generation = 0
+        # Auctions extended or closed after their vehicles were cached, only needed as long as those states live
+        self._auction_ends: TTLCache[int, datetime] = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+
+    async def get(self, vehicle_id: int) -> VehicleBiddingView | None:
+        state = self._states.get(vehicle_id)
+        if state is not None:
+            return self._with_auction_end(state)
+
+        # Bursts on a cold vehicle share a single query
+        future = self._loading.get(vehicle_id)
+        if future is None:
+            future = asyncio.ensure_future(self._load(vehicle_id))
+            self._loading[vehicle_id] = future
+            future.add_done_callback(lambda done: self._forget_load(vehicle_id, done))
+
+        state = await asyncio.shield(future)
+        return self._with_auction_end(state) if state else None
+
+    def record_bid(self, vehicle_id: int, amount: int) -> None:
+        state = self._states.get(vehicle_id)
+        if state is not None and (state.current_amount or 0) < amount:
+            state.current_amount = amount
+
+    def invalidate(self, vehicle_id: int) -> None:
+        self._states.pop(vehicle_id, None)
+        # A load in flight may have read the old row, the next bid starts a new one
+        self._loading.pop(vehicle_id, None)
+
+    def invalidate_auction(self, auction_id: int) -> None:
+        self._auction_generation += 1
+        vehicle_ids = [vehicle_id for vehicle_id, state in self._states.items() if state.auction_id == auction_id]
+        for vehicle_id in vehicle_ids:
+            self._states.pop(vehicle_id, None)
+
+    def set_auction_end(self, auction_id: int, end_datetime: datetime) -> None:
+        # Closing happens after the end, so the latest known time is always the one to go by
+        self._auction_ends[auction_id] = max(end_datetime, self._auction_ends.get(auction_id, end_datetime))
+
+    def handle_event(self, event: dict, payload: str) -> None:
+        """Apply bids and auction changes made by any worker, received through the auction events listener."""
+        if event["type"] == "bid":
+            self.record_bid(event["vehicle_id"], event["bid"]["bid_amount"])
+        elif event["type"] == "auction_extended":
+            self.set_auction_end(event["auction_id"], datetime.fromisoformat(event["end_datetime"]))
+        elif event["type"] == "auction_closed":
+            self.set_auction_end(event["auction_id"], datetime.fromisoformat(event["closed_at"]))
+        elif event["type"] == "vehicle_updated":
+            self.invalidate(event["vehicle_id"])
+        elif event["type"] in ("vehicles_ingested", "vehicles_updated"):
+            self.invalidate_auction(event["auction_id"])
+
+    def _with_auction_end(self, state: VehicleBiddingView) -> VehicleBiddingView:
+        end_datetime = self._auction_ends.get(state.auction_id)
+        if end_datetime is not None and end_datetime > state.auction_end_datetime:
+            state.auction_end_datetime = end_datetime
+        return state
+
+    def _forget_load(self, vehicle_id: int, future: asyncio.Future) -> None:
+        if self._loading.get(vehicle_id) is future:
+            del self._loading[vehicle_id]
+
+    async def _load(self, vehicle_id: int) -> VehicleBiddingView | None:
+        auction_generation = self._auction_generation
+        state = await self.user_bids_repository.get_bidding_state(vehicle_id)
+        if (
+            state is not None
+            and self._loading.get(vehicle_id) is asyncio.current_task()
+            and auction_generation == self._auction_generation
+        ):
+            self._states[vehicle_id] = state
+
+        return state
@@ -0,0 +1,83 @@
+import asyncio
+import time
+from dataclasses import dataclass, field
+
+from repositories import VehicleManufacturersRepository, VehicleModelsRepository
+from repositories.models import VehicleManufacturer, VehicleModel
+
+
+def _normalize(name: str) -> str:
+    return " ".join(name.split()).casefold()
+
+
+@dataclass
+class CatalogSnapshot:
+    """Immutable view of the vehicle catalog with lookups by id, name and synonyms"""
+
+    manufacturers: dict[int, VehicleManufacturer] = field(default_factory=dict)
+    models: dict[int, VehicleModel] = field(default_factory=dict)
+    manufacturer_ids_by_name: dict[str, int] = field(default_factory=dict)
+    model_ids_by_name: dict[tuple[int, str], int] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, manufacturers: list[VehicleManufacturer], models: list[VehicleModel]) -> "CatalogSnapshot":
+        snapshot = cls()
+
+        for manufacturer in manufacturers:
+            snapshot.manufacturers[manufacturer.id] = manufacturer
+            # Synonyms first, so an exact name always wins over a colliding synonym
+            for name in [*(manufacturer.synonyms or []), manufacturer.name]:
+                snapshot.manufacturer_ids_by_name[_normalize(name)] = manufacturer.id
+
+        for model in models:
+            snapshot.models[model.id] = model
+            for name in [*(model.synonyms or []), model.name]:
+                snapshot.model_ids_by_name[(model.manufacturer_id, _normalize(name))] = model.id
+
+        return snapshot
+
+    def resolve_manufacturer(self, name: str) -> int | None:
+        return self.manufacturer_ids_by_name.get(_normalize(name))
+
+    def resolve_model(self, manufacturer_id: int, name: str) -> int | None:
+        return self.model_ids_by_name.get((manufacturer_id, _normalize(name)))
+
+
+class VehicleCatalogCache:
+    """In-process cache of manufacturers and models, reloaded after the TTL expires or on invalidation"""
+
+    def __init__(
+        self,
+        manufacturers_repository: VehicleManufacturersRepository,
+        models_repository: VehicleModelsRepository,
+        ttl_seconds: int,
+    ):
+        self.manufacturers_repository = manufacturers_repository
+        self.models_repository = models_repository
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: CatalogSnapshot | None = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get(self) -> CatalogSnapshot:
+        if self._is_stale():
+            async with self._lock:
+                # Another coroutine may have reloaded the catalog while we were waiting
+                if self._is_stale():
+                    await self._load()
+
+        return self._snapshot
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
+    def _is_stale(self) -> bool:
+        return self._snapshot is None or time.monotonic() - self._loaded_at > self.ttl_seconds
+
+    async def _load(self) -> None:
+        manufacturers, models = await asyncio.gather(
+            self.manufacturers_repository.get_by_name(),
+            self.models_repository.get_by_name(),
+        )
+        self._snapshot = CatalogSnapshot.build(manufacturers, models)
+        self._loaded_at = time.monotonic()
@@ -0,0 +1,47 @@
+import asyncio
+
+from core.logging import logger
+from repositories import AuctionVehiclesRepository
+
+
+class CatalogSearchRefresher:
+    """
+    Refreshes the vehicles of a renamed manufacturer or model in the background.
+
+    Their search vectors and the names copied into the search entries and the VIN history embed the catalog names.
+    A popular manufacturer has a large share of all vehicles, so the catalog request only starts the refresh, which
+    then rewrites the vehicles in short batches instead of one long transaction locking all of them. Searches match
+    the old names until it finished. A refresh cut short by a shutdown or a failure is rerun by saving the
+    manufacturer or model with the same name again.
+    """
+
+    def __init__(self, auction_vehicles_repository: AuctionVehiclesRepository, batch_size: int):
+        self.auction_vehicles_repository = auction_vehicles_repository
+        self.batch_size = batch_size
+        self._tasks: set[asyncio.Task] = set()
+
+    def refresh(self, manufacturer_id: int | None = None, model_id: int | None = None) -> None:
+        task = asyncio.create_task(self._refresh(manufacturer_id, model_id), name="catalog-search-refresh")
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _refresh(self, manufacturer_id: int | None, model_id: int | None) -> None:
+        catalog = f"manufacturer {manufacturer_id}" if manufacturer_id is not None else f"model {model_id}"
+        refreshed = 0
+        try:
+            # Vehicles added meanwhile get the new names from their insert
+            vehicle_ids = await self.auction_vehicles_repository.get_ids_by_catalog(manufacturer_id, model_id)
+            for start in range(0, len(vehicle_ids), self.batch_size):
+                refreshed += await self.auction_vehicles_repository.refresh_catalog_names(
+                    vehicle_ids[start : start + self.batch_size]
+                )
+        except Exception:
+            logger.exception("Search refresh of the vehicles of %s failed after %s vehicles", catalog, refreshed)
+            return
+
+        logger.info("Refreshed the search of %s vehicles of %s", refreshed, catalog)
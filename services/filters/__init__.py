@@ -1,3 +1,3 @@
-from .auction_vehicle_filters import AuctionVehicleFilterBuilder
+from .auction_vehicle_filters import AuctionVehicleFilterBuilder, VehicleSearchFilterBuilder
 
-__all__ = ["AuctionVehicleFilterBuilder"]
+__all__ = ["AuctionVehicleFilterBuilder", "VehicleSearchFilterBuilder"]
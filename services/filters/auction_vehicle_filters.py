@@ -1,26 +1,53 @@
 from datetime import date
 
-from contracts import AuctionVehiclesQuery
+from contracts import AuctionVehiclesFilter, VehicleSearchFilter
+from repositories.auction_vehicles_repository import SEARCH_FILTER
+
+# Filters left out of each facet family, so a facet keeps showing the alternatives to its own selection
+FACET_EXCLUDED_FILTERS = {
+    "manufacturers": ("manufacturer_id",),
+    "models": ("model_id",),
+    "registration_years": (),
+    "start_prices": ("start_price__gte", "start_price__lte"),
+    "mileages": ("mileage__gte", "mileage__lte"),
+    "engine_powers": ("engine_power__gte", "engine_power__lte"),
+    "body_types": ("body_type",),
+    "colors": ("color",),
+    "transmissions": ("transmission",),
+    "damaged": ("is_damaged",),
+    # Features required together narrow the counts of the others, alternatives do not
+    "equipment": ("equipment__overlap",),
+}
+
+# Columns filtered by a <column>_from / <column>_to pair of parameters
+RANGE_FILTER_COLUMNS = ("mileage", "start_price", "engine_power", "engine_cc")
 
 
 class AuctionVehicleFilterBuilder:
     """Builds filter dictionaries for auction vehicle queries"""
 
-    def __init__(self, parameters: AuctionVehiclesQuery):
+    def __init__(self, parameters: AuctionVehiclesFilter):
         self.parameters = parameters
 
     def build_base_filters(self) -> dict:
         """Build base filters excluding facet-specific ones (manufacturer_id, model_id)"""
         filters = {}
 
+        if self.parameters.q:
+            filters[SEARCH_FILTER] = self.parameters.q
         if self.parameters.is_active is not None:
             filters["active"] = self.parameters.is_active
-
-        # Mileage range filters
-        if self.parameters.mileage_from is not None:
-            filters["mileage__gte"] = self.parameters.mileage_from
-        if self.parameters.mileage_to is not None:
-            filters["mileage__lte"] = self.parameters.mileage_to
+        if self.parameters.is_damaged is not None:
+            filters["is_damaged"] = self.parameters.is_damaged
+
+        # Mileage, price, power and displacement range filters
+        for column in RANGE_FILTER_COLUMNS:
+            value_from = getattr(self.parameters, f"{column}_from")
+            value_to = getattr(self.parameters, f"{column}_to")
+            if value_from is not None:
+                filters[f"{column}__gte"] = value_from
+            if value_to is not None:
+                filters[f"{column}__lte"] = value_to
 
         # Manufacturing date (registration year) range filters
         if self.parameters.registration_year_from is not None:
@@ -28,6 +55,20 @@ class AuctionVehicleFilterBuilder:
         if self.parameters.registration_year_to is not None:
             filters["manufacturing_date__lte"] = date(self.parameters.registration_year_to, 12, 31)
 
+        # Categorical filters
+        if self.parameters.body_types:
+            filters["body_type"] = self.parameters.body_types
+        if self.parameters.colors:
+            filters["color"] = self.parameters.colors
+        if self.parameters.transmissions:
+            filters["transmission"] = self.parameters.transmissions
+
+        # Equipment filters, served by the GIN index on the array
+        if self.parameters.equipment_all:
+            filters["equipment__contains"] = self.parameters.equipment_all
+        if self.parameters.equipment_any:
+            filters["equipment__overlap"] = self.parameters.equipment_any
+
         return filters
 
     def build_main_filters(self) -> dict:
@@ -41,24 +82,31 @@ class AuctionVehicleFilterBuilder:
 
         return filters
 
-    def build_manufacturer_facet_filters(self) -> dict:
-        """Build filters for manufacturer facets (exclude manufacturer filter)"""
-        filters = self.build_base_filters()
+    def build_facet_filters(self) -> dict[str, dict]:
+        """Build the filters of every facet family, each without the filters on its own values"""
+        filters = self.build_main_filters()
 
-        if self.parameters.model_ids:
-            filters["model_id"] = self.parameters.model_ids
+        return {
+            family: {key: value for key, value in filters.items() if key not in excluded}
+            for family, excluded in FACET_EXCLUDED_FILTERS.items()
+        }
 
-        return filters
 
-    def build_model_facet_filters(self) -> dict:
-        """Build filters for model facets (exclude model filter)"""
-        filters = self.build_base_filters()
+class VehicleSearchFilterBuilder(AuctionVehicleFilterBuilder):
+    """Builds filter dictionaries for searches of the vehicle search entries across auctions"""
 
-        if self.parameters.manufacturer_ids:
-            filters["manufacturer_id"] = self.parameters.manufacturer_ids
+    def __init__(self, parameters: VehicleSearchFilter):
+        super().__init__(parameters)
 
-        return filters
+    def build_base_filters(self) -> dict:
+        """Build base filters with the auction country and closing date filters, shared by every facet family"""
+        filters = super().build_base_filters()
+
+        if self.parameters.countries:
+            filters["auction_country"] = [country.upper() for country in self.parameters.countries]
+        if self.parameters.auction_end_from is not None:
+            filters["auction_end_datetime__gte"] = self.parameters.auction_end_from
+        if self.parameters.auction_end_to is not None:
+            filters["auction_end_datetime__lte"] = self.parameters.auction_end_to
 
-    def build_year_facet_filters(self) -> dict:
-        """Build filters for year facets (include all filters)"""
-        return self.build_main_filters()
+        return filters
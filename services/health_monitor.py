@@ -0,0 +1,119 @@
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from core.logging import logger
+from database.database import Database
+
+
+@dataclass
+class DatabaseHealth:
+    status: str = "unknown"  # "unknown", "healthy", "degraded" or "unhealthy"
+    latency_ms: float | None = None
+    pool_saturation: float = 0.0
+    consecutive_failures: int = 0
+    checked_at: float | None = None
+    error: str | None = None
+
+    @property
+    def is_ready(self) -> bool:
+        # A degraded worker keeps serving, taking every saturated worker out at once would overload the rest
+        return self.status in ("healthy", "degraded")
+
+
+class DatabaseHealthMonitor:
+    """
+    Checks the database in the background and keeps the last result, so readiness probes are answered from
+    memory instead of taking a pool connection each.
+
+    Pings go over a dedicated connection outside the pool, a saturated pool makes the worker degraded but never
+    fails a ping by itself.
+
+    The database turns unhealthy after ``failure_threshold`` consecutive failed or timed out pings, and degraded
+    when a ping is slower than ``slow_ping_ms`` or the pool is more saturated than ``pool_saturation_threshold``.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        database_url: str,
+        interval_seconds: float,
+        timeout_seconds: float,
+        failure_threshold: int,
+        slow_ping_ms: float,
+        pool_saturation_threshold: float,
+    ):
+        self.db = db
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.failure_threshold = failure_threshold
+        self.slow_ping_ms = slow_ping_ms
+        self.pool_saturation_threshold = pool_saturation_threshold
+        self.health = DatabaseHealth()
+        self._task: asyncio.Task | None = None
+        self._connection: asyncpg.Connection | None = None
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="database-health-monitor")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._close_connection()
+
+    async def check(self) -> DatabaseHealth:
+        pool_saturation = self.db.pool_saturation()
+        try:
+            async with asyncio.timeout(self.timeout_seconds):
+                if self._connection is None or self._connection.is_closed():
+                    self._connection = await asyncpg.connect(self.dsn)
+                start_time = time.perf_counter()
+                await self._connection.fetchval("SELECT 1")
+        except Exception as e:
+            # The connection may be stuck mid query, the next ping reconnects
+            self._close_connection()
+            consecutive_failures = self.health.consecutive_failures + 1
+            health = DatabaseHealth(
+                # Single failed pings keep the previous status, so one blip does not flap readiness
+                status="unhealthy" if consecutive_failures >= self.failure_threshold else self.health.status,
+                pool_saturation=pool_saturation,
+                consecutive_failures=consecutive_failures,
+                error=str(e) or type(e).__name__,
+            )
+        else:
+            latency_ms = (time.perf_counter() - start_time) * 1000
+            degraded = latency_ms > self.slow_ping_ms or pool_saturation > self.pool_saturation_threshold
+            health = DatabaseHealth(
+                status="degraded" if degraded else "healthy",
+                latency_ms=round(latency_ms, 2),
+                pool_saturation=pool_saturation,
+            )
+
+        health.checked_at = time.time()
+        if health.status != self.health.status:
+            log = logger.info if health.status == "healthy" else logger.warning
+            log("Database health changed from %s to %s: %s", self.health.status, health.status, health)
+
+        self.health = health
+        return health
+
+    def _close_connection(self) -> None:
+        if self._connection is not None:
+            self._connection.terminate()
+            self._connection = None
+
+    async def _run(self) -> None:
+        while True:
+            await self.check()
+            await asyncio.sleep(self.interval_seconds)
@@ -0,0 +1,153 @@
+import asyncio
+import contextlib
+import json
+from collections import defaultdict
+from collections.abc import AsyncIterator, Callable
+
+import asyncpg
+from sqlalchemy.engine import make_url
+
+from core.logging import logger
+from repositories.auction_events_repository import AUCTION_EVENTS_CHANNEL
+
+RECONNECT_DELAY_SECONDS = 5
+
+AuctionEventHandler = Callable[[dict, str], None]
+
+
+class LiveFeedSubscription:
+    def __init__(self, auction_id: int, queue_size: int):
+        self.auction_id = auction_id
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = False
+
+
+class LiveFeedHub:
+    """
+    In-process fan-out of auction events to Server-Sent Events subscribers.
+
+    Every subscriber gets a bounded queue. A subscriber whose queue is full is too slow to keep up and gets
+    dropped instead of slowing down the publisher, its client reconnects and reloads the current state.
+    """
+
+    def __init__(self, queue_size: int, heartbeat_seconds: float):
+        self.queue_size = queue_size
+        self.heartbeat_seconds = heartbeat_seconds
+        self._subscriptions: dict[int, set[LiveFeedSubscription]] = defaultdict(set)
+
+    @property
+    def subscriber_count(self) -> int:
+        return sum(len(subscriptions) for subscriptions in self._subscriptions.values())
+
+    def subscribe(self, auction_id: int) -> LiveFeedSubscription:
+        subscription = LiveFeedSubscription(auction_id, self.queue_size)
+        self._subscriptions[auction_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: LiveFeedSubscription) -> None:
+        subscriptions = self._subscriptions.get(subscription.auction_id)
+        if subscriptions is None:
+            return
+
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[subscription.auction_id]
+
+    def publish(self, auction_id: int, event_type: str, data: str) -> None:
+        subscriptions = self._subscriptions.get(auction_id)
+        if not subscriptions:
+            return
+
+        # Encoded once, shared by every subscriber
+        frame = f"event: {event_type}\ndata: {data}\n\n".encode()
+        for subscription in list(subscriptions):
+            try:
+                subscription.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                subscription.dropped = True
+                self.unsubscribe(subscription)
+
+    def handle_event(self, event: dict, payload: str) -> None:
+        # Catalog events belong to no auction feed
+        if "auction_id" in event:
+            self.publish(event["auction_id"], event["type"], payload)
+
+    async def stream(self, auction_id: int) -> AsyncIterator[bytes]:
+        """Yield Server-Sent Events frames of an auction until the client disconnects or falls behind."""
+        subscription = self.subscribe(auction_id)
+        try:
+            yield b": connected\n\n"
+
+            while not subscription.dropped:
+                try:
+                    yield await asyncio.wait_for(subscription.queue.get(), self.heartbeat_seconds)
+                except TimeoutError:
+                    # Keeps proxies from closing an idle connection
+                    yield b": keep-alive\n\n"
+
+            yield b"event: dropped\ndata: {}\n\n"
+        finally:
+            self.unsubscribe(subscription)
+
+
+class AuctionEventsListener:
+    """
+    Hands auction events NOTIFY'd by any API worker to in-process handlers (the live feed hub, caches and the
+    auction scheduler), reconnecting when the connection drops.
+    """
+
+    def __init__(self, database_url: str, handlers: list[AuctionEventHandler], enabled: bool):
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.handlers = handlers
+        self.enabled = enabled
+        self._task: asyncio.Task | None = None
+
+    async def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run(), name="auction-events-listener")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        closed = asyncio.Event()
+
+        while True:
+            connection = None
+            closed.clear()
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                connection.add_termination_listener(lambda _: closed.set())
+                await connection.add_listener(AUCTION_EVENTS_CHANNEL, self._on_notification)
+                logger.info("Listening for auction events on channel %s", AUCTION_EVENTS_CHANNEL)
+
+                await closed.wait()
+                logger.warning("Auction events connection closed, reconnecting")
+            except Exception:
+                # Connection losses surface as OSError, PostgresError or InterfaceError, none may end the listener
+                logger.exception("Auction events listener failed, retrying in %ss", RECONNECT_DELAY_SECONDS)
+            finally:
+                if connection is not None and not connection.is_closed():
+                    with contextlib.suppress(Exception):
+                        await connection.close()
+
+            await asyncio.sleep(RECONNECT_DELAY_SECONDS)
+
+    def _on_notification(self, connection: asyncpg.Connection, pid: int, channel: str, payload: str) -> None:
+        try:
+            event = json.loads(payload)
+        except ValueError:
+            logger.error("Malformed auction event: %s", payload)
+            return
+
+        for handler in self.handlers:
+            try:
+                handler(event, payload)
+            except Exception:
+                logger.exception("Auction event handler %s failed on %s", handler, payload)
@@ -0,0 +1,25 @@
+import base64
+import json
+
+from exceptions.base import AppError
+
+
+def encode_cursor(sort: str, after: list) -> str:
+    """Encode the sort key of the last row of a page into an opaque cursor for the next page."""
+    payload = json.dumps({"sort": sort, "after": after}, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort: str) -> list:
+    """Decode a cursor into the sort key to seek past, it must have been issued for the same sort."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        after = payload["after"]
+        valid = payload["sort"] == sort and isinstance(after, list)
+    except (ValueError, KeyError, TypeError):
+        valid = False
+
+    if not valid:
+        raise AppError(message="Invalid cursor.", payload={"details": f"The cursor was not issued for sort {sort}."})
+
+    return after
@@ -0,0 +1,98 @@
+from datetime import UTC, datetime, timedelta
+
+from contracts import PlaceBidRequest, PlaceBidResponse
+from exceptions.types import ConflictError, NotFoundError
+from mappers import UserBidMapper
+from repositories import UserBidsRepository
+from repositories.views import UserBidView
+
+from .bid_price_cache import BidPriceCache
+from .vehicle_detail_cache import VehicleDetailCache
+
+
+class UserBidsService:
+    def __init__(
+        self,
+        user_bids_repository: UserBidsRepository,
+        bid_price_cache: BidPriceCache,
+        vehicle_detail_cache: VehicleDetailCache,
+        min_increment: int,
+        soft_close_window_seconds: int,
+        soft_close_extension_seconds: int,
+    ):
+        self.user_bids_repository = user_bids_repository
+        self.soft_close_window = timedelta(seconds=soft_close_window_seconds)
+        self.soft_close_extension = timedelta(seconds=soft_close_extension_seconds)
+        self.bid_price_cache = bid_price_cache
+        self.vehicle_detail_cache = vehicle_detail_cache
+        self.min_increment = min_increment
+
+    async def place_bid(self, vehicle_id: int, request: PlaceBidRequest) -> PlaceBidResponse:
+        state = await self.bid_price_cache.get(vehicle_id)
+        if not state:
+            raise NotFoundError(vehicle_id, "AuctionVehicle")
+
+        now = datetime.now(UTC)
+        if not state.active or state.auction_end_datetime <= now:
+            raise ConflictError(f"Bidding on vehicle {vehicle_id} is closed.")
+
+        minimum_amount = (
+            state.start_price if state.current_amount is None else state.current_amount + self.min_increment
+        )
+        if request.amount < minimum_amount:
+            raise ConflictError(f"Bid must be at least {minimum_amount}.")
+
+        # The cached end only lags behind extensions, a bid outside the window by it cannot extend the auction
+        soft_close = state.auction_end_datetime - now < self.soft_close_window
+        placement = await self.user_bids_repository.place(
+            vehicle_id=vehicle_id,
+            auction_id=state.auction_id,
+            user_id=request.client_id,
+            amount=request.amount,
+            min_increment=self.min_increment,
+            events=self._bid_events,
+            soft_close_window=self.soft_close_window if soft_close else None,
+            soft_close_extension=self.soft_close_extension,
+        )
+        if not placement.bidding_open:
+            self.bid_price_cache.invalidate(vehicle_id)
+            raise ConflictError(f"Bidding on vehicle {vehicle_id} is closed.")
+
+        bid = placement.bid
+        if not bid and request.amount < placement.start_price:
+            # Re-priced after the state was cached
+            self.bid_price_cache.invalidate(vehicle_id)
+            raise ConflictError(f"Bid must be at least {placement.start_price}.")
+        if not bid:
+            # A concurrent bid won the race, reload the price on the next bid
+            self.bid_price_cache.invalidate(vehicle_id)
+            raise ConflictError(f"Bid of {request.amount} was outbid, place a higher bid.")
+
+        self.bid_price_cache.record_bid(vehicle_id, bid.amount)
+        # Other workers drop it on the bid event, this one serves its own bidder without the events listener too
+        self.vehicle_detail_cache.invalidate(vehicle_id)
+        if placement.extended_end_datetime:
+            self.bid_price_cache.set_auction_end(bid.auction_id, placement.extended_end_datetime)
+
+        return PlaceBidResponse(vehicle_id=vehicle_id, bid=UserBidMapper.to_contract(bid))
+
+    @staticmethod
+    def _bid_events(bid: UserBidView, extended_end_datetime: datetime | None) -> list[dict]:
+        events = [
+            {
+                "type": "bid",
+                "auction_id": bid.auction_id,
+                "vehicle_id": bid.vehicle_id,
+                "bid": UserBidMapper.to_contract(bid).model_dump(mode="json"),
+            }
+        ]
+        if extended_end_datetime:
+            events.append(
+                {
+                    "type": "auction_extended",
+                    "auction_id": bid.auction_id,
+                    "end_datetime": extended_end_datetime.isoformat(),
+                }
+            )
+
+        return events
@@ -3,6 +3,7 @@ import uuid
 from sqlalchemy import func
 
 from contracts import UserRegistrationResponse, UserRegistrationUpdateRequest
+from exceptions.types import NotFoundError, VersionConflictError
 from mappers import UserMapper
 from repositories import UsersRepository
 from repositories.models import User as UserModel
@@ -15,25 +16,15 @@ class UsersService:
     async def get_user(self, user: UserModel) -> UserRegistrationResponse:
         return UserRegistrationResponse(user=UserMapper.to_contract(user))
 
-    async def update_user(
-        self, existing_user: UserModel, request: UserRegistrationUpdateRequest
-    ) -> UserRegistrationResponse:
-        if request.supervisor_id is not None:
-            existing_user.supervisor_id = request.supervisor_id
-        if request.phone_number is not None:
-            existing_user.phone_number = request.phone_number
-        if request.passport_number is not None:
-            existing_user.passport_number = request.passport_number
-        if request.address is not None:
-            existing_user.address = request.address
-        if request.language is not None:
-            existing_user.language = request.language
-        if request.email is not None:
-            existing_user.email = request.email
-        if request.status is not None:
-            existing_user.status = request.status
-
-        updated_user = await self.users_repository.update(existing_user)
+    async def update_user(self, user_id: uuid.UUID, request: UserRegistrationUpdateRequest) -> UserRegistrationResponse:
+        values = request.model_dump(exclude_none=True, exclude={"version"})
+
+        updated_user = await self.users_repository.update(user_id, values, request.version)
+        if not updated_user:
+            current_version = await self.users_repository.get_version(UserModel, user_id)
+            if current_version is None:
+                raise NotFoundError(user_id, "User")
+            raise VersionConflictError(user_id, "User", request.version, current_version)
 
         return UserRegistrationResponse(user=UserMapper.to_contract(updated_user))
 
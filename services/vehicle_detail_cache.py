@@ -0,0 +1,83 @@
+import asyncio
+
+from cachetools import TTLCache
+
+from contracts import AuctionVehicleDetailResponse
+from mappers import AuctionVehicleMapper
+from repositories import AuctionVehiclesRepository
+
+
+class VehicleDetailCache:
+    """
+    In-process LRU of vehicle detail responses, kept as serialized JSON so hits skip mapping and serialization.
+
+    Entries are dropped when a vehicle is updated, bid on, re-ingested, bulk updated, its auction closes or the
+    catalog is renamed, through the auction events of every worker. The TTL bounds staleness when events are missed.
+    """
+
+    def __init__(self, auction_vehicles_repository: AuctionVehiclesRepository, maxsize: int, ttl_seconds: int):
+        self.auction_vehicles_repository = auction_vehicles_repository
+        # Vehicle id to its auction id and serialized response
+        self._details: TTLCache[int, tuple[int, bytes]] = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        self._loading: dict[int, asyncio.Task] = {}
+        # Bumped when a whole auction is dropped, loads started before are served but not cached
+        self._auction_generation = 0
+
+    async def get(self, vehicle_id: int) -> bytes | None:
+        detail = self._details.get(vehicle_id)
+        if detail is not None:
+            return detail[1]
+
+        # Concurrent requests for a cold vehicle share a single query
+        task = self._loading.get(vehicle_id)
+        if task is None:
+            task = asyncio.create_task(self._load(vehicle_id))
+            self._loading[vehicle_id] = task
+            task.add_done_callback(lambda done: self._forget_load(vehicle_id, done))
+
+        return await asyncio.shield(task)
+
+    def invalidate(self, vehicle_id: int) -> None:
+        self._details.pop(vehicle_id, None)
+        # A load in flight may have read the old row, the next request starts a new one
+        self._loading.pop(vehicle_id, None)
+
+    def invalidate_auction(self, auction_id: int) -> None:
+        self._auction_generation += 1
+        vehicle_ids = [
+            vehicle_id
+            for vehicle_id, (cached_auction_id, _) in self._details.items()
+            if cached_auction_id == auction_id
+        ]
+        for vehicle_id in vehicle_ids:
+            self._details.pop(vehicle_id, None)
+
+    def invalidate_all(self) -> None:
+        self._auction_generation += 1
+        self._details.clear()
+
+    def handle_event(self, event: dict, payload: str) -> None:
+        """Drop changed vehicles, received through the auction events listener."""
+        if event["type"] in ("bid", "vehicle_updated"):
+            self.invalidate(event["vehicle_id"])
+        elif event["type"] in ("auction_closed", "vehicles_ingested", "vehicles_updated"):
+            self.invalidate_auction(event["auction_id"])
+        elif event["type"] == "catalog_updated":
+            self.invalidate_all()
+
+    def _forget_load(self, vehicle_id: int, task: asyncio.Task) -> None:
+        if self._loading.get(vehicle_id) is task:
+            del self._loading[vehicle_id]
+
+    async def _load(self, vehicle_id: int) -> bytes | None:
+        auction_generation = self._auction_generation
+        detail_view = await self.auction_vehicles_repository.get_detail_view_by_id(vehicle_id)
+        if detail_view is None:
+            return None
+
+        response = AuctionVehicleDetailResponse(vehicle=AuctionVehicleMapper.to_detail_contract(detail_view))
+        content = response.model_dump_json().encode()
+        if self._loading.get(vehicle_id) is asyncio.current_task() and auction_generation == self._auction_generation:
+            self._details[vehicle_id] = (detail_view.vehicle.auction_id, content)
+
+        return content
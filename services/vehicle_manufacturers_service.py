@@ -8,19 +8,32 @@ from contracts import (
     VehicleModelResponse,
     VehicleModelsResponse,
 )
-from exceptions.types import NotFoundError
+from exceptions.types import NotFoundError, VersionConflictError
 from mappers import VehicleManufacturerMapper, VehicleModelMapper
-from repositories import VehicleManufacturersRepository, VehicleModelsRepository
+from repositories import AuctionEventsRepository, VehicleManufacturersRepository, VehicleModelsRepository
 from repositories.models import VehicleManufacturer as VehicleManufacturerRepositoryModel
 from repositories.models import VehicleModel as VehicleModelRepositoryModel
+from services.catalog_cache import VehicleCatalogCache
+from services.catalog_search_refresher import CatalogSearchRefresher
+from services.vehicle_detail_cache import VehicleDetailCache
 
 
 class VehicleManufacturersService:
     def __init__(
-        self, manufacturers_repository: VehicleManufacturersRepository, models_repository: VehicleModelsRepository
+        self,
+        manufacturers_repository: VehicleManufacturersRepository,
+        models_repository: VehicleModelsRepository,
+        catalog_cache: VehicleCatalogCache,
+        vehicle_detail_cache: VehicleDetailCache,
+        auction_events_repository: AuctionEventsRepository,
+        catalog_search_refresher: CatalogSearchRefresher,
     ):
         self.manufacturers_repository = manufacturers_repository
         self.models_repository = models_repository
+        self.catalog_cache = catalog_cache
+        self.vehicle_detail_cache = vehicle_detail_cache
+        self.auction_events_repository = auction_events_repository
+        self.catalog_search_refresher = catalog_search_refresher
 
     async def get_manufacturers(self, query: str | None = None) -> VehicleManufacturersResponse:
         manufacturers = await self.manufacturers_repository.get_by_name(query)
@@ -37,25 +50,33 @@ class VehicleManufacturersService:
                 synonyms=synonyms,
             )
         )
+        self.catalog_cache.invalidate()
 
         return VehicleManufacturerMapper.to_manufacturer_response(new_manufacturer)
 
     async def update_manufacturer(
         self, manufacturer_id: int, manufacturer: VehicleManufacturerRequest
     ) -> VehicleManufacturerResponse:
-        existing_manufacturer = await self.manufacturers_repository.get_by_id(manufacturer_id)
-
-        if not existing_manufacturer:
-            raise NotFoundError(manufacturer_id, "Vehicle Manufacturer")
-
-        existing_manufacturer.name = manufacturer.name or existing_manufacturer.name
-
+        values = {}
+        if manufacturer.name:
+            values["name"] = manufacturer.name
         if manufacturer.synonyms is not None:
-            existing_manufacturer.synonyms = list(set(manufacturer.synonyms))
+            values["synonyms"] = list(set(manufacturer.synonyms))
 
-        updated_manufacturer = await self.manufacturers_repository.update(
-            existing_manufacturer,
-        )
+        updated_manufacturer = await self.manufacturers_repository.update(manufacturer_id, values, manufacturer.version)
+        if not updated_manufacturer:
+            current_version = await self.manufacturers_repository.get_version(
+                VehicleManufacturerRepositoryModel, manufacturer_id
+            )
+            if current_version is None:
+                raise NotFoundError(manufacturer_id, "Vehicle Manufacturer")
+            raise VersionConflictError(manufacturer_id, "Vehicle Manufacturer", manufacturer.version, current_version)
+
+        self.catalog_cache.invalidate()
+        if "name" in values:
+            await self._invalidate_vehicle_details()
+        if "name" in values or "synonyms" in values:
+            self.catalog_search_refresher.refresh(manufacturer_id=manufacturer_id)
 
         return VehicleManufacturerMapper.to_manufacturer_response(updated_manufacturer)
 
@@ -101,25 +122,39 @@ class VehicleManufacturersService:
                 manufacturer_id=manufacturer_id,
             )
         )
+        self.catalog_cache.invalidate()
 
         return VehicleModelMapper.to_model_response(new_model, manufacturer)
 
     async def update_model(
         self, manufacturer_id: int, model_id: int, model: VehicleModelRequest
     ) -> VehicleModelResponse:
-        existing_model = await self.models_repository.get_by_id(model_id)
-
-        if not existing_model or existing_model.manufacturer_id != manufacturer_id:
-            raise NotFoundError(model_id, "Vehicle Model")
-
-        existing_model.name = model.name or existing_model.name
-        existing_model.default_vehicle_type = model.default_vehicle_type or existing_model.default_vehicle_type
-
+        values = {}
+        if model.name:
+            values["name"] = model.name
+        if model.default_vehicle_type:
+            values["default_vehicle_type"] = model.default_vehicle_type
         if model.synonyms is not None:
-            existing_model.synonyms = list(set(model.synonyms))
+            values["synonyms"] = list(set(model.synonyms))
+
+        updated_model = await self.models_repository.update(model_id, manufacturer_id, values, model.version)
+        if not updated_model:
+            existing_model = await self.models_repository.get_by_id(model_id)
+            if not existing_model or existing_model.manufacturer_id != manufacturer_id:
+                raise NotFoundError(model_id, "Vehicle Model")
+            raise VersionConflictError(model_id, "Vehicle Model", model.version, existing_model.version)
 
-        updated_model = await self.models_repository.update(existing_model)
+        self.catalog_cache.invalidate()
+        if "name" in values:
+            await self._invalidate_vehicle_details()
+        if "name" in values or "synonyms" in values:
+            self.catalog_search_refresher.refresh(model_id=model_id)
 
         manufacturer = await self.manufacturers_repository.get_by_id(manufacturer_id)
 
         return VehicleModelMapper.to_model_response(updated_model, manufacturer)
+
+    async def _invalidate_vehicle_details(self) -> None:
+        # Cached vehicle details embed catalog names, a rename can touch vehicles of any auction on every worker
+        self.vehicle_detail_cache.invalidate_all()
+        await self.auction_events_repository.notify({"type": "catalog_updated"})
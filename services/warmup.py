@@ -0,0 +1,83 @@
+import asyncio
+import contextlib
+import time
+
+from contracts import AuctionsListQuery, AuctionVehiclesQuery
+from core.logging import logger
+from database.database import Database
+from services.auction_vehicles_service import AuctionVehiclesService
+from services.auctions_service import AuctionsService
+from services.catalog_cache import VehicleCatalogCache
+from services.vehicle_manufacturers_service import VehicleManufacturersService
+
+
+class StartupWarmup:
+    """
+    Warms a worker up before it reports ready.
+
+    Opens the pool connections, primes the catalog cache and runs the canonical auction list, vehicle list,
+    facet and catalog requests once per pool connection. That pays for connecting, asyncpg type introspection,
+    statement preparation and SQLAlchemy compilation before the load balancer sends the first request.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        auctions_service: AuctionsService,
+        auction_vehicles_service: AuctionVehiclesService,
+        vehicle_manufacturer_service: VehicleManufacturersService,
+        catalog_cache: VehicleCatalogCache,
+        connections: int,
+        enabled: bool,
+    ):
+        self.db = db
+        self.auctions_service = auctions_service
+        self.auction_vehicles_service = auction_vehicles_service
+        self.vehicle_manufacturer_service = vehicle_manufacturer_service
+        self.catalog_cache = catalog_cache
+        self.connections = connections
+        self.enabled = enabled
+        self._done = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_warm(self) -> bool:
+        return self._done.is_set()
+
+    async def start(self) -> None:
+        if not self.enabled:
+            self._done.set()
+        elif self._task is None:
+            self._task = asyncio.create_task(self._run(), name="startup-warmup")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+
+    async def _run(self) -> None:
+        start_time = time.perf_counter()
+        try:
+            await self.db.open_pool(self.connections)
+            await self.catalog_cache.get()
+            # Prepared statements are per connection. A round gathers several sessions, concurrent rounds would
+            # overflow the pool, so they run one after another: the pool hands out its least recently used
+            # connections first, and as many rounds as pool connections reach them all.
+            for _ in range(self.connections):
+                await self._run_canonical_requests()
+            logger.info("Warmed up in %.0fms", (time.perf_counter() - start_time) * 1000)
+        except Exception:
+            # A cold worker still serves requests correctly, the readiness check reports the database state
+            logger.exception("Warm-up failed, serving requests cold")
+        finally:
+            self._done.set()
+
+    async def _run_canonical_requests(self) -> None:
+        auctions = await self.auctions_service.get_newest_auctions(AuctionsListQuery())
+        await self.vehicle_manufacturer_service.get_manufacturers()
+        if auctions.items:
+            await self.auction_vehicles_service.get_auction_vehicles_list(auctions.items[0].id, AuctionVehiclesQuery())